@@ -0,0 +1,173 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""
+Benchmark decoding `get_nodes` results into DataFrames.
+
+Compares `pd.json_normalize` followed by renaming the attribute columns, as
+`QueryManager` used to do, with the columnar `ResultDecoder` and its numpy and
+pyarrow backends, each with inferred and schema dtypes. With `--columns`, the
+memory usage of each column is reported as well.
+
+Usage:
+    poetry run python benchmarks/decode_benchmark.py --nodes 100000 --columns
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from tigergraphx.config import GraphSchema
+from tigergraphx.core.result_decoder import ResultDecoder
+
+SCHEMA = GraphSchema.ensure_config(
+    {
+        "graph_name": "Social",
+        "nodes": {
+            "Person": {
+                "primary_key": "name",
+                "attributes": {
+                    "name": "STRING",
+                    "age": "INT",
+                    "score": "DOUBLE",
+                    "active": "BOOL",
+                    "joined": "DATETIME",
+                    "city": "STRING",
+                },
+            }
+        },
+        "edges": {},
+    }
+)
+
+
+def build_nodes(nodes: int) -> List[Dict[str, Any]]:
+    """
+    Build the printed vertices of a `get_nodes` query.
+    """
+    rng = random.Random(0)
+    cities = ["Berlin", "Paris", "Tokyo", "Lima", "Oslo"]
+    return [
+        {
+            "v_id": f"p{i}",
+            "v_type": "Person",
+            "attributes": {
+                "name": f"p{i}",
+                "age": rng.randrange(18, 90),
+                "score": rng.random(),
+                "active": rng.random() < 0.5,
+                "joined": f"2024-{rng.randrange(1, 13):02d}-01 00:00:00",
+                "city": rng.choice(cities),
+            },
+        }
+        for i in range(nodes)
+    ]
+
+
+def decode_with_json_normalize(nodes: List[Dict[str, Any]]) -> pd.DataFrame:
+    df = pd.DataFrame(pd.json_normalize(nodes))
+    df.rename(
+        columns={c: c.replace("attributes.", "") for c in df.columns}, inplace=True
+    )
+    return pd.DataFrame(df[list(df.columns)])
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """
+    Return the fastest of `repeat` runs in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+# The backend, dtypes and string dtype of each `ResultDecoder` mode
+MODES = [
+    ("numpy", "inferred", "object"),
+    ("numpy", "schema", "object"),
+    ("numpy", "schema", "pyarrow"),
+    ("pyarrow", "inferred", "object"),
+    ("pyarrow", "schema", "object"),
+]
+
+
+def run(nodes: int, repeat: int) -> List[Dict[str, Any]]:
+    """
+    Measure the decoding time and the memory usage of the result of each decoder.
+    """
+    vertices = build_nodes(nodes)
+    decoders: Dict[str, Callable[[], pd.DataFrame]] = {
+        "json_normalize": lambda: decode_with_json_normalize(vertices)
+    }
+    for backend, dtypes, string_dtype in MODES:
+        name = f"{backend}/{dtypes}" + ("/str[pa]" if string_dtype == "pyarrow" else "")
+        try:
+            decoder = ResultDecoder(
+                SCHEMA, backend, dtypes, string_dtype  # type: ignore[arg-type]
+            )
+        except ImportError:
+            print(f"Skipping '{name}': pyarrow is not installed.")
+            continue
+        decoders[name] = lambda decoder=decoder: decoder.decode_vertices(
+            vertices, ["Person"]
+        )
+
+    rows = []
+    for name, decode in decoders.items():
+        seconds = best_of(repeat, decode)
+        usage = decode().memory_usage(index=False, deep=True)
+        rows.append(
+            {
+                "decoder": name,
+                "ms": seconds * 1000,
+                "rows_per_s": nodes / seconds,
+                "mb": usage.sum() / 1e6,
+                "columns": usage / 1e6,
+            }
+        )
+    return rows
+
+
+def print_column_report(rows: List[Dict[str, Any]]):
+    """
+    Print the memory usage of each column in MB, one decoder per column.
+    """
+    report = pd.DataFrame({row["decoder"]: row["columns"] for row in rows})
+    print("\nMemory usage per column (MB)\n")
+    print(report.round(2).to_string())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--columns", action="store_true", help="Report the memory of each column."
+    )
+    args = parser.parse_args()
+
+    rows = run(args.nodes, args.repeat)
+    baseline = rows[0]
+    print(f"\n{args.nodes} nodes, best of {args.repeat} runs\n")
+    print(f"{'decoder':<26}{'ms':>10}{'rows/s':>12}{'speedup':>10}{'MB':>10}")
+    for row in rows:
+        print(
+            f"{row['decoder']:<26}{row['ms']:>10.1f}{row['rows_per_s']:>12.0f}"
+            f"{baseline['ms'] / row['ms']:>9.1f}x{row['mb']:>10.1f}"
+        )
+    if args.columns:
+        print_column_report(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""
+Benchmark the JSON codecs on embedding-heavy upsert payloads and query results.
+
+Usage:
+    poetry run python benchmarks/json_codec_benchmark.py --nodes 1000 --dimension 1536
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from tigergraphx.utils.json_codec import JSONCodec, get_json_codec
+
+
+def build_upsert_payload(nodes: int, dimension: int) -> Dict[str, Any]:
+    """
+    Build a REST++ upsert payload like `VectorManager.upsert` sends.
+    """
+    rng = random.Random(0)
+    return {
+        "vertices": {
+            "Document": {
+                f"doc_{i}": {
+                    "emb": {"value": [rng.uniform(-1, 1) for _ in range(dimension)]}
+                }
+                for i in range(nodes)
+            }
+        }
+    }
+
+
+def build_query_result(nodes: int, dimension: int) -> Dict[str, Any]:
+    """
+    Build a query response like the one returned by the `api_fetch` query.
+    """
+    rng = random.Random(1)
+    return {
+        "error": False,
+        "message": "",
+        "results": [
+            {
+                "Nodes": [
+                    {
+                        "v_id": f"doc_{i}",
+                        "v_type": "Document",
+                        "Embeddings": {
+                            "emb": [rng.uniform(-1, 1) for _ in range(dimension)]
+                        },
+                    }
+                    for i in range(nodes)
+                ]
+            }
+        ],
+    }
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """
+    Return the fastest of `repeat` runs in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(nodes: int, dimension: int, repeat: int) -> List[Dict[str, Any]]:
+    """
+    Measure encode and decode throughput for every installed codec.
+    """
+    codecs: List[JSONCodec] = []
+    for name in ("stdlib", "orjson", "msgspec"):
+        try:
+            codecs.append(get_json_codec(name))  # type: ignore[arg-type]
+        except ImportError:
+            print(f"Skipping '{name}': not installed.")
+
+    upsert_payload = build_upsert_payload(nodes, dimension)
+    query_body = get_json_codec("stdlib").encode(build_query_result(nodes, dimension))
+    floats = nodes * dimension
+
+    rows = []
+    for codec in codecs:
+        encode_seconds = best_of(repeat, lambda: codec.encode(upsert_payload))
+        decode_seconds = best_of(repeat, lambda: codec.decode(query_body))
+        rows.append(
+            {
+                "codec": codec.name,
+                "encode_ms": encode_seconds * 1000,
+                "encode_mb_per_s": len(codec.encode(upsert_payload))
+                / encode_seconds
+                / 1e6,
+                "encode_floats_per_s": floats / encode_seconds,
+                "decode_ms": decode_seconds * 1000,
+                "decode_mb_per_s": len(query_body) / decode_seconds / 1e6,
+            }
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = run(args.nodes, args.dimension, args.repeat)
+    baseline = rows[0]
+    print(
+        f"\n{args.nodes} nodes x {args.dimension} floats, best of {args.repeat} runs\n"
+    )
+    print(
+        f"{'codec':<10}{'encode ms':>12}{'MB/s':>10}{'speedup':>10}"
+        f"{'decode ms':>12}{'MB/s':>10}{'speedup':>10}"
+    )
+    for row in rows:
+        print(
+            f"{row['codec']:<10}"
+            f"{row['encode_ms']:>12.1f}{row['encode_mb_per_s']:>10.1f}"
+            f"{baseline['encode_ms'] / row['encode_ms']:>9.1f}x"
+            f"{row['decode_ms']:>12.1f}{row['decode_mb_per_s']:>10.1f}"
+            f"{baseline['decode_ms'] / row['decode_ms']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
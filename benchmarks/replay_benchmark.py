@@ -0,0 +1,105 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+"""
+Benchmark client-side overhead of an installed query by replaying a recording.
+
+Record the query once against a live server, configured by the usual TG_* environment
+variables, then replay it without any network I/O, e.g. in CI:
+
+Usage:
+    poetry run python benchmarks/replay_benchmark.py record --file query.jsonl.gz \\
+        --graph Social --query get_friends --params '{"limit": 1000}'
+    poetry run python benchmarks/replay_benchmark.py replay --file query.jsonl.gz \\
+        --graph Social --query get_friends --params '{"limit": 1000}' --repeat 20
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from tigergraphx.core.tigergraph_api import TigerGraphAPI
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+def run(
+    mode: str,
+    file: str,
+    graph: str,
+    query: str,
+    params: Dict[str, Any],
+    repeat: int,
+    latency: str,
+) -> List[Dict[str, float]]:
+    """
+    Run the query `repeat` times and time the request and the DataFrame conversion.
+    """
+    config = TigerGraphConnectionConfig(
+        transport_mode=mode,
+        transport_file=file,
+        replay_latency=latency if latency in ("none", "recorded") else float(latency),
+    )
+    api = TigerGraphAPI(config)
+    timings = []
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = api.run_installed_query(graph, query, params)
+            request_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            rows = sum(
+                len(pd.json_normalize(value))
+                for result in results or []
+                for value in result.values()
+                if isinstance(value, list)
+            )
+            dataframe_ms = (time.perf_counter() - start) * 1000
+            timings.append(
+                {"request_ms": request_ms, "dataframe_ms": dataframe_ms, "rows": rows}
+            )
+    finally:
+        api.close()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("--file", required=True)
+    parser.add_argument("--graph", required=True)
+    parser.add_argument("--query", required=True)
+    parser.add_argument("--params", default="{}")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--latency", default="none", help="none, recorded, or a number of seconds"
+    )
+    args = parser.parse_args()
+
+    repeat = 1 if args.mode == "record" else args.repeat
+    timings = run(
+        args.mode,
+        args.file,
+        args.graph,
+        args.query,
+        json.loads(args.params),
+        repeat,
+        args.latency,
+    )
+    if args.mode == "record":
+        print(f"\nRecorded {args.query} to {args.file}")
+        return
+    best = min(timings, key=lambda t: t["request_ms"] + t["dataframe_ms"])
+    print(f"\n{args.query}: {best['rows']:.0f} rows, best of {repeat} replays\n")
+    print(f"{'request + decode ms':>20}{'DataFrame ms':>15}")
+    print(f"{best['request_ms']:>20.2f}{best['dataframe_ms']:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
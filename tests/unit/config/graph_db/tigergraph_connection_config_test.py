@@ -125,3 +125,34 @@ class TestTigerGraphConnectionConfig:
         """
         with pytest.raises(ValidationError):
             TigerGraphConnectionConfig(host=invalid_url)
+
+    def test_default_pool_values(self):
+        """
+        Test the default HTTP connection pool settings.
+        """
+        config = TigerGraphConnectionConfig()
+        assert config.pool_connections == 10
+        assert config.pool_maxsize == 10
+        assert config.pool_block is False
+        assert config.tcp_keepalive is True
+        assert config.socket_options is None
+
+    def test_invalid_pool_size(self):
+        """
+        Test that a non-positive pool size raises a validation error.
+        """
+        with pytest.raises(ValidationError):
+            TigerGraphConnectionConfig(pool_maxsize=0)
+
+    def test_hosts_from_env(self, monkeypatch):
+        """
+        Test loading additional cluster hosts from the environment.
+        """
+        monkeypatch.setenv("TG_HOSTS", '["http://10.0.0.2", "http://10.0.0.3"]')
+        monkeypatch.setenv("TG_LOAD_BALANCING", "least_latency")
+        config = TigerGraphConnectionConfig()
+        assert [str(host) for host in config.hosts] == [
+            "http://10.0.0.2/",
+            "http://10.0.0.3/",
+        ]
+        assert config.load_balancing == "least_latency"
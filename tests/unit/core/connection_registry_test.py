@@ -0,0 +1,52 @@
+from tigergraphx.core.graph import Graph
+from tigergraphx.core.connection_registry import ConnectionRegistry, connection_registry
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestConnectionRegistry:
+    schema = {
+        "graph_name": "SharedGraph",
+        "nodes": {"Person": {"primary_key": "name", "attributes": {"name": "STRING"}}},
+        "edges": {},
+    }
+
+    def test_acquire_and_release(self):
+        """Test that equal configs share a transport that closes after the last use."""
+        registry = ConnectionRegistry()
+        config = TigerGraphConnectionConfig(host="http://10.0.0.1")
+
+        first = registry.acquire(config)
+        second = registry.acquire(TigerGraphConnectionConfig(host="http://10.0.0.1"))
+        other = registry.acquire(TigerGraphConnectionConfig(host="http://10.0.0.2"))
+        assert first is second
+        assert first is not other
+        assert registry.get_connection(config, "G1") is registry.get_connection(
+            config, "G1"
+        )
+        assert registry.get_stats() == {
+            "transports": 2,
+            "references": 3,
+            "connections": 1,
+        }
+
+        registry.release(config)
+        assert registry.get_stats()["transports"] == 2
+        registry.release(config)
+        assert registry.get_stats()["transports"] == 1
+        assert registry.acquire(config) is not first
+
+    def test_graphs_share_transport(self):
+        """Test that graphs reuse one transport and release it on close."""
+        config = TigerGraphConnectionConfig(host="http://10.0.0.3")
+        before = connection_registry.get_stats()["transports"]
+
+        with Graph(self.schema, config, mode="lazy") as first:
+            second = Graph(self.schema, config, mode="lazy")
+            assert first._context.tigergraph_api is second._context.tigergraph_api
+            assert first._context.connection is second._context.connection
+            assert connection_registry.get_stats()["transports"] == before + 1
+            second.close()
+            second.close()
+            assert connection_registry.get_stats()["transports"] == before + 1
+
+        assert connection_registry.get_stats()["transports"] == before
@@ -11,9 +11,14 @@ class TestEdgeManager:
         self.mock_connection.upsertEdge = MagicMock()
         self.mock_connection.getEdgeCountFrom = MagicMock()
         self.mock_connection.getEdges = MagicMock()
+        self.mock_tigergraph_api = MagicMock()
 
         mock_context = MagicMock()
         mock_context.connection = self.mock_connection
+        mock_context.tigergraph_api = self.mock_tigergraph_api
+        mock_context.graph_schema.graph_name = "MyGraph"
+        self.mock_result_cache = MagicMock()
+        mock_context.result_cache = self.mock_result_cache
         self.edge_manager = EdgeManager(mock_context)
 
     def test_add_edges_from_valid_data(self):
@@ -26,21 +31,26 @@ class TestEdgeManager:
         edge_type = "transfer"
         tgt_node_type = "Entity"
 
-        self.mock_connection.upsertEdges.return_value = len(normalized_edges)
+        self.mock_tigergraph_api.upsert_edges.return_value = {
+            "accepted_vertices": 0,
+            "accepted_edges": len(normalized_edges),
+            "skipped_vertices": 0,
+            "skipped_edges": 0,
+        }
         result = self.edge_manager.add_edges_from(
             normalized_edges, src_node_type, edge_type, tgt_node_type
         )
 
-        self.mock_connection.upsertEdges.assert_called_once_with(
-            sourceVertexType=src_node_type,
-            edgeType=edge_type,
-            targetVertexType=tgt_node_type,
-            edges=normalized_edges,
+        self.mock_tigergraph_api.upsert_edges.assert_called_once_with(
+            "MyGraph", src_node_type, edge_type, tgt_node_type, normalized_edges
         )
         assert result == len(normalized_edges)
+        self.mock_result_cache.invalidate.assert_called_once_with(
+            ["Entity", "transfer", "Entity"]
+        )
 
     def test_add_edges_from_upsert_exception(self):
-        """Test that an exception in upsertEdges is handled correctly."""
+        """Test that an exception in upsert_edges is handled correctly."""
         normalized_edges = [
             ("1", "2", {"attr": "value"}),
             ("NodeA", "NodeB", {}),
@@ -49,16 +59,13 @@ class TestEdgeManager:
         edge_type = "transfer"
         tgt_node_type = "Entity"
 
-        self.mock_connection.upsertEdges.side_effect = Exception("Upsert error")
+        self.mock_tigergraph_api.upsert_edges.side_effect = Exception("Upsert error")
         result = self.edge_manager.add_edges_from(
             normalized_edges, src_node_type, edge_type, tgt_node_type
         )
 
-        self.mock_connection.upsertEdges.assert_called_once_with(
-            sourceVertexType=src_node_type,
-            edgeType=edge_type,
-            targetVertexType=tgt_node_type,
-            edges=normalized_edges,
+        self.mock_tigergraph_api.upsert_edges.assert_called_once_with(
+            "MyGraph", src_node_type, edge_type, tgt_node_type, normalized_edges
         )
         assert result is None
 
@@ -9,73 +9,93 @@ class TestNodeManager:
         """Set up a mock context and NodeManager for all tests."""
         # Mocking the connection and graph schema
         self.mock_connection = MagicMock()
+        self.mock_tigergraph_api = MagicMock()
         mock_context = MagicMock()
         mock_context.connection = self.mock_connection  # Use the mocked connection
+        mock_context.tigergraph_api = self.mock_tigergraph_api
+        self.mock_result_cache = MagicMock()
+        mock_context.result_cache = self.mock_result_cache
         self.mock_graph_schema = MagicMock()
+        self.mock_graph_schema.graph_name = "MyGraph"
         mock_context.graph_schema = self.mock_graph_schema
         self.node_manager = NodeManager(mock_context)
 
     def test_add_nodes_from_single_node(self):
         """Test adding a single node with common attributes."""
-        self.mock_connection.upsertVertices.return_value = 1
+        self.mock_tigergraph_api.upsert_vertices.return_value = {
+            "accepted_vertices": 1,
+            "accepted_edges": 0,
+            "skipped_vertices": 0,
+            "skipped_edges": 0,
+        }
         normalized_nodes = [("node1", {"size": 10})]
         result = self.node_manager.add_nodes_from(normalized_nodes, "MyNode")
         assert result == 1
-        self.mock_connection.upsertVertices.assert_called_once_with(
-            vertexType="MyNode",
-            vertices=normalized_nodes,
+        self.mock_tigergraph_api.upsert_vertices.assert_called_once_with(
+            "MyGraph", "MyNode", normalized_nodes
         )
 
     def test_add_nodes_from_multiple_nodes(self):
         """Test adding multiple nodes with individual and common attributes."""
-        self.mock_connection.upsertVertices.return_value = 2
+        self.mock_tigergraph_api.upsert_vertices.return_value = {
+            "accepted_vertices": 2,
+            "accepted_edges": 0,
+            "skipped_vertices": 0,
+            "skipped_edges": 0,
+        }
         normalized_nodes = [
             ("node1", {"color": "red", "size": 10}),
             ("node2", {"size": 10}),
         ]
         result = self.node_manager.add_nodes_from(normalized_nodes, "MyNode")
         assert result == 2
-        self.mock_connection.upsertVertices.assert_called_once_with(
-            vertexType="MyNode",
-            vertices=normalized_nodes,
+        self.mock_tigergraph_api.upsert_vertices.assert_called_once_with(
+            "MyGraph", "MyNode", normalized_nodes
         )
 
     def test_add_nodes_from_upsert_exception(self):
-        """Test that an exception in upsertVertices is handled correctly."""
-        self.mock_connection.upsertVertices.side_effect = Exception("Upsert error")
+        """Test that an exception in upsert_vertices is handled correctly."""
+        self.mock_tigergraph_api.upsert_vertices.side_effect = Exception("Upsert error")
         normalized_nodes = [("node1", {"size": 10})]
         result = self.node_manager.add_nodes_from(normalized_nodes, "MyNode")
         assert result is None
-        self.mock_connection.upsertVertices.assert_called_once_with(
-            vertexType="MyNode",
-            vertices=normalized_nodes,
+        self.mock_tigergraph_api.upsert_vertices.assert_called_once_with(
+            "MyGraph", "MyNode", normalized_nodes
         )
+        # The upsert may have been applied partially
+        self.mock_result_cache.invalidate.assert_called_once_with(["MyNode"])
 
     def test_remove_node_success(self):
         """Test that remove_node returns True when a node is successfully removed."""
         node_id = "node1"
         node_type = "Person"
-        self.mock_connection.delVerticesById.return_value = 1
+        self.mock_tigergraph_api.delete_vertices.return_value = 1
         result = self.node_manager.remove_node(node_id, node_type)
-        self.mock_connection.delVerticesById.assert_called_once_with(node_type, node_id)
+        self.mock_tigergraph_api.delete_vertices.assert_called_once_with(
+            "MyGraph", node_type, [node_id]
+        )
         assert result is True
 
     def test_remove_node_not_exists(self):
         """Test that remove_node returns False when the node does not exist."""
         node_id = "node2"
         node_type = "Person"
-        self.mock_connection.delVerticesById.return_value = 0
+        self.mock_tigergraph_api.delete_vertices.return_value = 0
         result = self.node_manager.remove_node(node_id, node_type)
-        self.mock_connection.delVerticesById.assert_called_once_with(node_type, node_id)
+        self.mock_tigergraph_api.delete_vertices.assert_called_once_with(
+            "MyGraph", node_type, [node_id]
+        )
         assert result is False
 
     def test_remove_node_exception(self):
         """Test that remove_node returns False when an exception occurs."""
         node_id = "node3"
         node_type = "Person"
-        self.mock_connection.delVerticesById.side_effect = Exception("Error")
+        self.mock_tigergraph_api.delete_vertices.side_effect = Exception("Error")
         result = self.node_manager.remove_node(node_id, node_type)
-        self.mock_connection.delVerticesById.assert_called_once_with(node_type, node_id)
+        self.mock_tigergraph_api.delete_vertices.assert_called_once_with(
+            "MyGraph", node_type, [node_id]
+        )
         assert result is False
 
     def test_has_node_exists(self):
@@ -124,39 +144,49 @@ class TestNodeManager:
         node_type = "Person"
         edge_types = "Friend"
 
-        self.mock_connection.runInterpretedQuery.return_value = [
+        self.mock_tigergraph_api.run_generated_query.return_value = [
             {"edges": ["edge1", "edge2"]}
         ]
 
         result = self.node_manager.get_node_edges(node_id, node_type, edge_types)
 
-        self.mock_connection.runInterpretedQuery.assert_called_once()
+        self.mock_tigergraph_api.run_generated_query.assert_called_once()
         assert result == ["edge1", "edge2"]
 
+    def test_get_node_edges_query_is_canonical(self):
+        """Test that equal edge type sets produce the same query text."""
+        queries = [
+            self.node_manager._create_gsql_get_node_edges("Person", edge_types)
+            for edge_types in (["Likes", "Friend"], ["Friend", "Likes"])
+        ]
+        assert queries[0] == queries[1]
+        assert "-(Friend|Likes:e)-" in queries[0]
+
     def test_get_node_edges_failure(self):
         node_id = "node2"
         node_type = "Person"
         edge_types = "Friend"
 
-        self.mock_connection.runInterpretedQuery.side_effect = Exception("Error")
+        self.mock_tigergraph_api.run_generated_query.side_effect = Exception("Error")
 
         result = self.node_manager.get_node_edges(node_id, node_type, edge_types)
 
-        self.mock_connection.runInterpretedQuery.assert_called_once()
+        self.mock_tigergraph_api.run_generated_query.assert_called_once()
         assert result == []
 
     def test_clear(self):
         """Test the clear method of NodeManager."""
         # Define mock behavior
         self.mock_graph_schema.nodes = {"Entity1": {}, "Entity2": {}}
-        self.mock_connection.delVertices = MagicMock()
 
         # Run the clear method
         self.node_manager.clear()
 
-        # Assert delVertices was called for each node type
-        self.mock_connection.delVertices.assert_any_call("Entity1")
-        self.mock_connection.delVertices.assert_any_call("Entity2")
+        # Assert delete_vertices was called for each node type
+        delete_vertices = self.mock_tigergraph_api.delete_vertices
+        delete_vertices.assert_any_call("MyGraph", "Entity1")
+        delete_vertices.assert_any_call("MyGraph", "Entity2")
 
-        # Check that delVertices was called exactly twice, once for each node type
-        assert self.mock_connection.delVertices.call_count == 2
+        # Check that delete_vertices was called exactly twice, once for each node type
+        assert delete_vertices.call_count == 2
+        self.mock_result_cache.invalidate.assert_called_once_with()
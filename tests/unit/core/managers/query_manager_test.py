@@ -1,18 +1,24 @@
 import pytest
 from typing import Optional, List, Set
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 import pandas as pd
 
-from tigergraphx.core.managers.query_manager import QueryManager
-from tigergraphx.config import NodeSpec, NeighborSpec
+from tigergraphx.core.managers.query_manager import (
+    BFSResult,
+    QueryManager,
+    _build_get_neighbors_query,
+)
+from tigergraphx.core.result_cache import ResultCache
+from tigergraphx.config import NodeSpec, NeighborSpec, TigerGraphConnectionConfig
 
 
 class TestQueryManager:
     @pytest.fixture(autouse=True)
     def setup(self):
         self.mock_connection = MagicMock()
-        self.mock_connection.runInstalledQuery = MagicMock()
         self.mock_connection.runInterpretedQuery = MagicMock()
+        self.mock_tigergraph_api = MagicMock()
+        self.mock_tigergraph_api.config = TigerGraphConnectionConfig()
 
         self.mock_graph_schema = MagicMock()
         self.mock_graph_schema.graph_name = "MyGraph"
@@ -24,28 +30,49 @@ class TestQueryManager:
         # we assume that our QueryManager uses context.connection internally
         mock_context.connection = self.mock_connection
         mock_context.graph_schema = self.mock_graph_schema
+        mock_context.tigergraph_api = self.mock_tigergraph_api
+        mock_context.result_cache = ResultCache()
         self.query_manager = QueryManager(mock_context)
 
     def test_run_query_success(self):
         query_name = "test_query"
         params = {"param1": "value1"}
-        self.mock_connection.runInstalledQuery.return_value = "result"
+        self.mock_tigergraph_api.run_installed_query.return_value = "result"
         result = self.query_manager.run_query(query_name, params)
-        self.mock_connection.runInstalledQuery.assert_called_once_with(
-            queryName=query_name, params=params
+        self.mock_tigergraph_api.run_installed_query.assert_called_once_with(
+            "MyGraph", query_name, params
         )
         assert result == "result"
 
     def test_run_query_error(self):
         query_name = "test_query"
         params = {"param1": "value1"}
-        self.mock_connection.runInstalledQuery.side_effect = Exception("Error")
+        self.mock_tigergraph_api.run_installed_query.side_effect = Exception("Error")
         result = self.query_manager.run_query(query_name, params)
-        self.mock_connection.runInstalledQuery.assert_called_once_with(
-            queryName=query_name, params=params
+        self.mock_tigergraph_api.run_installed_query.assert_called_once_with(
+            "MyGraph", query_name, params
         )
         assert result is None
 
+    def test_run_queries(self):
+        error = RuntimeError("Error")
+        self.mock_tigergraph_api.run_many.return_value = ["result", error]
+        results = self.query_manager.run_queries(
+            ["query_a", ("query_b", {"param1": "value1"})], max_workers=4
+        )
+        self.mock_tigergraph_api.run_many.assert_called_once_with(
+            [
+                {"graph_name": "MyGraph", "query_name": "query_a", "params": {}},
+                {
+                    "graph_name": "MyGraph",
+                    "query_name": "query_b",
+                    "params": {"param1": "value1"},
+                },
+            ],
+            max_workers=4,
+        )
+        assert results == ["result", error]
+
     def test_get_nodes_success(self):
         node_type = "Person"
         self.query_manager.get_nodes_from_spec = MagicMock(return_value="nodes_df")
@@ -61,7 +88,7 @@ class TestQueryManager:
             return_attributes=["name", "id"],
             limit=None,
         )
-        self.mock_connection.runInterpretedQuery.return_value = [
+        self.mock_tigergraph_api.run_generated_query.return_value = [
             {
                 "Nodes": [
                     {
@@ -87,7 +114,7 @@ class TestQueryManager:
             return_attributes=None,
             limit=None,
         )
-        self.mock_connection.runInterpretedQuery.return_value = [
+        self.mock_tigergraph_api.run_generated_query.return_value = [
             {
                 "Nodes": [
                     {
@@ -111,7 +138,7 @@ class TestQueryManager:
             return_attributes=None,
             limit=None,
         )
-        self.mock_connection.runInterpretedQuery.side_effect = Exception("Error")
+        self.mock_tigergraph_api.run_generated_query.side_effect = Exception("Error")
         df = self.query_manager.get_nodes_from_spec(spec)
         assert df.empty, "Expected df to be an empty DataFrame"
 
@@ -146,7 +173,7 @@ class TestQueryManager:
             limit=None,
         )
         # Prepare the mock return value from the connection.
-        self.mock_connection.runInterpretedQuery.return_value = [
+        self.mock_tigergraph_api.run_generated_query.return_value = [
             {
                 "Neighbors": [
                     {
@@ -167,7 +194,7 @@ class TestQueryManager:
         # Optionally, verify that aliases were used in constructing the underlying query.
         # (This requires that get_neighbors_from_spec exposes its generated query or that the connection mock captured it.)
         # For example:
-        # generated_query = self.mock_connection.runInterpretedQuery.call_args[0][0]
+        # generated_query = self.mock_tigergraph_api.run_generated_query.call_args[0][0]
         # assert "s" in generated_query and "e" in generated_query and "t" in generated_query
 
     def test_get_neighbors_from_spec_without_attributes_success(self):
@@ -184,7 +211,7 @@ class TestQueryManager:
             return_attributes=None,
             limit=None,
         )
-        self.mock_connection.runInterpretedQuery.return_value = [
+        self.mock_tigergraph_api.run_generated_query.return_value = [
             {
                 "Neighbors": [
                     {
@@ -201,6 +228,41 @@ class TestQueryManager:
         # When no return_attributes are defined, the DataFrame should still include valid columns.
         # Optionally check that some expected keys are in the DataFrame.
 
+    def test_get_neighbors_from_spec_cached(self):
+        self.query_manager._result_cache = ResultCache(max_bytes=10**6)
+        self.mock_tigergraph_api.run_generated_query.return_value = [
+            {"Neighbors": [{"v_id": "n2", "v_type": "Person", "attributes": {}}]}
+        ]
+        spec = NeighborSpec(
+            start_nodes=["node1", "node2"],
+            start_node_type="Person",
+            edge_type_set={"relationship"},
+            target_node_type_set={"Person"},
+        )
+        first = self.query_manager.get_neighbors_from_spec(spec)
+        second = self.query_manager.get_neighbors_from_spec(
+            spec.model_copy(update={"start_nodes": ["node2", "node1"]})
+        )
+        pd.testing.assert_frame_equal(first, second)
+        assert self.mock_tigergraph_api.run_generated_query.call_count == 1
+        assert self.query_manager.get_result_cache_stats()["hits"] == 1
+
+        # A write to a type that is not traversed keeps the result
+        self.query_manager._result_cache.invalidate(["Company"])
+        self.query_manager.get_neighbors_from_spec(spec)
+        assert self.mock_tigergraph_api.run_generated_query.call_count == 1
+
+        self.query_manager._result_cache.invalidate(["relationship"])
+        self.query_manager.get_neighbors_from_spec(spec)
+        assert self.mock_tigergraph_api.run_generated_query.call_count == 2
+
+    def test_get_neighbors_from_spec_failure_not_cached(self):
+        self.query_manager._result_cache = ResultCache(max_bytes=10**6)
+        self.mock_tigergraph_api.run_generated_query.side_effect = Exception("Error")
+        spec = NeighborSpec(start_nodes="node1", start_node_type="Person")
+        assert self.query_manager.get_neighbors_from_spec(spec).empty
+        assert self.query_manager.get_result_cache_stats()["entries"] == 0
+
     def test_get_neighbors_from_spec_failure(self):
         # Create a NeighborSpec with alias parameters.
         spec = NeighborSpec(
@@ -216,62 +278,152 @@ class TestQueryManager:
             limit=None,
         )
         # Simulate a failure from the connection's query execution.
-        self.mock_connection.runInterpretedQuery.side_effect = Exception("Error")
+        self.mock_tigergraph_api.run_generated_query.side_effect = Exception("Error")
         # The method should catch the exception and return None (or handle it gracefully).
         df = self.query_manager.get_neighbors_from_spec(spec)
         assert df.empty, "Expected df to be an empty DataFrame"
 
-    def test_bfs_single_level(self):
-        self.query_manager.get_neighbors = MagicMock(
-            return_value=pd.DataFrame(
-                {"id": ["Bob", "Charlie"], "age": [30, 25], "gender": ["M", "M"]}
-            )
+    def test_get_neighbors_from_spec_chunked(self):
+        self.mock_tigergraph_api.config = TigerGraphConnectionConfig(
+            max_query_string_length=256
+        )
+        spec = NeighborSpec(
+            start_nodes=[f"node{i}" for i in range(100)],
+            start_node_type="Person",
+            limit=3,
         )
 
-        df = self.query_manager.bfs(start_nodes="Alice", node_type="Person", max_hops=1)
+        def neighbor(v_id):
+            return {"v_id": v_id, "v_type": "Person", "attributes": {"id": v_id}}
 
-        assert not df.empty
-        assert set(df["id"]) == {"Bob", "Charlie"}
+        self.mock_tigergraph_api.run_many.side_effect = lambda jobs: [
+            [{"Neighbors": [neighbor("shared"), neighbor(f"n{i}")]}]
+            for i in range(len(jobs))
+        ]
+        df = self.query_manager.get_neighbors_from_spec(spec)
 
-    def test_bfs_multi_level(self):
-        bfs_results = [
-            pd.DataFrame(
-                {"id": ["Bob", "Charlie"], "age": [30, 25], "gender": ["M", "M"]}
-            ),
-            pd.DataFrame({"id": ["David"], "age": [35], "gender": ["M"]}),
+        jobs = self.mock_tigergraph_api.run_many.call_args[0][0]
+        assert len(jobs) > 1
+        assert all(len(job["params"]) <= 256 for job in jobs)
+        assert list(df["id"]) == ["shared", "n0", "n1"]
+
+    def test_encode_vertex_set_parameter(self):
+        vertex_ids = [f"id {i}&x" for i in range(1000)]
+        chunks = QueryManager._encode_vertex_set_parameter("start_nodes", vertex_ids, 500)
+        assert all(len(chunk) <= 500 for chunk in chunks)
+        decoded = [
+            item.split("=", 1)[1] for chunk in chunks for item in chunk.split("&")
+        ]
+        assert decoded == [f"id%20{i}%26x" for i in range(1000)]
+        assert QueryManager._encode_vertex_set_parameter("start_nodes", ["a"], 500) == [
+            "start_nodes=a"
         ]
 
-        self.query_manager.get_neighbors = MagicMock(side_effect=bfs_results)
+    @staticmethod
+    def make_bfs_result(level: int, ids: List[str]):
+        return [
+            {
+                "Result": [
+                    {
+                        "v_id": node_id,
+                        "v_type": "Person",
+                        "attributes": {
+                            "id": node_id,
+                            "@tgx_visited": True,
+                            "@tgx_level": level,
+                        },
+                    }
+                    for node_id in ids
+                ]
+            }
+        ]
 
-        df = self.query_manager.bfs(start_nodes="Alice", node_type="Person", max_hops=2)
+    def test_bfs_single_query(self):
+        self.mock_tigergraph_api.run_generated_query.return_value = (
+            self.make_bfs_result(2, ["David"])
+        )
 
-        assert not df.empty
-        assert set(df["id"]) == {"David"}
+        df = self.query_manager.bfs(
+            start_nodes=["Alice", "Ed"],
+            node_type="Person",
+            edge_type_set={"Likes", "Knows"},
+            max_hops=2,
+        )
 
-    def test_bfs_respects_max_hops(self):
-        bfs_results = [
-            pd.DataFrame(
-                {"id": ["Bob", "Charlie"], "age": [30, 25], "gender": ["M", "M"]}
-            ),
-            pd.DataFrame({"id": ["David"], "age": [35], "gender": ["M"]}),
-            pd.DataFrame({"id": ["Eve"], "age": [28], "gender": ["F"]}),
-        ]
+        assert list(df.columns) == ["id", "_bfs_level"]
+        assert list(df["id"]) == ["David"]
+        assert list(df["_bfs_level"]) == [2]
+        self.mock_tigergraph_api.run_generated_query.assert_called_once()
+        query, params = self.mock_tigergraph_api.run_generated_query.call_args[0]
+        assert "SET<VERTEX<Person>> start_nodes" in query
+        assert "WHILE Frontier.size() > 0" in query
+        assert "FROM Frontier:s -((Knows|Likes):e)- Person:t" in query
+        assert "WHERE t.@tgx_visited == FALSE" in query
+        assert "LIMIT" not in query
+        assert params == "start_nodes=Alice&start_nodes=Ed&max_hops=2"
 
-        self.query_manager.get_neighbors = MagicMock(side_effect=bfs_results)
+    def test_bfs_without_max_hops(self):
+        self.mock_tigergraph_api.run_generated_query.return_value = (
+            self.make_bfs_result(4, ["Eve"])
+        )
 
-        df = self.query_manager.bfs(start_nodes="Alice", node_type="Person", max_hops=2)
+        df = self.query_manager.bfs(
+            start_nodes="Alice", node_type="Person", max_hops=None
+        )
 
-        assert not df.empty
-        assert set(df["id"]) == {"David"}
+        assert list(df["_bfs_level"]) == [4]
+        params = self.mock_tigergraph_api.run_generated_query.call_args[0][1]
+        assert params == "start_nodes=Alice&max_hops=0"
 
     def test_bfs_no_neighbors(self):
-        self.query_manager.get_neighbors = MagicMock(return_value=pd.DataFrame())
+        self.mock_tigergraph_api.run_generated_query.return_value = [{"Result": []}]
+
+        df = self.query_manager.bfs(start_nodes="Alice", node_type="Person", max_hops=3)
+
+        assert df.empty
+
+    def test_bfs_error(self):
+        self.mock_tigergraph_api.run_generated_query.side_effect = Exception("Error")
 
         df = self.query_manager.bfs(start_nodes="Alice", node_type="Person", max_hops=3)
 
         assert df.empty
 
-    def test_bfs_multiple_start_nodes(self):
+    def test_bfs_with_limit(self):
+        self.mock_tigergraph_api.run_generated_query.return_value = (
+            self.make_bfs_result(1, ["Bob", "Charlie"])
+        )
+
+        df = self.query_manager.bfs(
+            start_nodes="Alice", node_type="Person", limit=2, max_hops=1
+        )
+
+        assert len(df) == 2
+        query = self.mock_tigergraph_api.run_generated_query.call_args[0][0]
+        assert "      LIMIT 2\n" in query
+
+    def test_bfs_cached(self):
+        self.query_manager._result_cache = ResultCache(max_bytes=10**6)
+        self.mock_tigergraph_api.run_generated_query.return_value = (
+            self.make_bfs_result(1, ["Bob"])
+        )
+
+        for _ in range(2):
+            df = self.query_manager.bfs(
+                start_nodes="Alice", node_type="Person", max_hops=1
+            )
+            assert list(df["id"]) == ["Bob"]
+        assert self.mock_tigergraph_api.run_generated_query.call_count == 1
+
+        self.query_manager._result_cache.invalidate(["Person"])
+        self.query_manager.bfs(start_nodes="Alice", node_type="Person", max_hops=1)
+        assert self.mock_tigergraph_api.run_generated_query.call_count == 2
+
+    def test_bfs_by_hops(self):
+        # Start nodes that do not fit into one query string are expanded per hop
+        self.mock_tigergraph_api.config = TigerGraphConnectionConfig(
+            max_query_string_length=256
+        )
         bfs_results = [
             pd.DataFrame(
                 {"id": ["Bob", "Charlie"], "age": [30, 25], "gender": ["M", "M"]}
@@ -280,27 +432,165 @@ class TestQueryManager:
             pd.DataFrame({"id": ["Eve"], "age": [28], "gender": ["F"]}),
         ]
         self.query_manager.get_neighbors = MagicMock(side_effect=bfs_results)
+        start_nodes = [f"node_{i}" for i in range(100)]
 
         df = self.query_manager.bfs(
-            start_nodes=["Alice", "Ed"], node_type="Person", max_hops=3
+            start_nodes=start_nodes, node_type="Person", max_hops=2
         )
 
-        assert not df.empty
-        assert set(df["id"]) == {"Eve"}
+        assert set(df["id"]) == {"David"}
+        assert list(df["_bfs_level"]) == [2]
+        assert self.query_manager.get_neighbors.call_count == 2
+        self.mock_tigergraph_api.run_generated_query.assert_not_called()
 
-    def test_bfs_with_limit(self):
+    def test_bfs_by_hops_stops_before_max_hops(self):
+        self.mock_tigergraph_api.config = TigerGraphConnectionConfig(
+            max_query_string_length=256
+        )
         self.query_manager.get_neighbors = MagicMock(
-            return_value=pd.DataFrame(
-                {"id": ["Bob", "Charlie"], "age": [30, 25], "gender": ["M", "M"]}
-            )
+            side_effect=[pd.DataFrame({"id": ["Bob"]}), pd.DataFrame()]
         )
+        start_nodes = [f"node_{i}" for i in range(100)]
 
         df = self.query_manager.bfs(
-            start_nodes="Alice", node_type="Person", limit=2, max_hops=1
+            start_nodes=start_nodes, node_type="Person", max_hops=3
         )
 
-        assert not df.empty
-        assert len(df) <= 2
+        assert df.empty
+
+    @staticmethod
+    def make_reached(rows):
+        return [
+            {
+                "v_id": node_id,
+                "v_type": "Person",
+                "attributes": {"level": level, "source": source, "parents": parents},
+            }
+            for node_id, level, source, parents in rows
+        ]
+
+    def test_multi_source_bfs(self):
+        # Alice - Bob - David - Eve, Ed - Charlie - David
+        self.mock_tigergraph_api.run_generated_query.return_value = [
+            {
+                "Reached": self.make_reached(
+                    [
+                        ("Alice", 0, "Alice", []),
+                        ("Ed", 0, "Ed", []),
+                        ("Bob", 1, "Alice", ["Alice"]),
+                        ("Charlie", 1, "Ed", ["Ed"]),
+                        ("David", 2, "Alice", ["Bob", "Charlie"]),
+                        ("Eve", 3, "Alice", ["David"]),
+                    ]
+                )
+            }
+        ]
+
+        result = self.query_manager.multi_source_bfs(
+            start_nodes=["Alice", "Ed"],
+            node_type="Person",
+            edge_type_set={"Knows"},
+            return_predecessors=True,
+        )
+
+        assert len(result) == 6
+        assert list(result.levels) == [0, 0, 1, 1, 2, 3]
+        assert result.levels.dtype == "int64"
+        assert list(result.node_ids[result.sources]) == [
+            "Alice",
+            "Ed",
+            "Alice",
+            "Ed",
+            "Alice",
+            "Alice",
+        ]
+        assert result.get_level(1) == ["Bob", "Charlie"]
+        assert result.predecessors is not None
+        assert result.predecessors.tolist() == [[0, 2], [1, 3], [2, 4], [3, 4], [4, 5]]
+        assert result.get_path("Eve") == ["Alice", "Bob", "David", "Eve"]
+        assert result.get_path("Ed") == ["Ed"]
+        df = result.to_dataframe()
+        assert list(df.columns) == ["v_id", "_bfs_level", "_bfs_source"]
+
+        query, params = self.mock_tigergraph_api.run_generated_query.call_args[0]
+        assert "SetAccum<VERTEX> @tgx_parents;" in query
+        assert "Reached = Reached UNION Frontier;" in query
+        assert params == "start_nodes=Alice&start_nodes=Ed&max_hops=0"
+
+    def test_multi_source_bfs_without_predecessors(self):
+        self.mock_tigergraph_api.run_generated_query.return_value = [
+            {"Reached": self.make_reached([("Alice", 0, "Alice", None)])}
+        ]
+
+        result = self.query_manager.multi_source_bfs(
+            start_nodes="Alice", node_type="Person", max_hops=2
+        )
+
+        assert result.predecessors is None
+        query, params = self.mock_tigergraph_api.run_generated_query.call_args[0]
+        assert "@tgx_parents" not in query
+        assert params == "start_nodes=Alice&max_hops=2"
+        with pytest.raises(ValueError):
+            result.get_path("Alice")
+
+    def test_multi_source_bfs_merges_chunks(self):
+        # Start nodes that do not fit into one query string are traversed per chunk
+        self.mock_tigergraph_api.config = TigerGraphConnectionConfig(
+            max_query_string_length=256
+        )
+        start_nodes = [f"node_{i}" for i in range(40)]
+        self.mock_tigergraph_api.run_many.return_value = [
+            [
+                {
+                    "Reached": self.make_reached(
+                        [
+                            ("node_0", 0, "node_0", []),
+                            ("Bob", 1, "node_0", ["node_0"]),
+                            ("David", 2, "node_0", ["Bob"]),
+                        ]
+                    )
+                }
+            ],
+            [
+                {
+                    "Reached": self.make_reached(
+                        [
+                            ("node_39", 0, "node_39", []),
+                            ("David", 1, "node_39", ["node_39"]),
+                            ("Bob", 2, "node_39", ["David"]),
+                        ]
+                    )
+                }
+            ],
+        ]
+
+        result = self.query_manager.multi_source_bfs(
+            start_nodes=start_nodes, node_type="Person", return_predecessors=True
+        )
+
+        assert list(result.node_ids) == ["node_0", "node_39", "Bob", "David"]
+        assert list(result.levels) == [0, 0, 1, 1]
+        assert list(result.node_ids[result.sources]) == [
+            "node_0",
+            "node_39",
+            "node_0",
+            "node_39",
+        ]
+        assert result.predecessors is not None
+        assert result.predecessors.tolist() == [[0, 2], [1, 3]]
+        assert len(self.mock_tigergraph_api.run_many.call_args[0][0]) > 1
+
+    def test_multi_source_bfs_error(self):
+        self.mock_tigergraph_api.run_generated_query.side_effect = Exception("Error")
+
+        result = self.query_manager.multi_source_bfs(
+            start_nodes="Alice", node_type="Person", return_predecessors=True
+        )
+
+        assert len(result) == 0
+        assert result.predecessors is not None
+        assert result.to_dataframe().empty
+        assert isinstance(result, BFSResult)
 
     # --- GSQL Query Creation Tests for get_nodes ---
     def create_gsql_get_nodes(
@@ -615,13 +905,158 @@ class TestQueryManager:
             target_node_type_set={"Person"},
             limit=10,
         )
-        expected_gsql_script_1 = (
+        expected_gsql_script = (
             "FROM Nodes:s -((relationship|reverse_relationship):e)- Person:t\n"
         )
-        expected_gsql_script_2 = (
-            "FROM Nodes:s -((reverse_relationship|relationship):e)- Person:t\n"
+        assert expected_gsql_script in actual_gsql_script
+
+    def test_create_gsql_get_neighbors_is_cached(self):
+        edge_types = ["r5", "r3", "r9", "r1", "r7"]
+        first = self.create_gsql_get_neighbors(
+            start_nodes=["Sam"],
+            start_node_type="Person",
+            edge_type_set=set(edge_types),
+            target_node_type_set={"Person", "Entity"},
+        )
+        hits = _build_get_neighbors_query.cache_info().hits
+        second = self.create_gsql_get_neighbors(
+            start_nodes=["Alex", "Kim"],
+            start_node_type="Person",
+            edge_type_set=set(reversed(edge_types)),
+            target_node_type_set={"Entity", "Person"},
+        )
+        assert second is first
+        assert _build_get_neighbors_query.cache_info().hits == hits + 1
+        assert "-((r1|r3|r5|r7|r9):e)- ((Entity|Person)):t" in first
+
+    def test_create_gsql_get_nodes_is_cached(self):
+        first = self.create_gsql_get_nodes(
+            node_type="Person", return_attributes=["id", "rank"], limit=5
         )
-        assert (
-            expected_gsql_script_1 in actual_gsql_script
-            or expected_gsql_script_2 in actual_gsql_script
+        second = self.create_gsql_get_nodes(
+            node_type="Person", return_attributes=["id", "rank"], limit=5
         )
+        reordered = self.create_gsql_get_nodes(
+            node_type="Person", return_attributes=["rank", "id"], limit=5
+        )
+        assert second is first
+        assert reordered != first
+
+    # --- Paginated iteration over nodes ---
+    @staticmethod
+    def make_page(vids: List[int]) -> List[dict]:
+        return [
+            {
+                "Nodes": [
+                    {
+                        "v_id": f"n{vid}",
+                        "v_type": "Person",
+                        "attributes": {"name": f"name {vid}", "@tgx_vid": vid},
+                    }
+                    for vid in vids
+                ]
+            }
+        ]
+
+    def test_iter_nodes(self):
+        self.mock_tigergraph_api.run_generated_query.side_effect = [
+            self.make_page([4, 9]),
+            self.make_page([12, 20]),
+            self.make_page([31]),
+        ]
+        iterator = self.query_manager.iter_nodes(
+            NodeSpec(node_type="Person", node_alias="s"), batch_size=2
+        )
+        batches = list(iterator)
+        assert [list(batch["v_id"]) for batch in batches] == [
+            ["n4", "n9"],
+            ["n12", "n20"],
+            ["n31"],
+        ]
+        assert list(batches[0].columns) == ["v_id", "v_type", "name"]
+        assert iterator.cursor == 31
+        params = [
+            call.args[1]
+            for call in self.mock_tigergraph_api.run_generated_query.call_args_list
+        ]
+        assert params == [
+            {"after_vid": -1, "batch_size": 2},
+            {"after_vid": 9, "batch_size": 2},
+            {"after_vid": 20, "batch_size": 2},
+        ]
+
+    def test_iter_nodes_resume(self):
+        self.mock_tigergraph_api.run_generated_query.side_effect = [
+            self.make_page([4, 9]),
+            Exception("Connection reset"),
+        ]
+        iterator = self.query_manager.iter_nodes(
+            NodeSpec(node_type="Person"), batch_size=2, output_format="records"
+        )
+        assert next(iterator) == [
+            {"v_id": "n4", "v_type": "Person", "name": "name 4"},
+            {"v_id": "n9", "v_type": "Person", "name": "name 9"},
+        ]
+        # A batch counts as consumed once the next one is requested
+        assert iterator.cursor == -1
+        with pytest.raises(Exception, match="Connection reset"):
+            next(iterator)
+        assert iterator.cursor == 9
+
+        self.mock_tigergraph_api.run_generated_query.side_effect = [
+            self.make_page([12]),
+        ]
+        resumed = self.query_manager.iter_nodes(
+            NodeSpec(node_type="Person"), batch_size=2, cursor=iterator.cursor
+        )
+        assert [list(batch["v_id"]) for batch in resumed] == [["n12"]]
+        self.mock_tigergraph_api.run_generated_query.assert_called_with(
+            ANY, {"after_vid": 9, "batch_size": 2}
+        )
+
+    def test_create_gsql_iter_nodes(self):
+        spec = NodeSpec(
+            node_type="Person",
+            node_alias="s",
+            filter_expression='s.name != "Alex"',
+            return_attributes=["name"],
+        )
+        expected_gsql_script = (
+            "INTERPRET QUERY(INT after_vid, INT batch_size) FOR GRAPH MyGraph {\n"
+            "  MaxAccum<INT> @tgx_vid;\n"
+            "  Nodes = {Person.*};\n"
+            "  Nodes =\n"
+            "    SELECT s\n"
+            "    FROM Nodes:s\n"
+            '    WHERE getvid(s) > after_vid AND (s.name != "Alex")\n'
+            "    POST-ACCUM s.@tgx_vid = getvid(s)\n"
+            "    ORDER BY s.@tgx_vid ASC\n"
+            "    LIMIT batch_size\n"
+            "  ;\n"
+            "  PRINT Nodes[\n"
+            "    Nodes.name AS name,\n"
+            "    Nodes.@tgx_vid AS tgx_vid\n"
+            "  ];\n"
+            "}"
+        )
+        assert self.query_manager._create_gsql_iter_nodes(spec) == expected_gsql_script
+
+    def test_iter_nodes_query_shape(self):
+        """Test that each page does its seek, sort and limit in a single SELECT."""
+        spec = NodeSpec(node_type="Person", node_alias="v")
+        gsql_script = self.query_manager._create_gsql_iter_nodes(spec)
+        assert gsql_script.count("SELECT") == 1
+        select_block = gsql_script[gsql_script.index("SELECT") :]
+        clauses = ["WHERE", "POST-ACCUM", "ORDER BY", "LIMIT"]
+        positions = [select_block.index(clause) for clause in clauses]
+        assert positions == sorted(positions)
+        assert "WHERE getvid(v) > after_vid\n" in select_block
+        assert "ORDER BY v.@tgx_vid ASC\n    LIMIT batch_size\n" in select_block
+        # The batch size and cursor are parameters, so every page reuses one query
+        self.query_manager._tigergraph_api.run_generated_query.return_value = [
+            {"Nodes": []}
+        ]
+        self.query_manager._get_node_batch(spec, 10, -1)
+        self.query_manager._get_node_batch(spec, 20, 5)
+        calls = self.query_manager._tigergraph_api.run_generated_query.call_args_list
+        assert calls[0].args[0] == calls[1].args[0] == gsql_script
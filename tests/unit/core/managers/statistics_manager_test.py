@@ -8,35 +8,37 @@ class TestStatisticsManager:
     def setup(self):
         self.mock_connection = MagicMock()
         self.mock_connection.runInstalledQuery = MagicMock()
+        self.mock_tigergraph_api = MagicMock()
         mock_context = MagicMock()
         mock_context.connection = self.mock_connection
+        mock_context.tigergraph_api = self.mock_tigergraph_api
         self.statistics_manager = StatisticsManager(mock_context)
 
     def test_degree_success(self):
         node_id = "node1"
         node_type = "Person"
         edge_types = "Friend"
-        self.mock_connection.runInterpretedQuery.return_value = [{"degree": 3}]
+        self.mock_tigergraph_api.run_generated_query.return_value = [{"degree": 3}]
         result = self.statistics_manager.degree(node_id, node_type, edge_types)
-        self.mock_connection.runInterpretedQuery.assert_called_once()
+        self.mock_tigergraph_api.run_generated_query.assert_called_once()
         assert result == 3
 
     def test_degree_no_result(self):
         node_id = "node2"
         node_type = "Person"
         edge_types = "Friend"
-        self.mock_connection.runInterpretedQuery.return_value = []
+        self.mock_tigergraph_api.run_generated_query.return_value = []
         result = self.statistics_manager.degree(node_id, node_type, edge_types)
-        self.mock_connection.runInterpretedQuery.assert_called_once()
+        self.mock_tigergraph_api.run_generated_query.assert_called_once()
         assert result == 0
 
     def test_degree_exception(self):
         node_id = "node3"
         node_type = "Person"
         edge_types = "Friend"
-        self.mock_connection.runInterpretedQuery.side_effect = Exception("Error")
+        self.mock_tigergraph_api.run_generated_query.side_effect = Exception("Error")
         result = self.statistics_manager.degree(node_id, node_type, edge_types)
-        self.mock_connection.runInterpretedQuery.assert_called_once()
+        self.mock_tigergraph_api.run_generated_query.assert_called_once()
         assert result == 0
 
     def test_number_of_nodes_single_type(self):
@@ -9,6 +9,8 @@ from tigergraphx.config import (
     DataType,
 )
 from tigergraphx.core.managers.vector_manager import VectorManager
+from tigergraphx.core.tigergraph_api import DataAPI
+from tigergraphx.utils.json_codec import get_json_codec
 
 
 class TestVectorManager:
@@ -19,6 +21,9 @@ class TestVectorManager:
 
         mock_context = MagicMock()
         mock_context.connection = self.mock_connection  # Use the mocked connection
+        self.mock_tigergraph_api = MagicMock()
+        mock_context.tigergraph_api = self.mock_tigergraph_api
+        mock_context.json_codec = get_json_codec("auto")
         mock_context.graph_schema = GraphSchema(
             graph_name="MyGraph",
             nodes={
@@ -55,28 +60,39 @@ class TestVectorManager:
         }
         node_type = "Account"
 
-        # Mock the upsertVertices call
-        self.mock_connection.upsertVertices.return_value = 1
+        # Mock the upsert_vertices call
+        self.mock_tigergraph_api.upsert_vertices.return_value = {
+            "accepted_vertices": 1,
+            "accepted_edges": 0,
+            "skipped_vertices": 0,
+            "skipped_edges": 0,
+        }
 
         result = self.vector_manager.upsert(data, node_type)
 
         # Assert that the result is as expected
         assert result == 1
-        self.mock_connection.upsertVertices.assert_called_once_with(
-            vertexType=node_type,
-            vertices=[
-                (
-                    "Scott",
-                    {
-                        "emb1": [
-                            -0.017733968794345856,
-                            -0.01019224338233471,
-                            -0.016571875661611557,
-                        ]
-                    },
-                )
-            ],
+        self.mock_tigergraph_api.upsert_vertices.assert_called_once()
+        graph_name, node_type, nodes = (
+            self.mock_tigergraph_api.upsert_vertices.call_args.args
         )
+        assert graph_name == "MyGraph"
+        payload = DataAPI.build_vertices_payload(node_type, nodes)
+        assert payload == {
+            "vertices": {
+                "Account": {
+                    "Scott": {
+                        "emb1": {
+                            "value": [
+                                -0.017733968794345856,
+                                -0.01019224338233471,
+                                -0.016571875661611557,
+                            ]
+                        }
+                    }
+                }
+            }
+        }
 
     def test_upsert_multiple_records(self):
         # Test case for multiple records upsert
@@ -100,38 +116,48 @@ class TestVectorManager:
         ]
         node_type = "Account"
 
-        # Mock the upsertVertices call
-        self.mock_connection.upsertVertices.return_value = {"status": "success"}
+        # Mock the upsert_vertices call
+        self.mock_tigergraph_api.upsert_vertices.return_value = {
+            "accepted_vertices": 2,
+            "accepted_edges": 0,
+            "skipped_vertices": 0,
+            "skipped_edges": 0,
+        }
 
         result = self.vector_manager.upsert(data, node_type)
 
         # Assert that the result is as expected
-        assert result == {"status": "success"}
-        self.mock_connection.upsertVertices.assert_called_once_with(
-            vertexType=node_type,
-            vertices=[
-                (
-                    "Scott",
-                    {
-                        "emb1": [
-                            -0.017733968794345856,
-                            -0.01019224338233471,
-                            -0.016571875661611557,
-                        ]
+        assert result == 2
+        self.mock_tigergraph_api.upsert_vertices.assert_called_once()
+        graph_name, node_type, nodes = (
+            self.mock_tigergraph_api.upsert_vertices.call_args.args
+        )
+        assert graph_name == "MyGraph"
+        payload = DataAPI.build_vertices_payload(node_type, nodes)
+        assert payload == {
+            "vertices": {
+                "Account": {
+                    "Scott": {
+                        "emb1": {
+                            "value": [
+                                -0.017733968794345856,
+                                -0.01019224338233471,
+                                -0.016571875661611557,
+                            ]
+                        }
                     },
-                ),
-                (
-                    "Jenny",
-                    {
-                        "emb1": [
-                            -0.019265105947852135,
-                            0.0004929182468913496,
-                            0.006711316294968128,
-                        ]
+                    "Jenny": {
+                        "emb1": {
+                            "value": [
+                                -0.019265105947852135,
+                                0.0004929182468913496,
+                                0.006711316294968128,
+                            ]
+                        }
                     },
-                ),
-            ],
-        )
+                }
+            }
+        }
 
     def test_upsert_node_type_not_found(self):
         # Test case when node type is not found in the graph schema
@@ -174,7 +200,7 @@ class TestVectorManager:
                 ]
             }
         ]
-        self.mock_connection.runInstalledQuery.return_value = mock_result
+        self.mock_tigergraph_api.run_installed_query.return_value = mock_result
 
         expected_embedding = [-0.003692443, 0.01049439, -0.004631793]
         result = self.vector_manager.fetch_node(node_id, vector_attribute_name, node_type)
@@ -188,7 +214,7 @@ class TestVectorManager:
         node_id = "Ed"
         node_type = "Account"
         vector_attribute_name = "emb1"
-        self.mock_connection.runInstalledQuery.return_value = [{"Nodes": []}]
+        self.mock_tigergraph_api.run_installed_query.return_value = [{"Nodes": []}]
 
         result = self.vector_manager.fetch_node(node_id, vector_attribute_name, node_type)
         assert result is None
@@ -211,7 +237,7 @@ class TestVectorManager:
                 ]
             }
         ]
-        self.mock_connection.runInstalledQuery.return_value = mock_result
+        self.mock_tigergraph_api.run_installed_query.return_value = mock_result
 
         result = self.vector_manager.fetch_node(node_id, vector_attribute_name, node_type)
         assert result is None
@@ -238,7 +264,7 @@ class TestVectorManager:
                 ]
             }
         ]
-        self.mock_connection.runInstalledQuery.return_value = mock_result
+        self.mock_tigergraph_api.run_installed_query.return_value = mock_result
 
         expected_embeddings = {
             "Ed": [-0.003692443, 0.01049439, -0.004631793],
@@ -246,7 +272,12 @@ class TestVectorManager:
         }
         result = self.vector_manager.fetch_nodes(node_ids, vector_attribute_name, node_type)
         assert result == expected_embeddings
-
+        self.mock_tigergraph_api.run_installed_query.assert_called_once_with(
+            "MyGraph",
+            "api_fetch",
+            {"input": [(node_id, node_type) for node_id in node_ids]},
+            use_post=True,
+        )
 
     def test_fetch_nodes_partial_success(self):
         """
@@ -266,7 +297,7 @@ class TestVectorManager:
                 ]
             }
         ]
-        self.mock_connection.runInstalledQuery.return_value = mock_result
+        self.mock_tigergraph_api.run_installed_query.return_value = mock_result
 
         expected_embeddings = {
             "Ed": [-0.003692443, 0.01049439, -0.004631793],
@@ -282,7 +313,7 @@ class TestVectorManager:
         node_ids = ["Ed", "Scott"]
         node_type = "Account"
         vector_attribute_name = "emb1"
-        self.mock_connection.runInstalledQuery.return_value = None  # Invalid result
+        self.mock_tigergraph_api.run_installed_query.return_value = None  # Invalid result
 
         result = self.vector_manager.fetch_nodes(node_ids, vector_attribute_name, node_type)
         assert result == {}
@@ -295,7 +326,7 @@ class TestVectorManager:
         node_ids = ["Ed", "Scott"]
         node_type = "Account"
         vector_attribute_name = "emb1"
-        self.mock_connection.runInstalledQuery.return_value = [{"Nodes": []}]
+        self.mock_tigergraph_api.run_installed_query.return_value = [{"Nodes": []}]
 
         result = self.vector_manager.fetch_nodes(node_ids, vector_attribute_name, node_type)
         assert result == {}
@@ -318,7 +349,7 @@ class TestVectorManager:
                 ]
             }
         ]
-        self.mock_connection.runInstalledQuery.return_value = mock_result
+        self.mock_tigergraph_api.run_installed_query.return_value = mock_result
 
         result = self.vector_manager.fetch_nodes(node_ids, vector_attribute_name, node_type)
         assert result == {}
@@ -341,7 +372,7 @@ class TestVectorManager:
                 ]
             }
         ]
-        self.mock_connection.runInstalledQuery.return_value = mock_result
+        self.mock_tigergraph_api.run_installed_query.return_value = mock_result
 
         result = self.vector_manager.fetch_nodes(node_ids, vector_attribute_name, node_type)
         assert result == {}
@@ -360,7 +391,7 @@ class TestVectorManager:
         return_attributes = [["name"], ["number"]]
         limit = 2
 
-        def mock_run_installed_query(query_name, params, usePost=True):
+        def mock_run_installed_query(graph_name, query_name, params, use_post=False):
             if "emb1" in query_name:
                 return [
                     {"map_node_distance": {"Account1": 0.1, "Account2": 0.2}},
@@ -401,7 +432,7 @@ class TestVectorManager:
                 ]
             return []
 
-        self.mock_connection.runInstalledQuery.side_effect = mock_run_installed_query
+        self.mock_tigergraph_api.run_installed_query.side_effect = mock_run_installed_query
 
         result = self.vector_manager.search_multi_vector_attributes(
             data,
@@ -432,7 +463,7 @@ class TestVectorManager:
         return_attributes = None  # All attributes will be returned
         limit = 2
 
-        def mock_run_installed_query(query_name, params, usePost=True):
+        def mock_run_installed_query(graph_name, query_name, params, use_post=False):
             if "emb1" in query_name:
                 return [
                     {"map_node_distance": {"Account1": 0.1, "Account2": 0.2}},
@@ -473,7 +504,7 @@ class TestVectorManager:
                 ]
             return []
 
-        self.mock_connection.runInstalledQuery.side_effect = mock_run_installed_query
+        self.mock_tigergraph_api.run_installed_query.side_effect = mock_run_installed_query
 
         result = self.vector_manager.search_multi_vector_attributes(
             data,
@@ -542,7 +573,7 @@ class TestVectorManager:
         limit = 2
 
         # Mock the search result for both attributes to return no results
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {}},  # No matching nodes found
             {"Nodes": []},
         ]
@@ -569,7 +600,7 @@ class TestVectorManager:
         limit = 2
 
         # Mock run_installed_query to return None
-        self.mock_connection.runInstalledQuery.return_value = None
+        self.mock_tigergraph_api.run_installed_query.return_value = None
 
         result = self.vector_manager.search_multi_vector_attributes(
             data,
@@ -593,7 +624,7 @@ class TestVectorManager:
         limit = 2
 
         # Mock run_installed_query to return a list with missing keys
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"invalid_key": {}},
             {"Nodes": []},
         ]
@@ -623,7 +654,7 @@ class TestVectorManager:
         limit = 5
         return_attributes = ["name"]
 
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {"Account1": 0.1, "Account2": 0.2}},
             {
                 "Nodes": [
@@ -664,7 +695,7 @@ class TestVectorManager:
         limit = 3
         return_attributes = None  # All attributes will be returned
 
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {"Phone1": 0.05, "Phone2": 0.15, "Phone3": 0.25}},
             {
                 "Nodes": [
@@ -713,7 +744,7 @@ class TestVectorManager:
         limit = 2
         return_attributes = ["name"]
 
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {}},
             {"Nodes": []},
         ]
@@ -736,7 +767,7 @@ class TestVectorManager:
         return_attributes = ["number"]
 
         # Mock run_installed_query to return None
-        self.mock_connection.runInstalledQuery.return_value = None
+        self.mock_tigergraph_api.run_installed_query.return_value = None
 
         result = self.vector_manager.search(
             data, vector_attribute_name, node_type, limit, return_attributes
@@ -756,7 +787,7 @@ class TestVectorManager:
         return_attributes = ["name"]
 
         # Mock run_installed_query to return a list with missing keys
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"invalid_key": {}},
             {"Nodes": []},
         ]
@@ -779,7 +810,7 @@ class TestVectorManager:
         return_attributes = ["name"]
         candidate_ids = {"Account1", "Account3"}
 
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {"Account1": 0.1}},
             {
                 "Nodes": [
@@ -817,7 +848,7 @@ class TestVectorManager:
         limit = 2
         return_attributes = []  # Should return no attributes
 
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {"Phone1": 0.05, "Phone2": 0.15}},
             {
                 "Nodes": [
@@ -859,7 +890,7 @@ class TestVectorManager:
         return_attributes = [["name", 123]]  # Invalid attribute type
 
         # Assuming the method handles non-string attributes gracefully
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {"Account1": 0.1}},
             {
                 "Nodes": [
@@ -898,7 +929,7 @@ class TestVectorManager:
         limit = 2
         return_attributes = ["number"]
 
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {"Phone1": 0.05, "Phone2": 0.15}},
             {
                 "Nodes": [
@@ -938,7 +969,7 @@ class TestVectorManager:
         limit = 2
         return_attributes = ["name"]
 
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {"Account1": 0.1}},
             {
                 "Nodes": [
@@ -983,7 +1014,7 @@ class TestVectorManager:
         return_attributes = ["name"]
 
         # Mock run_installed_query to raise an exception
-        self.mock_connection.runInstalledQuery.side_effect = Exception("Database error")
+        self.mock_tigergraph_api.run_installed_query.side_effect = Exception("Database error")
 
         result = self.vector_manager.search(
             data,
@@ -1010,7 +1041,7 @@ class TestVectorManager:
         limit = 10
         return_attributes = ["name"]
 
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {"Account1": 0.1, "Account2": 0.2}},
             {
                 "Nodes": [
@@ -1049,7 +1080,7 @@ class TestVectorManager:
         limit = 0
         return_attributes = ["number"]
 
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {}},
             {"Nodes": []},
         ]
@@ -1093,7 +1124,7 @@ class TestVectorManager:
         return_attributes = ["name"]
 
         # Mock run_installed_query to return empty results as the vector attribute doesn't exist
-        self.mock_connection.runInstalledQuery.return_value = [
+        self.mock_tigergraph_api.run_installed_query.return_value = [
             {"map_node_distance": {}},
             {"Nodes": []},
         ]
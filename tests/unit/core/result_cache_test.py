@@ -0,0 +1,85 @@
+import pandas as pd
+
+from tigergraphx.core.result_cache import ANY_TYPE, ResultCache
+
+
+class TestResultCache:
+    @staticmethod
+    def make_df(rows: int) -> pd.DataFrame:
+        return pd.DataFrame({"id": [f"n{i}" for i in range(rows)], "value": range(rows)})
+
+    def test_disabled(self):
+        """Test that a cache without a byte budget stores nothing."""
+        cache = ResultCache()
+        cache.put("a", self.make_df(1), ["Person"])
+        assert cache.get("a") is None
+        assert cache.get_stats()["misses"] == 0
+
+    def test_get_returns_copy(self):
+        """Test that callers cannot change cached results."""
+        cache = ResultCache(max_bytes=10**6)
+        df = self.make_df(3)
+        cache.put("a", df, ["Person"])
+        df.loc[0, "id"] = "changed"
+        first = cache.get("a")
+        assert first is not None
+        first.loc[1, "id"] = "changed"
+        second = cache.get("a")
+        assert second is not None
+        assert list(second["id"]) == ["n0", "n1", "n2"]
+        assert cache.get_stats()["hits"] == 2
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache stays within its byte budget."""
+        size = int(self.make_df(10).memory_usage(index=True, deep=True).sum())
+        cache = ResultCache(max_bytes=2 * size)
+        cache.put("a", self.make_df(10), ["Person"])
+        cache.put("b", self.make_df(10), ["Person"])
+        assert cache.get("a") is not None
+        cache.put("c", self.make_df(10), ["Person"])
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        cache.put("too_large", self.make_df(100), ["Person"])
+        assert cache.get("too_large") is None
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 2 * size
+
+    def test_ttl(self, monkeypatch):
+        """Test that results expire after the TTL."""
+        now = [100.0]
+        monkeypatch.setattr("time.monotonic", lambda: now[0])
+        cache = ResultCache(max_bytes=10**6, ttl=5)
+        cache.put("a", self.make_df(1), ["Person"])
+        now[0] += 4
+        assert cache.get("a") is not None
+        now[0] += 1
+        assert cache.get("a") is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_invalidate(self):
+        """Test that writes drop the results of the written and of all types."""
+        cache = ResultCache(max_bytes=10**6)
+        cache.put("person", self.make_df(1), ["Person"])
+        cache.put("knows", self.make_df(1), ["Person", "knows", "Company"])
+        cache.put("company", self.make_df(1), ["Company"])
+        cache.put("any", self.make_df(1), [ANY_TYPE])
+        assert cache.invalidate(["knows"]) == 2
+        assert cache.get("person") is not None
+        assert cache.get("company") is not None
+        assert cache.get("knows") is None
+        assert cache.get("any") is None
+        assert cache.invalidate() == 2
+        assert cache.get_stats()["invalidations"] == 4
+
+    def test_put_after_invalidation(self):
+        """Test that a result read while a write was in progress is not stored."""
+        cache = ResultCache(max_bytes=10**6)
+        generation = cache.generation
+        cache.invalidate(["Person"])
+        cache.put("a", self.make_df(1), ["Person"], generation)
+        assert cache.get("a") is None
+        cache.put("a", self.make_df(1), ["Person"], cache.generation)
+        assert cache.get("a") is not None
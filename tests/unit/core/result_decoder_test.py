@@ -0,0 +1,200 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from tigergraphx.core.result_decoder import ResultDecoder
+from tigergraphx.config import GraphSchema
+
+
+class TestResultDecoder:
+    schema = GraphSchema.ensure_config(
+        {
+            "graph_name": "Social",
+            "nodes": {
+                "Person": {
+                    "primary_key": "name",
+                    "attributes": {
+                        "name": "STRING",
+                        "age": "INT",
+                        "score": "DOUBLE",
+                        "active": "BOOL",
+                        "joined": "DATETIME",
+                    },
+                },
+                "Company": {
+                    "primary_key": "name",
+                    "attributes": {"name": "STRING", "age": "STRING"},
+                },
+            },
+            "edges": {},
+        }
+    )
+
+    @staticmethod
+    def make_people(count: int):
+        return [
+            {
+                "v_id": f"p{i}",
+                "v_type": "Person",
+                "attributes": {
+                    "name": f"p{i}",
+                    "age": 20 + i,
+                    "score": float(i),
+                    "active": i % 2 == 0,
+                    "joined": "2024-01-01 00:00:00",
+                },
+            }
+            for i in range(count)
+        ]
+
+    def test_matches_json_normalize(self):
+        """Test that the decoder returns the same frame as json_normalize."""
+        people = self.make_people(3)
+        expected = pd.json_normalize(people)
+        expected.columns = [c.removeprefix("attributes.") for c in expected.columns]
+
+        df = ResultDecoder(self.schema).decode_vertices(people, ["Person"])
+        pd.testing.assert_frame_equal(df, expected)
+        assert df["age"].dtype == np.int64
+        assert df["active"].dtype == np.bool_
+
+    def test_columns(self):
+        """Test the order and selection of the attribute and vertex columns."""
+        df = ResultDecoder(self.schema).decode_vertices(
+            self.make_people(2),
+            ["Person"],
+            return_attributes=["score", "name"],
+            meta_columns=["v_type"],
+            meta_first=False,
+        )
+        assert list(df.columns) == [
+            "score",
+            "name",
+            "age",
+            "active",
+            "joined",
+            "v_type",
+        ]
+
+    def test_missing_values(self):
+        """Test that missing numeric values become NaN."""
+        people = self.make_people(2)
+        del people[1]["attributes"]["age"]
+        people[1]["attributes"]["active"] = None
+        df = ResultDecoder(self.schema).decode_vertices(people, ["Person"])
+        assert df["age"].dtype == np.float64
+        assert np.isnan(df["age"][1])
+        assert list(df["active"]) == [True, None]
+
+    def test_conflicting_types(self):
+        """Test that attributes typed differently across node types are inferred."""
+        company = {"v_id": "c", "v_type": "Company", "attributes": {"age": "old"}}
+        df = ResultDecoder(self.schema).decode_vertices(
+            self.make_people(1) + [company]
+        )
+        assert list(df["age"]) == [20, "old"]
+
+    def test_nested_attributes(self):
+        """Test that nested attributes fall back to json_normalize."""
+        people = self.make_people(1)
+        people[0]["attributes"]["@stats"] = {"degree": 3}
+        df = ResultDecoder(self.schema).decode_vertices(
+            people, ["Person"], meta_columns=[]
+        )
+        assert df.loc[0, "@stats.degree"] == 3
+        assert "v_id" not in df.columns
+
+    def test_pyarrow_backend(self):
+        """Test that the pyarrow backend returns Arrow-backed columns."""
+        pytest.importorskip("pyarrow")
+        df = ResultDecoder(self.schema, backend="pyarrow").decode_vertices(
+            self.make_people(2), ["Person"]
+        )
+        assert str(df["age"].dtype) == "int64[pyarrow]"
+        assert str(df["name"].dtype) == "string[pyarrow]"
+        assert str(df["v_id"].dtype) == "string[pyarrow]"
+        assert df["score"].sum() == 1.0
+
+    def test_schema_dtypes(self):
+        """Test that schema dtypes follow the attribute types."""
+        df = ResultDecoder(self.schema, dtypes="schema").decode_vertices(
+            self.make_people(2), ["Person"]
+        )
+        assert df["age"].dtype == np.int64
+        assert df["score"].dtype == np.float64
+        assert df["active"].dtype == np.bool_
+        assert df["joined"].dtype == "datetime64[ns]"
+        assert df.loc[0, "joined"] == pd.Timestamp("2024-01-01")
+        assert isinstance(df["v_type"].dtype, pd.CategoricalDtype)
+        assert df["name"].dtype == object
+
+    def test_schema_dtypes_missing_values(self):
+        """Test that missing values keep the schema type with nullable dtypes."""
+        people = self.make_people(3)
+        people[0]["attributes"]["age"] = None
+        del people[1]["attributes"]["active"]
+        people[2]["attributes"]["joined"] = "not a date"
+        df = ResultDecoder(self.schema, dtypes="schema").decode_vertices(
+            people, ["Person"]
+        )
+        assert str(df["age"].dtype) == "Int64"
+        assert df["age"].isna().tolist() == [True, False, False]
+        assert str(df["active"].dtype) == "boolean"
+        assert df["joined"].isna().tolist() == [False, False, True]
+
+    uint_schema = GraphSchema.ensure_config(
+        {
+            "graph_name": "G",
+            "nodes": {
+                "Item": {
+                    "primary_key": "id",
+                    "attributes": {"id": "STRING", "hash": "UINT"},
+                }
+            },
+            "edges": {},
+        }
+    )
+
+    @pytest.mark.parametrize(
+        "hashes",
+        [[2**64 - 1, 1], [2**63 - 1, 1], [2**63, -1], [2**64 - 1, None]],
+    )
+    def test_uint_matches_json_normalize(self, hashes):
+        """Test that UINT values at the int64 boundary match json_normalize."""
+        items = [
+            {"v_id": str(i), "v_type": "Item", "attributes": {"id": str(i), "hash": h}}
+            for i, h in enumerate(hashes)
+        ]
+        expected = pd.json_normalize(items)
+        expected.columns = [c.removeprefix("attributes.") for c in expected.columns]
+
+        df = ResultDecoder(self.uint_schema).decode_vertices(items, ["Item"])
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_schema_dtypes_uint(self):
+        """Test that UINT attributes beyond the int64 range are kept."""
+        schema = self.uint_schema
+        attributes = {"id": "a", "hash": 2**64 - 1}
+        items = [{"v_id": "a", "v_type": "Item", "attributes": attributes}]
+        df = ResultDecoder(schema, dtypes="schema").decode_vertices(items, ["Item"])
+        assert df["hash"].dtype == np.uint64
+        assert df.loc[0, "hash"] == 2**64 - 1
+
+    def test_pyarrow_strings(self):
+        """Test that string columns can be Arrow-backed with NumPy numbers."""
+        pytest.importorskip("pyarrow")
+        df = ResultDecoder(
+            self.schema, dtypes="schema", string_dtype="pyarrow"
+        ).decode_vertices(self.make_people(2), ["Person"])
+        assert str(df["name"].dtype) == "string[pyarrow]"
+        assert str(df["v_id"].dtype) == "string[pyarrow]"
+        assert df["age"].dtype == np.int64
+
+    def test_pyarrow_backend_schema_dtypes(self):
+        """Test that the pyarrow backend parses datetimes in schema mode."""
+        pytest.importorskip("pyarrow")
+        df = ResultDecoder(
+            self.schema, backend="pyarrow", dtypes="schema"
+        ).decode_vertices(self.make_people(2), ["Person"])
+        assert str(df["joined"].dtype) == "timestamp[s][pyarrow]"
+        assert isinstance(df["v_type"].dtype, pd.CategoricalDtype)
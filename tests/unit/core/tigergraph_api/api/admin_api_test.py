@@ -9,7 +9,8 @@ class TestSchemaAPI:
     @pytest.fixture
     def mock_config(self):
         """Fixture for TigerGraphConnectionConfig with mock values."""
-        return TigerGraphConnectionConfig()
+        # Mocked responses implement `json()`, which only the stdlib codec uses
+        return TigerGraphConnectionConfig(json_codec="stdlib")
 
     @pytest.fixture
     def mock_session(self):
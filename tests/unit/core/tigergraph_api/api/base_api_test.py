@@ -21,7 +21,8 @@ class TestBaseAPI:
     @pytest.fixture
     def mock_config(self):
         """Fixture for TigerGraphConnectionConfig with mock values."""
-        return TigerGraphConnectionConfig()
+        # Mocked responses implement `json()`, which only the stdlib codec uses
+        return TigerGraphConnectionConfig(json_codec="stdlib")
 
     @pytest.fixture
     def mock_session(self):
@@ -186,3 +187,18 @@ class TestBaseAPI:
             TigerGraphAPIError, match="Graph does not exist."
         ):
             base_api._request("get_schema", "4.x", graph="InvalidGraph")
+
+    def test_request_json_body_encoded_by_codec(self, base_api, mock_session):
+        """Test that JSON bodies are serialized by the configured codec."""
+        mock_response = MagicMock()
+        mock_response.text = "OK"
+        mock_response.headers = {"Content-Type": "text/plain"}
+        mock_response.status_code = 200
+        mock_session.request.return_value = mock_response
+
+        base_api._request("get_schema", "4.x", json={"emb": [0.5, 1.0]})
+
+        kwargs = mock_session.request.call_args.kwargs
+        assert kwargs["data"] == b'{"emb":[0.5,1.0]}'
+        assert kwargs["json"] is None
+        assert kwargs["headers"]["Content-Type"] == "application/json"
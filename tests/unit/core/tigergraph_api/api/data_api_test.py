@@ -0,0 +1,168 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from tigergraphx.core.tigergraph_api import DataAPI
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestDataAPI:
+    @pytest.fixture
+    def mock_config(self):
+        """Fixture for TigerGraphConnectionConfig with mock values."""
+        # Mocked responses implement `json()`, which only the stdlib codec uses
+        return TigerGraphConnectionConfig(json_codec="stdlib")
+
+    @pytest.fixture
+    def mock_session(self):
+        """Fixture for mocking a requests.Session object."""
+        return MagicMock()
+
+    @pytest.fixture
+    def mock_registry(self):
+        """Fixture for mocking an EndpointRegistry."""
+        mock_registry = MagicMock()
+        mock_registry.get_endpoint.return_value = {
+            "path": "/restpp/graph/MyGraph",
+            "method": "POST",
+            "port": "restpp_port",
+        }
+        return mock_registry
+
+    @pytest.fixture
+    def data_api(self, mock_config, mock_session, mock_registry):
+        """Fixture for initializing DataAPI with mocked dependencies."""
+        return DataAPI(
+            config=mock_config, endpoint_registry=mock_registry, session=mock_session
+        )
+
+    def mock_response(self, mock_session, body):
+        response = MagicMock()
+        response.json.return_value = body
+        response.headers = {"Content-Type": "application/json"}
+        response.status_code = 200
+        mock_session.request.return_value = response
+
+    def test_build_vertices_payload(self):
+        """Test that attributes are wrapped and (value, op) tuples set operators."""
+        payload = DataAPI.build_vertices_payload(
+            "Person", [(1, {"name": "Alice", "score": (5, "max")}), ("b", {})]
+        )
+        assert payload == {
+            "vertices": {
+                "Person": {
+                    "1": {
+                        "name": {"value": "Alice"},
+                        "score": {"value": 5, "op": "max"},
+                    },
+                    "b": {},
+                }
+            }
+        }
+
+    def test_build_edges_payload(self):
+        """Test that edges are nested by source and repeated pairs become lists."""
+        payload = DataAPI.build_edges_payload(
+            "Person",
+            "transfer",
+            "Account",
+            [
+                ("a", "x", {"amount": 1}),
+                ("a", "y", {}),
+                ("a", "x", {"amount": 2}),
+                ("b", "x", {}),
+            ],
+        )
+        assert payload == {
+            "edges": {
+                "Person": {
+                    "a": {
+                        "transfer": {
+                            "Account": {
+                                "x": [
+                                    {"amount": {"value": 1}},
+                                    {"amount": {"value": 2}},
+                                ],
+                                "y": {},
+                            }
+                        }
+                    },
+                    "b": {"transfer": {"Account": {"x": {}}}},
+                }
+            }
+        }
+
+    def test_upsert_graph_data(self, data_api, mock_session, mock_registry):
+        """Test that one request is sent and skipped counts are derived."""
+        self.mock_response(
+            mock_session,
+            {
+                "error": False,
+                "results": [{"accepted_vertices": 1, "accepted_edges": 2}],
+            },
+        )
+        payload = DataAPI.build_vertices_payload("Person", [("a", {}), ("b", {})])
+        payload.update(
+            DataAPI.build_edges_payload(
+                "Person",
+                "knows",
+                "Person",
+                [("a", "b", {}), ("b", "a", {}), ("a", "c", {})],
+            )
+        )
+
+        result = data_api.upsert_graph_data("MyGraph", payload, vertex_must_exist=True)
+
+        assert result == {
+            "accepted_vertices": 1,
+            "accepted_edges": 2,
+            "skipped_vertices": 1,
+            "skipped_edges": 1,
+        }
+        mock_registry.get_endpoint.assert_called_once_with(
+            "upsert_graph_data", "4.x", graph_name="MyGraph"
+        )
+        kwargs = mock_session.request.call_args.kwargs
+        assert kwargs["params"] == {"vertex_must_exist": "true"}
+        assert json.loads(kwargs["data"]) == payload
+
+    def test_upsert_graph_data_reported_skips(self, data_api, mock_session):
+        """Test that skipped counts reported by the server are used as is."""
+        self.mock_response(
+            mock_session,
+            {
+                "error": False,
+                "results": [
+                    {
+                        "accepted_vertices": 0,
+                        "accepted_edges": 0,
+                        "skipped_vertices": 0,
+                        "skipped_edges": 3,
+                    }
+                ],
+            },
+        )
+        result = data_api.upsert_graph_data("MyGraph", {"vertices": {}})
+        assert result["skipped_edges"] == 3
+        assert mock_session.request.call_args.kwargs["params"] is None
+
+    def test_delete_vertices(self, data_api, mock_session, mock_registry):
+        """Test deleting by ID, with escaped IDs, and deleting a whole type."""
+        self.mock_response(
+            mock_session,
+            {"error": False, "results": {"v_type": "Person", "deleted_vertices": 1}},
+        )
+        assert data_api.delete_vertices("MyGraph", "Person", ["a/b", "c"]) == 2
+        mock_registry.get_endpoint.assert_any_call(
+            "delete_vertex",
+            "4.x",
+            graph_name="MyGraph",
+            vertex_type="Person",
+            vertex_id="a%2Fb",
+        )
+
+        mock_registry.get_endpoint.reset_mock()
+        assert data_api.delete_vertices("MyGraph", "Person") == 1
+        mock_registry.get_endpoint.assert_called_once_with(
+            "delete_vertices", "4.x", graph_name="MyGraph", vertex_type="Person"
+        )
@@ -10,7 +10,8 @@ class TestQueryAPI:
     @pytest.fixture
     def mock_config(self):
         """Fixture for TigerGraphConnectionConfig with mock values."""
-        return TigerGraphConnectionConfig()
+        # Mocked responses implement `json()`, which only the stdlib codec uses
+        return TigerGraphConnectionConfig(json_codec="stdlib")
 
     @pytest.fixture
     def mock_session(self):
@@ -153,3 +154,107 @@ class TestQueryAPI:
             TigerGraphAPIError, match="Syntax error in query"
         ):
             query_api.run_interpreted_query(query)
+
+    # ------------------------------ Installed Query Tests ------------------------------
+    def test_convert_query_parameters_to_json(self, query_api):
+        """Test converting parameters into a JSON body for installed queries."""
+        params = {
+            "k": 10,
+            "query_vector": [0.1, 0.2],
+            "vertex": ("123", "Person"),
+            "vertices": [(1, "Person"), ("456", "Company")],
+            "candidates": [{"id": "789", "type": "Person"}],
+            "date": datetime(2024, 1, 1, 12, 0, 0),
+        }
+        result = query_api._convert_query_parameters_to_json(params)
+        assert result == {
+            "k": 10,
+            "query_vector": [0.1, 0.2],
+            "vertex": {"id": "123", "type": "Person"},
+            "vertices": [
+                {"id": "1", "type": "Person"},
+                {"id": "456", "type": "Company"},
+            ],
+            "candidates": [{"id": "789", "type": "Person"}],
+            "date": "2024-01-01 12:00:00",
+        }
+
+    def test_convert_query_parameters_to_json_invalid_tuple(self, query_api):
+        """Test that malformed vertex tuples raise ValueError."""
+        with pytest.raises(ValueError, match="expected \\(id, type\\)"):
+            query_api._convert_query_parameters_to_json({"vertex": ("123",)})
+
+    def test_run_installed_query_get(self, query_api, mock_session, mock_registry):
+        """Test running an installed query with URL parameters."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"error": False, "results": [{"n": 1}]}
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.status_code = 200
+        mock_session.request.return_value = mock_response
+
+        result = query_api.run_installed_query_get(
+            "MyGraph", "my_query", {"input": ("Alice", "Person")}
+        )
+
+        assert result == [{"n": 1}]
+        mock_registry.get_endpoint.assert_called_once_with(
+            "run_installed_query_get",
+            "4.x",
+            graph_name="MyGraph",
+            query_name="my_query",
+        )
+        kwargs = mock_session.request.call_args.kwargs
+        assert kwargs["params"] == {"input": "Alice", "input.type": "Person"}
+        assert kwargs["json"] is None
+
+    def test_run_installed_query_post(self, query_api, mock_session, mock_registry):
+        """Test running an installed query with a JSON body."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"error": False, "results": [{"n": 1}]}
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.status_code = 200
+        mock_session.request.return_value = mock_response
+
+        result = query_api.run_installed_query_post(
+            "MyGraph", "my_query", {"input": [("Alice", "Person")]}
+        )
+
+        assert result == [{"n": 1}]
+        assert mock_registry.get_endpoint.call_args.args[0] == "run_installed_query_post"
+        kwargs = mock_session.request.call_args.kwargs
+        assert kwargs["params"] is None
+        assert kwargs["data"] == b'{"input":[{"id":"Alice","type":"Person"}]}'
+
+    def test_needs_post_body(self, query_api):
+        """Test that only parameters beyond the query string limit need a body."""
+        assert not query_api.needs_post_body(None)
+        assert not query_api.needs_post_body({"k": "x" * 10000})
+        assert not query_api.needs_post_body({"input": [("Alice", "Person")]})
+        assert query_api.needs_post_body(
+            {"input": [(f"node{i}", "Person") for i in range(1000)]}
+        )
+
+    def test_run_interpreted_query_encoded_params(self, query_api, mock_session):
+        """Test that encoded query strings are sent unchanged."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"error": False, "results": [{"n": 1}]}
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.status_code = 200
+        mock_session.request.return_value = mock_response
+
+        query_api.run_interpreted_query("INTERPRET QUERY ...", "s=a&s=b")
+        assert mock_session.request.call_args.kwargs["params"] == "s=a&s=b"
+
+    def test_run_installed_query_tigergraph_error(self, query_api, mock_session):
+        """Test that installed query errors raise TigerGraphAPIError."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "error": True,
+            "message": "The query 'missing' does not exist.",
+        }
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.status_code = 404
+        mock_session.request.return_value = mock_response
+
+        with pytest.raises(TigerGraphAPIError, match="does not exist"):
+            query_api.run_installed_query_post("MyGraph", "missing")
@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import pytest
+from pydantic import HttpUrl
+from requests.exceptions import ConnectionError
+
+from tigergraphx.core.tigergraph_api import (
+    AsyncTigerGraphAPI,
+    EndpointRegistry,
+    TigerGraphAPIError,
+)
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestAsyncTigerGraphAPI:
+    @pytest.fixture
+    def config(self, stub_server):
+        """Fixture for a TigerGraphConnectionConfig pointing at the stub server."""
+        return TigerGraphConnectionConfig(
+            host=HttpUrl(stub_server.host),
+            gsql_port=stub_server.port,
+            restpp_port=stub_server.port,
+            username="tigergraph",
+            password="tigergraph",
+            retry_initial_wait=0.01,
+        )
+
+    @pytest.mark.asyncio
+    async def test_ping(self, stub_server, config):
+        """Test an async ping through the stub server."""
+        stub_server.add_route("GET", "/api/ping", {"error": False, "message": "pong"})
+        async with AsyncTigerGraphAPI(config) as api:
+            assert await api.ping() == "pong"
+        assert stub_server.requests[0]["headers"]["Authorization"].startswith("Basic ")
+
+    @pytest.mark.asyncio
+    async def test_gsql_and_get_schema(self, stub_server, config):
+        """Test text and JSON responses of the async GSQL and schema APIs."""
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/statements",
+            "Using graph 'MyGraph'\n",
+            content_type="text/plain",
+        )
+        stub_server.add_route(
+            "GET",
+            "/gsql/v1/schema/graphs/MyGraph",
+            {"error": False, "results": {"GraphName": "MyGraph"}},
+        )
+        async with AsyncTigerGraphAPI(config) as api:
+            assert await api.gsql("USE GRAPH MyGraph") == "Using graph 'MyGraph'"
+            assert await api.get_schema("MyGraph") == {"GraphName": "MyGraph"}
+        assert stub_server.requests[0]["body"] == b"USE GRAPH MyGraph"
+
+    @pytest.mark.asyncio
+    async def test_run_interpreted_query_with_params(self, stub_server, config):
+        """Test that query parameters are encoded like the sync QueryAPI."""
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": False, "results": [{"degree": 3}]},
+        )
+        async with AsyncTigerGraphAPI(config) as api:
+            result = await api.run_interpreted_query(
+                "INTERPRET QUERY(VERTEX<Person> input) { PRINT input; }",
+                {"input": ("Alice", "Person")},
+            )
+        assert result == [{"degree": 3}]
+        assert stub_server.requests[0]["query"] == "input=Alice&input.type=Person"
+
+    @pytest.mark.asyncio
+    async def test_tigergraph_error(self, stub_server, config):
+        """Test that TigerGraph error payloads raise TigerGraphAPIError."""
+        stub_server.add_route(
+            "GET",
+            "/gsql/v1/schema/graphs/Missing",
+            {"error": True, "message": "Graph does not exist."},
+            status=400,
+        )
+        async with AsyncTigerGraphAPI(config) as api:
+            with pytest.raises(TigerGraphAPIError, match="Graph does not exist."):
+                await api.get_schema("Missing")
+
+    @pytest.mark.asyncio
+    async def test_http_error(self, stub_server, config):
+        """Test that HTTP errors are converted like the sync client."""
+        stub_server.add_route(
+            "GET", "/api/ping", "Unavailable", status=503, content_type="text/plain"
+        )
+        async with AsyncTigerGraphAPI(config) as api:
+            with pytest.raises(RuntimeError, match="503 Service Unavailable"):
+                await api.ping()
+
+    @pytest.mark.asyncio
+    async def test_connection_error(self, config):
+        """Test that an unreachable server raises ConnectionError."""
+        config.gsql_port = 1
+        async with AsyncTigerGraphAPI(config) as api:
+            with pytest.raises(ConnectionError, match="Failed to connect"):
+                await api.ping()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_loop(self, stub_server, config):
+        """Test that many slow requests run concurrently on one event loop."""
+        stub_server.add_route(
+            "GET", "/api/ping", {"error": False, "message": "pong"}, delay=0.2
+        )
+        registry = EndpointRegistry(config=config)
+        async with AsyncTigerGraphAPI(config, endpoint_registry=registry) as api:
+            assert api.endpoint_registry is registry
+            start = time.perf_counter()
+            results = await asyncio.gather(*[api.ping() for _ in range(10)])
+            elapsed = time.perf_counter() - start
+        assert results == ["pong"] * 10
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    async def test_run_installed_query(self, stub_server, config):
+        """Test installed queries with URL parameters and a JSON body."""
+        stub_server.add_route(
+            "GET", "/restpp/query/MyGraph/q", {"error": False, "results": [{"a": 1}]}
+        )
+        stub_server.add_route(
+            "POST", "/restpp/query/MyGraph/q", {"error": False, "results": [{"b": 2}]}
+        )
+        async with AsyncTigerGraphAPI(config) as api:
+            assert await api.run_installed_query("MyGraph", "q", {"k": 3}) == [{"a": 1}]
+            assert await api.run_installed_query(
+                "MyGraph", "q", {"v": [("A", "Person")]}, use_post=True
+            ) == [{"b": 2}]
+        assert stub_server.requests[0]["query"] == "k=3"
+        assert stub_server.requests[1]["body"] == b'{"v":[{"id":"A","type":"Person"}]}'
@@ -0,0 +1,85 @@
+import gzip
+import json
+import zlib
+import pytest
+from pydantic import HttpUrl
+
+from tigergraphx.core.tigergraph_api import TigerGraphAPI
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestCompression:
+    @pytest.fixture
+    def make_api(self, stub_server):
+        """Fixture for creating a TigerGraphAPI that points at the stub server."""
+        apis = []
+
+        def _make_api(**kwargs):
+            config = TigerGraphConnectionConfig(
+                host=HttpUrl(stub_server.host),
+                gsql_port=stub_server.port,
+                restpp_port=stub_server.port,
+                **kwargs,
+            )
+            api = TigerGraphAPI(config)
+            apis.append(api)
+            return api
+
+        yield _make_api
+        for api in apis:
+            api.close()
+
+    @pytest.fixture
+    def large_query(self):
+        floats = ", ".join(f"{i * 0.001:.6f}" for i in range(2000))
+        return f"INTERPRET QUERY() {{ PRINT [{floats}]; }}"
+
+    def test_request_body_gzip(self, stub_server, make_api, large_query):
+        """Test that large bodies are gzip-compressed when enabled."""
+        stub_server.add_route(
+            "POST", "/gsql/v1/queries/interpret", {"error": False, "results": [{}]}
+        )
+        make_api(request_compression=True).run_interpreted_query(large_query)
+
+        request = stub_server.requests[0]
+        assert request["headers"]["Content-Encoding"] == "gzip"
+        assert len(request["body"]) < len(large_query)
+        assert gzip.decompress(request["body"]).decode("utf-8") == large_query
+
+    def test_request_body_not_compressed(self, stub_server, make_api, large_query):
+        """Test that compression is opt-in and skipped for small bodies."""
+        stub_server.add_route(
+            "POST", "/gsql/v1/queries/interpret", {"error": False, "results": [{}]}
+        )
+        make_api().run_interpreted_query(large_query)
+        make_api(request_compression=True).run_interpreted_query("INTERPRET QUERY() {}")
+
+        for request in stub_server.requests:
+            assert "Content-Encoding" not in request["headers"]
+        assert stub_server.requests[0]["body"] == large_query.encode("utf-8")
+
+    def test_compress_body_deflate(self, make_api):
+        """Test that the deflate policy produces a zlib stream."""
+        api = make_api(request_compression=True, compression_min_size=0)
+        headers = {}
+        body = api._query_api._compress_body({"compression": "deflate"}, "abc", headers)
+        assert headers["Content-Encoding"] == "deflate"
+        assert zlib.decompress(body) == b"abc"
+
+    def test_compressed_response(self, stub_server, make_api):
+        """Test that gzip responses are advertised for and decoded transparently."""
+        payload = {"error": False, "results": {"GraphName": "MyGraph"}}
+        stub_server.add_route(
+            "GET",
+            "/gsql/v1/schema/graphs/MyGraph",
+            gzip.compress(json.dumps(payload).encode("utf-8")),
+            headers={"Content-Encoding": "gzip"},
+        )
+        assert make_api().get_schema("MyGraph") == {"GraphName": "MyGraph"}
+        assert "gzip" in stub_server.requests[0]["headers"]["Accept-Encoding"]
+
+    def test_disable_compressed_responses(self, stub_server, make_api):
+        """Test that responses can be requested uncompressed."""
+        stub_server.add_route("GET", "/api/ping", {"error": False, "message": "pong"})
+        make_api(accept_compressed_responses=False).ping()
+        assert stub_server.requests[0]["headers"]["Accept-Encoding"] == "identity"
@@ -0,0 +1,171 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class StubTigerGraphServer:
+    """
+    A local HTTP server that serves canned TigerGraph responses per (method, path).
+    """
+
+    def __init__(self, address: str = "127.0.0.1", port: int = 0):
+        self.address = address
+        self.routes: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._server = _StubHTTPServer((address, port), self._make_handler())
+        self._running = False
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    @property
+    def host(self) -> str:
+        return f"http://{self.address}"
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def add_route(
+        self,
+        method: str,
+        path: str,
+        body: Any,
+        status: int = 200,
+        content_type: str = "application/json",
+        delay: float = 0.0,
+        headers: Optional[Dict[str, str]] = None,
+        times: Optional[int] = None,
+    ) -> None:
+        """
+        Add a canned response. A response with `times` set is served that many times
+        before the next one added for the same route; otherwise it replaces them.
+        """
+        route = {
+            "body": body,
+            "status": status,
+            "content_type": content_type,
+            "delay": delay,
+            "headers": headers or {},
+            "times": times,
+        }
+        queue = self.routes.setdefault((method, path), [])
+        if queue and queue[-1]["times"] is None:
+            queue.pop()
+        queue.append(route)
+
+    def _next_route(self, method: str, path: str) -> Optional[Dict[str, Any]]:
+        queue = self.routes.get((method, path))
+        if not queue:
+            return None
+        route = queue[0]
+        if route["times"] is not None:
+            route["times"] -= 1
+            if route["times"] <= 0 and len(queue) > 1:
+                queue.pop(0)
+        return route
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        self._thread.start()
+        self._running = True
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._running = False
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length", 0) or 0)
+                payload = self.rfile.read(length) if length else b""
+                parts = urlsplit(self.path)
+                with stub._lock:
+                    stub.requests.append(
+                        {
+                            "method": self.command,
+                            "path": parts.path,
+                            "query": parts.query,
+                            "headers": dict(self.headers),
+                            "body": payload,
+                        }
+                    )
+                    route = stub._next_route(self.command, parts.path)
+                if route is None:
+                    route = {
+                        "body": {"error": True, "message": "Not found"},
+                        "status": 404,
+                        "content_type": "application/json",
+                        "delay": 0.0,
+                        "headers": {},
+                    }
+                if route["delay"]:
+                    time.sleep(route["delay"])
+                body = route["body"]
+                if callable(body):
+                    body = body(payload, parts.query)
+                if not isinstance(body, (bytes, str)):
+                    body = json.dumps(body)
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                self.send_response(route["status"])
+                self.send_header("Content-Type", route["content_type"])
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in route["headers"].items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def stub_server():
+    """Fixture for a local stub TigerGraph HTTP server."""
+    server = StubTigerGraphServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def stub_cluster():
+    """Fixture for three stub servers on different loopback addresses, same port."""
+    first = StubTigerGraphServer()
+    servers = [first] + [
+        StubTigerGraphServer(address=f"127.0.0.{i}", port=first.port) for i in (2, 3)
+    ]
+    for server in servers:
+        server.start()
+    yield servers
+    for server in servers:
+        if server.running:
+            server.stop()
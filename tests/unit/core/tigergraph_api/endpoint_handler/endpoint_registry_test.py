@@ -1,3 +1,4 @@
+import os
 import pytest
 import yaml
 from pathlib import Path
@@ -101,3 +102,115 @@ class TestEndpointRegistry:
             match="Port not defined for version '4.x' in endpoint 'set_schema'.",
         ):
             registry.get_endpoint("set_schema", version="4.x", graph="MyGraph")
+
+    def test_compression_policy(self, mock_config, create_temp_yaml):
+        """Test that compression defaults and version-specific policies resolve."""
+        yaml_content = {
+            "endpoints": {
+                "ping": {"path": "/api/ping"},
+                "run_query": {
+                    "path": "/query/{graph_name}",
+                    "compression": {"3.x": "deflate", "4.x": "gzip"},
+                },
+            },
+            "defaults": {"compression": "none"},
+        }
+        yaml_file = create_temp_yaml(yaml_content)
+        registry = EndpointRegistry(endpoint_path=Path(yaml_file), config=mock_config)
+
+        assert registry.get_endpoint("ping")["compression"] == "none"
+        assert (
+            registry.get_endpoint("run_query", "3.x", graph_name="G")["compression"]
+            == "deflate"
+        )
+        assert (
+            registry.get_endpoint("run_query", "4.x", graph_name="G")["compression"]
+            == "gzip"
+        )
+
+    def test_unsupported_compression(self, mock_config, create_temp_yaml):
+        """Test error raised for an unknown compression policy."""
+        yaml_content = {
+            "endpoints": {"ping": {"path": "/api/ping", "compression": "br"}},
+        }
+        yaml_file = create_temp_yaml(yaml_content)
+
+        with pytest.raises(
+            ValueError, match="Unsupported compression 'br' in endpoint 'ping'."
+        ):
+            EndpointRegistry(endpoint_path=Path(yaml_file), config=mock_config)
+
+    def test_idempotent_flag(self, mock_config, create_temp_yaml):
+        """Test that idempotent defaults to GET and can be overridden."""
+        yaml_content = {
+            "endpoints": {
+                "ping": {"path": "/api/ping"},
+                "gsql": {"path": "/gsql", "method": "POST"},
+                "interpret": {"path": "/interpret", "method": "POST", "idempotent": True},
+            },
+        }
+        yaml_file = create_temp_yaml(yaml_content)
+        registry = EndpointRegistry(endpoint_path=Path(yaml_file), config=mock_config)
+
+        assert registry.get_endpoint("ping")["idempotent"] is True
+        assert registry.get_endpoint("gsql")["idempotent"] is False
+        assert registry.get_endpoint("interpret")["idempotent"] is True
+
+    def test_limit_class(self, mock_config, create_temp_yaml):
+        """Test that limit_class falls back to the default class."""
+        yaml_content = {
+            "endpoints": {
+                "ping": {"path": "/api/ping"},
+                "gsql": {"path": "/gsql", "method": "POST", "limit_class": "gsql"},
+            },
+        }
+        yaml_file = create_temp_yaml(yaml_content)
+        registry = EndpointRegistry(endpoint_path=Path(yaml_file), config=mock_config)
+
+        assert registry.get_endpoint("ping")["limit_class"] == "default"
+        assert registry.get_endpoint("gsql")["limit_class"] == "gsql"
+
+    def test_definitions_cached_per_process(self, mock_config):
+        """Test that the default definitions are parsed once and shared."""
+        first = EndpointRegistry(config=mock_config)
+        second = EndpointRegistry(
+            config=TigerGraphConnectionConfig(host="http://10.0.0.2", restpp_port=9000)
+        )
+        assert first.endpoints is second.endpoints
+        assert first.raw_config is second.raw_config
+
+    def test_edited_file_is_reparsed(self, mock_config, create_temp_yaml):
+        """Test that editing the definition file invalidates the cache."""
+        yaml_file = create_temp_yaml({"endpoints": {"ping": {"path": "/api/ping"}}})
+        registry = EndpointRegistry(endpoint_path=Path(yaml_file), config=mock_config)
+        assert registry.get_endpoint("ping")["path"] == "/api/ping"
+
+        yaml_file = create_temp_yaml({"endpoints": {"ping": {"path": "/api/v2/ping"}}})
+        stat = yaml_file.stat()
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        registry = EndpointRegistry(endpoint_path=Path(yaml_file), config=mock_config)
+        assert registry.get_endpoint("ping")["path"] == "/api/v2/ping"
+
+    def test_url_bound_to_config(self, create_temp_yaml):
+        """Test that URLs are prebuilt with the configured host and ports."""
+        yaml_content = {
+            "endpoints": {
+                "ping": {"path": "/api/ping"},
+                "run_query": {
+                    "path": "/query/{graph_name}/{query_name}",
+                    "port": "restpp_port",
+                },
+            },
+        }
+        yaml_file = create_temp_yaml(yaml_content)
+        config = TigerGraphConnectionConfig(
+            host="http://10.0.0.2/", gsql_port=14240, restpp_port=9000
+        )
+        registry = EndpointRegistry(endpoint_path=Path(yaml_file), config=config)
+
+        assert registry.get_endpoint("ping")["url"] == "http://10.0.0.2:14240/api/ping"
+        endpoint = registry.get_endpoint("run_query", graph_name="G", query_name="q")
+        assert endpoint["url"] == "http://10.0.0.2:9000/query/G/q"
+        assert endpoint["path"] == "/query/G/q"
+        with pytest.raises(ValueError, match="Endpoint 'missing' not found"):
+            registry.get_endpoint("missing")
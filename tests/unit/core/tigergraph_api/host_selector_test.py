@@ -0,0 +1,129 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from pydantic import HttpUrl
+
+from tigergraphx.core.tigergraph_api import HostSelector, TigerGraphAPI
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestHostSelector:
+    @pytest.fixture
+    def make_api(self, stub_cluster):
+        """Fixture for creating a TigerGraphAPI over the stub cluster."""
+        apis = []
+
+        def _make_api(**kwargs):
+            config = TigerGraphConnectionConfig(
+                host=HttpUrl(stub_cluster[0].host),
+                hosts=[HttpUrl(server.host) for server in stub_cluster[1:]],
+                gsql_port=stub_cluster[0].port,
+                restpp_port=stub_cluster[0].port,
+                **{"retry_initial_wait": 0.01, "retry_max_wait": 0.05, **kwargs},
+            )
+            api = TigerGraphAPI(config)
+            apis.append(api)
+            return api
+
+        yield _make_api
+        for api in apis:
+            api.close()
+
+    @pytest.fixture(autouse=True)
+    def add_routes(self, stub_cluster):
+        """Fixture for serving ping and GSQL from every stub server."""
+        for server in stub_cluster:
+            server.add_route("GET", "/api/ping", {"error": False, "message": "pong"})
+            server.add_route(
+                "POST",
+                "/gsql/v1/statements",
+                f"OK from {server.address}",
+                content_type="text/plain",
+            )
+
+    def test_round_robin(self, stub_cluster, make_api):
+        """Test that reads are spread evenly over all hosts."""
+        api = make_api()
+        for _ in range(6):
+            assert api.ping() == "pong"
+        assert [len(server.requests) for server in stub_cluster] == [2, 2, 2]
+
+    def test_sticky_gsql(self, stub_cluster, make_api):
+        """Test that GSQL statements stay on one host."""
+        api = make_api()
+        results = {api.gsql("ls") for _ in range(4)}
+        assert results == {"OK from 127.0.0.1"}
+
+    def test_failover(self, stub_cluster, make_api):
+        """Test that requests fail over from a stopped host and it stays out."""
+        api = make_api(health_check_interval=60)
+        stub_cluster[0].stop()
+
+        assert api.gsql("ls") == "OK from 127.0.0.2"
+        for _ in range(4):
+            assert api.ping() == "pong"
+        assert api.get_host_stats()[stub_cluster[0].host]["healthy"] is False
+        assert api.get_host_stats()[stub_cluster[1].host]["sticky"] is True
+        assert len(stub_cluster[1].requests) + len(stub_cluster[2].requests) == 5
+
+    def test_host_rejoins_after_ping(self, stub_cluster, make_api):
+        """Test that a failed host rejoins once it answers a ping."""
+        api = make_api(health_check_interval=0)
+        api.host_selector.mark_down(stub_cluster[2].host)
+        assert api.check_hosts() == {server.host: True for server in stub_cluster}
+
+        for _ in range(3):
+            api.ping()
+        # One health check ping and one request
+        assert len(stub_cluster[2].requests) == 2
+
+    def test_least_latency(self, stub_cluster, make_api):
+        """Test that least-latency selection prefers the fastest host."""
+        for server in stub_cluster[:2]:
+            server.add_route(
+                "GET", "/api/ping", {"error": False, "message": "pong"}, delay=0.05
+            )
+        api = make_api(load_balancing="least_latency")
+        for _ in range(10):
+            api.ping()
+        assert len(stub_cluster[2].requests) >= 8
+
+    def test_single_host(self):
+        """Test that a single host is always selected, even when marked down."""
+        selector = HostSelector(TigerGraphConnectionConfig())
+        selector.mark_down("http://127.0.0.1")
+        assert selector.select({"sticky": False}) == "http://127.0.0.1"
+
+    def test_single_probe_per_host(self):
+        """Test that concurrent requests ping a recovering host only once."""
+        pings = []
+        pinged = threading.Event()
+        release = threading.Event()
+
+        def ping(host):
+            pings.append(host)
+            pinged.set()
+            release.wait(5)
+
+        selector = HostSelector(
+            TigerGraphConnectionConfig(
+                host="http://127.0.0.1",
+                hosts=["http://127.0.0.2"],
+                health_check_interval=0,
+            ),
+            ping=ping,
+        )
+        selector.mark_down("http://127.0.0.1")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            probing = executor.submit(selector.select, {"sticky": False})
+            assert pinged.wait(5)
+            # Other requests skip the host while it is pinged
+            others = [
+                executor.submit(selector.select, {"sticky": False}) for _ in range(3)
+            ]
+            assert [f.result(timeout=5) for f in others] == ["http://127.0.0.2"] * 3
+            release.set()
+            probing.result(timeout=5)
+        assert pings == ["http://127.0.0.1"]
+        assert selector.get_host_stats()["http://127.0.0.1"]["healthy"] is True
+
@@ -0,0 +1,50 @@
+import socket
+from requests import Session
+
+from tigergraphx.core.tigergraph_api import TigerGraphAPI
+from tigergraphx.core.tigergraph_api.http_adapter import PooledHTTPAdapter
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestPooledHTTPAdapter:
+    def test_connections_are_reused(self, stub_server):
+        """Test that sequential requests reuse one pooled connection."""
+        stub_server.add_route("GET", "/api/ping", {"error": False, "message": "pong"})
+        adapter = PooledHTTPAdapter(pool_connections=2, pool_maxsize=4)
+        session = Session()
+        session.mount("http://", adapter)
+        url = f"{stub_server.host}:{stub_server.port}/api/ping"
+
+        for _ in range(3):
+            assert session.get(url).status_code == 200
+
+        stats = adapter.get_pool_stats()
+        assert stats["pools"] == 1
+        assert stats["requests"] == 3
+        assert stats["pool_misses"] == 1
+        assert stats["pool_hits"] == 2
+        session.close()
+
+    def test_build_socket_options(self):
+        """Test that keep-alive and extra socket options are appended."""
+        options = PooledHTTPAdapter.build_socket_options(
+            tcp_keepalive=True,
+            extra_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+        )
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert options[-1] == (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        options = PooledHTTPAdapter.build_socket_options(tcp_keepalive=False)
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in options
+
+    def test_tigergraph_api_mounts_pooled_adapter(self):
+        """Test that TigerGraphAPI mounts an adapter sized from the config."""
+        config = TigerGraphConnectionConfig(pool_connections=3, pool_maxsize=25)
+        api = TigerGraphAPI(config)
+
+        adapter = api.session.get_adapter("http://127.0.0.1:14240")
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 25
+        assert api.get_pool_stats()["requests"] == 0
+        api.close()
@@ -0,0 +1,96 @@
+import json
+import pytest
+
+from tigergraphx.core.tigergraph_api.json_stream import (
+    iter_batches,
+    iter_result_records,
+)
+
+
+def _chunks(document, size):
+    """Split a JSON document into byte chunks of the given size."""
+    data = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestIterResultRecords:
+    @pytest.fixture
+    def document(self):
+        return {
+            "version": {"edition": "enterprise", "api": "v2"},
+            "error": False,
+            "message": "",
+            "results": [
+                {"Nodes": [{"v_id": "1", "attributes": {"score": 12345.678}}]},
+                {
+                    "Other": [1, 2, 3],
+                    "Nodes": [
+                        {"v_id": "2", "attributes": {"name": "Zoë 東京"}},
+                        {"v_id": "3", "attributes": {"name": None}},
+                    ],
+                },
+            ],
+        }
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 64 * 1024])
+    def test_chunk_boundaries(self, document, size):
+        """Test that numbers and multibyte characters may span chunk boundaries."""
+        header = {}
+        records = list(iter_result_records(_chunks(document, size), "Nodes", None, header))
+        assert records == document["results"][0]["Nodes"] + document["results"][1]["Nodes"]
+        assert header == {
+            "version": {"edition": "enterprise", "api": "v2"},
+            "error": False,
+            "message": "",
+        }
+
+    def test_numbers_split_at_every_offset(self):
+        """Test that a number split before a fraction or exponent is not cut short."""
+        data = b'{"results": [{"Nodes": [1.5e3, -2.25]}]}'
+        for offset in range(1, len(data)):
+            chunks = [data[:offset], data[offset:]]
+            assert list(iter_result_records(chunks, "Nodes")) == [1500.0, -2.25]
+
+    def test_result_index(self, document):
+        """Test that only the selected result object is streamed."""
+        records = list(iter_result_records(_chunks(document, 5), "Nodes", 1))
+        assert [r["v_id"] for r in records] == ["2", "3"]
+
+    def test_missing_key_and_empty_results(self):
+        """Test documents without matching items."""
+        assert list(iter_result_records([b'{"results": []}'], "Nodes")) == []
+        assert list(iter_result_records([b'{"results": [{"Edges": [1]}]}'], "Nodes")) == []
+        assert list(iter_result_records([b"{}"], "Nodes")) == []
+
+    def test_records_are_yielded_lazily(self):
+        """Test that records are yielded before the whole body is consumed."""
+        consumed = []
+
+        def chunks():
+            for chunk in [b'{"results": [{"Nodes": [1, ', b"2, ", b"3]}]}"]:
+                consumed.append(chunk)
+                yield chunk
+
+        records = iter_result_records(chunks(), "Nodes")
+        assert next(records) == 1
+        assert len(consumed) == 1
+        assert list(records) == [2, 3]
+
+    def test_invalid_document(self):
+        """Test that a malformed document raises ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_result_records([b'{"results": [{"Nodes": [1, 2'], "Nodes"))
+        with pytest.raises(ValueError):
+            list(iter_result_records([b"[1, 2]"], "Nodes"))
+
+
+class TestIterBatches:
+    def test_batches(self):
+        """Test that items are grouped into batches of at most batch_size."""
+        assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(iter_batches([], 2)) == []
+
+    def test_invalid_batch_size(self):
+        """Test that a non-positive batch size raises ValueError."""
+        with pytest.raises(ValueError, match="batch_size"):
+            list(iter_batches([1], 0))
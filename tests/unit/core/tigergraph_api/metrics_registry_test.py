@@ -0,0 +1,143 @@
+import asyncio
+import pytest
+import requests
+from pydantic import HttpUrl
+
+from tigergraphx.core.tigergraph_api import (
+    AsyncTigerGraphAPI,
+    MetricsRegistry,
+    RequestContext,
+    RequestHook,
+    TigerGraphAPI,
+)
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, context):
+        self.events.append(("start", context.endpoint_name))
+
+    def on_response(self, context, response):
+        self.events.append(("response", context.endpoint_name, context.status_code))
+
+    def on_error(self, context, error):
+        self.events.append(("error", context.endpoint_name, type(error).__name__))
+
+
+class FailingHook(RequestHook):
+    def on_request_start(self, context):
+        raise ValueError("boom")
+
+
+class TestMetricsRegistry:
+    @pytest.fixture
+    def config(self, stub_server):
+        """Fixture for a config that points to the stub server with fast retries."""
+        return TigerGraphConnectionConfig(
+            host=HttpUrl(stub_server.host),
+            gsql_port=stub_server.port,
+            restpp_port=stub_server.port,
+            retry_initial_wait=0.01,
+            retry_max_wait=0.05,
+        )
+
+    def test_hooks_and_metrics(self, stub_server, config):
+        """Test that hooks are called and metrics record retries and status codes."""
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/statements",
+            "Unavailable",
+            status=503,
+            content_type="text/plain",
+            times=1,
+        )
+        stub_server.add_route(
+            "POST", "/gsql/v1/statements", "OK", content_type="text/plain"
+        )
+        hook = RecordingHook()
+        api = TigerGraphAPI(config, hooks=[FailingHook(), hook])
+        try:
+            assert api.gsql("ls") == "OK"
+        finally:
+            api.close()
+
+        assert hook.events == [("start", "gsql"), ("response", "gsql", 200)]
+        metrics = api.get_metrics()["gsql"]
+        assert metrics["requests"] == 1
+        assert metrics["retries"] == 1
+        assert metrics["status_codes"] == {200: 1}
+        assert metrics["request_bytes"] == len("ls")
+        assert metrics["response_bytes"] == len("OK")
+        assert metrics["latency_seconds"]["count"] == 1
+        assert metrics["latency_seconds"]["buckets"]["+Inf"] == 1
+
+    def test_error_hook(self, config):
+        """Test that connection failures reach on_error and the error counters."""
+        config = config.model_copy(update={"gsql_port": 1, "max_retries": 0})
+        hook = RecordingHook()
+        api = TigerGraphAPI(config)
+        api.add_hook(hook)
+        try:
+            with pytest.raises(requests.exceptions.ConnectionError):
+                api.gsql("ls")
+        finally:
+            api.close()
+
+        assert hook.events == [("start", "gsql"), ("error", "gsql", "ConnectionError")]
+        assert api.get_metrics()["gsql"]["errors"] == {"ConnectionError": 1}
+
+    def test_async_metrics(self, stub_server, config):
+        """Test that the async client records the same metrics."""
+        stub_server.add_route("GET", "/api/ping", {"error": False, "message": "pong"})
+
+        async def run():
+            async with AsyncTigerGraphAPI(config) as api:
+                await asyncio.gather(api.ping(), api.ping())
+                return api.get_metrics()
+
+        metrics = asyncio.run(run())
+        assert metrics["ping"]["requests"] == 2
+        assert metrics["ping"]["status_codes"] == {200: 2}
+
+    def test_to_prometheus(self):
+        """Test the Prometheus text exposition format."""
+        registry = MetricsRegistry(buckets=[0.1, 1.0])
+        for elapsed, status_code in [(0.05, 200), (0.5, 200), (2.0, 500)]:
+            context = RequestContext("run_interpreted_query", "POST", "", request_size=10)
+            context.attempts = 2
+            context.status_code = status_code
+            context.response_size = 100
+            context.elapsed = elapsed
+            registry.on_response(context, None)
+
+        text = registry.to_prometheus()
+        assert "# TYPE tigergraphx_request_duration_seconds histogram" in text
+        assert (
+            'tigergraphx_request_duration_seconds_bucket{endpoint="run_interpreted_query",le="0.1"} 1'
+            in text
+        )
+        assert (
+            'tigergraphx_request_duration_seconds_bucket{endpoint="run_interpreted_query",le="1.0"} 2'
+            in text
+        )
+        assert (
+            'tigergraphx_request_duration_seconds_bucket{endpoint="run_interpreted_query",le="+Inf"} 3'
+            in text
+        )
+        assert (
+            'tigergraphx_request_duration_seconds_count{endpoint="run_interpreted_query"} 3'
+            in text
+        )
+        assert (
+            'tigergraphx_requests_total{endpoint="run_interpreted_query",status_code="500"} 1'
+            in text
+        )
+        assert 'tigergraphx_request_retries_total{endpoint="run_interpreted_query"} 3' in text
+        assert 'tigergraphx_request_bytes_total{endpoint="run_interpreted_query"} 30' in text
+        assert 'tigergraphx_response_bytes_total{endpoint="run_interpreted_query"} 300' in text
+
+        registry.reset()
+        assert registry.to_dict() == {}
@@ -0,0 +1,305 @@
+import time
+import pytest
+from pydantic import HttpUrl
+
+from tigergraphx.core.tigergraph_api import TigerGraphAPI, TigerGraphAPIError
+from tigergraphx.core.tigergraph_api.query_catalog import QueryCatalog
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+QUERY = """
+INTERPRET QUERY(
+  SET<VERTEX<Person>> start_nodes
+) FOR GRAPH Social {
+  Nodes = {start_nodes};
+  Neighbors =
+    SELECT t
+    FROM Nodes:s -(Friend:e)- Person:t
+    WHERE t.name != "A \\"quoted\\" name"
+    LIMIT 10
+  ;
+  PRINT Neighbors;
+}"""
+
+
+class TestQueryCatalog:
+    def test_get_shape(self):
+        """Test that LIMIT values and string literals become parameters."""
+        shape = QueryCatalog.get_shape(QUERY)
+        assert shape is not None
+        assert shape.graph_name == "Social"
+        assert shape.name.startswith("tgx_")
+        assert shape.literals == {
+            "tgx_limit_0": "10",
+            "tgx_string_1": 'A "quoted" name',
+        }
+        assert shape.definition.startswith(
+            f"CREATE OR REPLACE QUERY {shape.name}(SET<VERTEX<Person>> start_nodes, "
+            "INT tgx_limit_0, STRING tgx_string_1) FOR GRAPH Social {"
+        )
+        assert "WHERE t.name != tgx_string_1" in shape.definition
+        assert "LIMIT tgx_limit_0" in shape.definition
+        assert shape.get_install_command().splitlines()[0] == "USE GRAPH Social"
+        assert shape.get_install_command().endswith(f"INSTALL QUERY {shape.name}")
+
+    def test_limit_inside_string(self):
+        """Test that a LIMIT inside a string literal stays part of the string."""
+        shape = QueryCatalog.get_shape(
+            QUERY.replace('"A \\"quoted\\" name"', '"LIMIT 5"')
+        )
+        assert shape is not None
+        assert shape.literals == {"tgx_limit_0": "10", "tgx_string_1": "LIMIT 5"}
+        assert "WHERE t.name != tgx_string_1" in shape.definition
+        assert "INT tgx_limit_0, STRING tgx_string_1)" in shape.definition
+
+    def test_shape_names(self):
+        """Test that only the query shape determines the installed query name."""
+        shape = QueryCatalog.get_shape(QUERY)
+        other_values = QueryCatalog.get_shape(
+            QUERY.replace("LIMIT 10", "LIMIT 20").replace("    ", "  ")
+        )
+        other_shape = QueryCatalog.get_shape(QUERY.replace("Friend", "Colleague"))
+        assert shape and other_values and other_shape
+        assert shape.name == other_values.name
+        assert shape.name != other_shape.name
+        assert QueryCatalog.get_shape("USE GRAPH Social") is None
+
+    def test_bind(self):
+        """Test that lifted literals are added to dict and encoded parameters."""
+        shape = QueryCatalog.get_shape(QUERY)
+        assert shape is not None
+        assert shape.bind({"start_nodes": ["a"]}) == {
+            "start_nodes": ["a"],
+            **shape.literals,
+        }
+        assert shape.bind("start_nodes=a") == (
+            "start_nodes=a&tgx_limit_0=10&tgx_string_1=A+%22quoted%22+name"
+        )
+
+    def test_count_call(self):
+        """Test that runs are counted per shape until the graph is cleared."""
+        catalog = QueryCatalog()
+        shape = QueryCatalog.get_shape(QUERY)
+        other_values = QueryCatalog.get_shape(QUERY.replace("LIMIT 10", "LIMIT 5"))
+        assert shape and other_values
+        assert catalog.count_call(shape) == 1
+        assert catalog.count_call(other_values) == 2
+        catalog.clear("Social")
+        assert catalog.count_call(shape) == 1
+
+
+class TestRunGeneratedQuery:
+    @pytest.fixture
+    def config(self, stub_server):
+        """Fixture for a config with auto-installed queries."""
+        return TigerGraphConnectionConfig(
+            host=HttpUrl(stub_server.host),
+            gsql_port=stub_server.port,
+            restpp_port=stub_server.port,
+            max_retries=0,
+            auto_install_queries=True,
+        )
+
+    def test_install_once(self, stub_server, config):
+        """Test that a shape is interpreted while it is installed in the background."""
+        shape = QueryCatalog.get_shape(QUERY)
+        assert shape is not None
+        path = f"/restpp/query/Social/{shape.name}"
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": False, "results": [{"n": 1}]},
+        )
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/statements",
+            "Query installation finished.",
+            content_type="text/plain",
+            delay=0.1,
+        )
+        stub_server.add_route("GET", path, {"error": False, "results": [{"n": 1}]})
+
+        api = TigerGraphAPI(config)
+        try:
+            assert api.run_generated_query(QUERY, "start_nodes=a") == [{"n": 1}]
+            assert api.query_catalog.get_state(shape) is None
+            TestQueryPromotion.wait_for_install(api, shape)
+            for _ in range(2):
+                assert api.run_generated_query(QUERY, "start_nodes=a") == [{"n": 1}]
+            assert api.get_installed_queries() == {"Social": [shape.name]}
+        finally:
+            api.close()
+
+        paths = [r["path"] for r in stub_server.requests]
+        assert paths.count("/gsql/v1/queries/interpret") == 1
+        gsql = [r for r in stub_server.requests if r["path"] == "/gsql/v1/statements"]
+        assert len(gsql) == 1
+        assert f"INSTALL QUERY {shape.name}" in gsql[0]["body"].decode()
+        runs = [r for r in stub_server.requests if r["path"] == path]
+        assert len(runs) == 2
+        assert runs[-1]["query"].startswith("start_nodes=a&tgx_limit_0=10")
+
+    @pytest.mark.parametrize(
+        "status, body, missing",
+        [
+            (404, {"error": True, "message": "Endpoint is not found"}, True),
+            (
+                200,
+                {"error": True, "message": "Not found", "code": "REST-1000"},
+                True,
+            ),
+            (
+                400,
+                {"error": True, "message": "Vertex a does not exist", "code": "REST"},
+                False,
+            ),
+        ],
+    )
+    def test_missing_query_error(self, stub_server, config, status, body, missing):
+        """Test that only errors of a missing query fall back to interpreting it."""
+        shape = QueryCatalog.get_shape(QUERY)
+        assert shape is not None
+        stub_server.add_route("GET", f"/restpp/query/Social/{shape.name}", body, status)
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": False, "results": [{"n": 2}]},
+        )
+
+        api = TigerGraphAPI(config)
+        api.query_catalog.set_state(shape, "installed")
+        try:
+            if missing:
+                assert api.run_generated_query(QUERY, "start_nodes=a") == [{"n": 2}]
+                assert api.query_catalog.get_state(shape) == "failed"
+            else:
+                with pytest.raises(TigerGraphAPIError, match="does not exist"):
+                    api.run_generated_query(QUERY, "start_nodes=a")
+                assert api.query_catalog.get_state(shape) == "installed"
+        finally:
+            api.close()
+        assert "/gsql/v1/statements" not in [r["path"] for r in stub_server.requests]
+
+    def test_fallback_to_interpreted(self, stub_server, config):
+        """Test that a shape that fails to install is interpreted from then on."""
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/statements",
+            "Semantic Check Fails",
+            content_type="text/plain",
+        )
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": False, "results": [{"n": 2}]},
+        )
+
+        api = TigerGraphAPI(config)
+        try:
+            for _ in range(2):
+                assert api.run_generated_query(QUERY, "start_nodes=a") == [{"n": 2}]
+            assert api.get_installed_queries() == {"Social": []}
+        finally:
+            api.close()
+
+        paths = [r["path"] for r in stub_server.requests]
+        assert paths.count("/gsql/v1/statements") == 1
+        assert paths.count("/gsql/v1/queries/interpret") == 2
+
+    def test_disabled_by_default(self, stub_server, config):
+        """Test that generated queries are interpreted unless enabled."""
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": False, "results": [{"n": 3}]},
+        )
+        api = TigerGraphAPI(config.model_copy(update={"auto_install_queries": False}))
+        try:
+            assert api.run_generated_query(QUERY, "start_nodes=a") == [{"n": 3}]
+        finally:
+            api.close()
+        assert [r["path"] for r in stub_server.requests] == [
+            "/gsql/v1/queries/interpret"
+        ]
+
+
+class TestQueryPromotion:
+    @pytest.fixture
+    def api(self, stub_server):
+        """Fixture for an API that promotes queries after two runs."""
+        api = TigerGraphAPI(
+            TigerGraphConnectionConfig(
+                host=HttpUrl(stub_server.host),
+                gsql_port=stub_server.port,
+                restpp_port=stub_server.port,
+                max_retries=0,
+                query_promotion_threshold=2,
+            )
+        )
+        yield api
+        api.close()
+
+    @staticmethod
+    def wait_for_install(api: TigerGraphAPI, shape) -> None:
+        deadline = time.monotonic() + 5
+        while api.query_catalog.get_state(shape) is None:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    def test_promote_hot_query(self, stub_server, api):
+        """Test that a query is installed after the threshold and run installed."""
+        shape = QueryCatalog.get_shape(QUERY)
+        assert shape is not None
+        path = f"/restpp/query/Social/{shape.name}"
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": False, "results": [{"n": 1}]},
+        )
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/statements",
+            "Query installation finished.",
+            content_type="text/plain",
+        )
+        stub_server.add_route("GET", path, {"error": False, "results": [{"n": 1}]})
+
+        for _ in range(2):
+            assert api.run_interpreted_query(QUERY, {"start_nodes": "a"}) == [{"n": 1}]
+        self.wait_for_install(api, shape)
+        assert api.get_installed_queries() == {"Social": [shape.name]}
+        assert api.run_interpreted_query(QUERY, {"start_nodes": "a"}) == [{"n": 1}]
+
+        # The installation runs concurrently with the second interpreted run
+        paths = [r["path"] for r in stub_server.requests]
+        assert sorted(paths[:3]) == [
+            "/gsql/v1/queries/interpret",
+            "/gsql/v1/queries/interpret",
+            "/gsql/v1/statements",
+        ]
+        assert paths[3:] == [path]
+        assert "tgx_limit_0=10" in stub_server.requests[-1]["query"]
+
+    def test_fallback_when_dropped(self, stub_server, api):
+        """Test that a promoted query that disappears is interpreted again."""
+        shape = QueryCatalog.get_shape(QUERY)
+        assert shape is not None
+        api.query_catalog.set_state(shape, "installed")
+        stub_server.add_route(
+            "GET",
+            f"/restpp/query/Social/{shape.name}",
+            {"error": True, "message": "Endpoint is not found"},
+            404,
+        )
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": False, "results": [{"n": 2}]},
+        )
+
+        for _ in range(3):
+            assert api.run_interpreted_query(QUERY) == [{"n": 2}]
+        assert api.get_installed_queries() == {"Social": []}
+        paths = [r["path"] for r in stub_server.requests]
+        assert paths.count("/gsql/v1/queries/interpret") == 3
+        assert "/gsql/v1/statements" not in paths
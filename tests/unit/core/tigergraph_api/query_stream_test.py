@@ -0,0 +1,59 @@
+import pytest
+from pydantic import HttpUrl
+
+from tigergraphx.core.tigergraph_api import TigerGraphAPI, TigerGraphAPIError
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestRunInterpretedQueryStream:
+    @pytest.fixture
+    def api(self, stub_server):
+        """Fixture for a TigerGraphAPI pointing at the stub server."""
+        config = TigerGraphConnectionConfig(
+            host=HttpUrl(stub_server.host),
+            gsql_port=stub_server.port,
+            restpp_port=stub_server.port,
+            username="tigergraph",
+            password="tigergraph",
+        )
+        api = TigerGraphAPI(config)
+        yield api
+        api.close()
+
+    def test_stream_batches(self, stub_server, api):
+        """Test that the printed list is returned in batches."""
+        nodes = [{"v_id": str(i), "attributes": {"n": i}} for i in range(5)]
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": False, "message": "", "results": [{"Nodes": nodes}]},
+        )
+        batches = list(
+            api.run_interpreted_query_stream(
+                "INTERPRET QUERY(INT k) { PRINT k; }", {"k": 5}, batch_size=2
+            )
+        )
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [node for batch in batches for node in batch] == nodes
+        assert stub_server.requests[0]["query"] == "k=5"
+
+    def test_error_payload(self, stub_server, api):
+        """Test that an error flag in a 200 response raises TigerGraphAPIError."""
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": True, "message": "Query failed.", "results": []},
+        )
+        with pytest.raises(TigerGraphAPIError, match="Query failed."):
+            list(api.run_interpreted_query_stream("INTERPRET QUERY() {}"))
+
+    def test_http_error(self, stub_server, api):
+        """Test that an HTTP error is raised before any batch is yielded."""
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": True, "message": "Syntax error."},
+            status=400,
+        )
+        with pytest.raises(TigerGraphAPIError, match="Syntax error."):
+            list(api.run_interpreted_query_stream("INTERPRET QUERY() {"))
@@ -0,0 +1,113 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from pydantic import HttpUrl
+
+from tigergraphx.core.tigergraph_api import (
+    AsyncTigerGraphAPI,
+    RequestLimiter,
+    TigerGraphAPI,
+    TokenBucket,
+)
+from tigergraphx.config import RequestLimitConfig, TigerGraphConnectionConfig
+
+
+class TestRequestLimiter:
+    @pytest.fixture
+    def make_config(self, stub_server):
+        """Fixture for creating a config that points to the stub server."""
+
+        def _make_config(request_limits):
+            return TigerGraphConnectionConfig(
+                host=HttpUrl(stub_server.host),
+                gsql_port=stub_server.port,
+                restpp_port=stub_server.port,
+                request_limits=request_limits,
+            )
+
+        return _make_config
+
+    def test_max_in_flight(self, stub_server, make_config):
+        """Test that concurrent requests of a class queue behind the limit."""
+        stub_server.add_route(
+            "POST", "/gsql/v1/statements", "OK", content_type="text/plain", delay=0.1
+        )
+        api = TigerGraphAPI(make_config({"gsql": {"max_in_flight": 2}}))
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                results = list(executor.map(lambda _: api.gsql("ls"), range(6)))
+            elapsed = time.perf_counter() - start
+        finally:
+            api.close()
+
+        assert results == ["OK"] * 6
+        # Three waves of two requests
+        assert elapsed >= 0.3
+        stats = api.get_limiter_stats()["gsql"]
+        assert stats["requests"] == 6
+        assert stats["in_flight"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] >= 2
+        assert stats["queued_requests"] >= 4
+        assert stats["max_wait_seconds"] >= 0.15
+
+    def test_rate_limit(self, stub_server, make_config):
+        """Test that requests beyond the burst are spaced at the configured rate."""
+        stub_server.add_route("GET", "/api/ping", {"error": False, "message": "pong"})
+        api = TigerGraphAPI(
+            make_config({"default": {"requests_per_second": 20, "burst": 1}})
+        )
+        try:
+            start = time.perf_counter()
+            for _ in range(4):
+                assert api.ping() == "pong"
+            elapsed = time.perf_counter() - start
+        finally:
+            api.close()
+
+        assert elapsed >= 0.15
+        assert api.get_limiter_stats()["default"]["requests"] == 4
+
+    def test_unlimited_classes_are_not_wrapped(self):
+        """Test that classes without limits send requests directly."""
+        limiter = RequestLimiter(
+            {"gsql": RequestLimitConfig(), "query": RequestLimitConfig(max_in_flight=1)}
+        )
+
+        def send():
+            return "sent"
+
+        assert limiter.wrap("gsql", send) is send
+        assert limiter.wrap("interpret", send) is send
+        assert limiter.wrap("query", send)() == "sent"
+        assert list(limiter.get_stats()) == ["query"]
+
+    def test_token_bucket(self):
+        """Test that the bucket allows a burst and then reserves future slots."""
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_async_max_in_flight(self, stub_server, make_config):
+        """Test that the async client honours the concurrency limit."""
+        stub_server.add_route(
+            "POST", "/gsql/v1/statements", "OK", content_type="text/plain", delay=0.1
+        )
+
+        async def run():
+            async with AsyncTigerGraphAPI(
+                make_config({"gsql": {"max_in_flight": 1}})
+            ) as api:
+                results = await asyncio.gather(*(api.gsql("ls") for _ in range(3)))
+                return results, api.get_limiter_stats()["gsql"]
+
+        start = time.perf_counter()
+        results, stats = asyncio.run(run())
+        assert results == ["OK"] * 3
+        assert time.perf_counter() - start >= 0.3
+        assert stats["max_queue_depth"] == 2
+        assert stats["in_flight"] == 0
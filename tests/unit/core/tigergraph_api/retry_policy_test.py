@@ -0,0 +1,215 @@
+import asyncio
+import time
+from email.utils import formatdate
+import pytest
+import requests
+from unittest.mock import MagicMock
+from pydantic import HttpUrl
+
+from tigergraphx.core.tigergraph_api import (
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    RetryPolicy,
+    TigerGraphAPI,
+    TigerGraphAPIError,
+)
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestRetryPolicy:
+    @pytest.fixture
+    def make_api(self, stub_server):
+        """Fixture for creating a TigerGraphAPI with fast retries."""
+        apis = []
+
+        def _make_api(**kwargs):
+            config = TigerGraphConnectionConfig(
+                host=HttpUrl(stub_server.host),
+                gsql_port=stub_server.port,
+                restpp_port=stub_server.port,
+                **{"retry_initial_wait": 0.01, "retry_max_wait": 0.05, **kwargs},
+            )
+            api = TigerGraphAPI(config)
+            apis.append(api)
+            return api
+
+        yield _make_api
+        for api in apis:
+            api.close()
+
+    def test_retry_on_service_unavailable(self, stub_server, make_api):
+        """Test that 503 responses are retried until the server recovers."""
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/statements",
+            "Unavailable",
+            status=503,
+            content_type="text/plain",
+            times=2,
+        )
+        stub_server.add_route(
+            "POST", "/gsql/v1/statements", "OK", content_type="text/plain"
+        )
+        assert make_api().gsql("ls") == "OK"
+        assert len(stub_server.requests) == 3
+
+    def test_retries_exhausted(self, stub_server, make_api):
+        """Test that the last response is raised once retries are exhausted."""
+        stub_server.add_route(
+            "GET", "/api/ping", "Busy", status=429, content_type="text/plain"
+        )
+        with pytest.raises(RuntimeError, match="429 Too Many Requests"):
+            make_api(max_retries=2).ping()
+        assert len(stub_server.requests) == 3
+
+    def test_retry_after_is_honoured(self, stub_server, make_api):
+        """Test that Retry-After takes precedence over the backoff."""
+        stub_server.add_route(
+            "GET",
+            "/api/ping",
+            "Busy",
+            status=429,
+            content_type="text/plain",
+            headers={"Retry-After": "0.2"},
+            times=1,
+        )
+        stub_server.add_route("GET", "/api/ping", {"error": False, "message": "pong"})
+        start = time.perf_counter()
+        assert make_api(retry_max_wait=1.0).ping() == "pong"
+        assert time.perf_counter() - start >= 0.2
+
+    def test_gateway_timeout_only_retried_when_idempotent(self, stub_server, make_api):
+        """Test that 504 is retried for GET but not for non-idempotent POST."""
+        for method, path in [("GET", "/api/ping"), ("POST", "/gsql/v1/statements")]:
+            stub_server.add_route(
+                method, path, "Timeout", status=504, content_type="text/plain"
+            )
+        api = make_api(max_retries=2)
+
+        with pytest.raises(RuntimeError, match="504 Gateway Timeout"):
+            api.ping()
+        assert len(stub_server.requests) == 3
+
+        with pytest.raises(RuntimeError, match="504 Gateway Timeout"):
+            api.gsql("ls")
+        assert len(stub_server.requests) == 4
+
+    def test_upsert_not_retried_on_gateway_timeout(self, stub_server, make_api):
+        """Test that upserts, which may accumulate, are not resent after 504."""
+        stub_server.add_route(
+            "POST",
+            "/restpp/graph/MyGraph",
+            "Timeout",
+            status=504,
+            content_type="text/plain",
+        )
+        visits = {"value": 1, "op": "add"}
+        payload = {"vertices": {"Person": {"Alice": {"visits": visits}}}}
+
+        with pytest.raises(RuntimeError, match="504 Gateway Timeout"):
+            make_api(max_retries=2).upsert_graph_data("MyGraph", payload)
+        assert len(stub_server.requests) == 1
+
+    def test_circuit_breaker(self, stub_server, make_api):
+        """Test that the circuit opens after repeated failures and recovers."""
+        stub_server.add_route(
+            "GET",
+            "/api/ping",
+            "Unavailable",
+            status=503,
+            content_type="text/plain",
+            times=2,
+        )
+        stub_server.add_route("GET", "/api/ping", {"error": False, "message": "pong"})
+        api = make_api(
+            max_retries=0,
+            circuit_breaker_threshold=2,
+            circuit_breaker_reset_timeout=0.1,
+        )
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="503"):
+                api.ping()
+        with pytest.raises(CircuitBreakerOpenError, match="Circuit breaker is open"):
+            api.ping()
+        assert len(stub_server.requests) == 2
+
+        time.sleep(0.1)
+        assert api.ping() == "pong"
+        assert api.retry_policy.circuit_breaker.state == CircuitBreaker.CLOSED
+
+    def test_server_errors_do_not_open_circuit(self, stub_server, make_api):
+        """Test that 500 responses, e.g. from a failing query, keep the circuit closed."""
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": True, "message": "Runtime error"},
+            status=500,
+        )
+        api = make_api(max_retries=0, circuit_breaker_threshold=2)
+
+        for _ in range(3):
+            with pytest.raises(TigerGraphAPIError, match="Runtime error"):
+                api.run_interpreted_query("INTERPRET QUERY() { PRINT 1/0; }")
+        assert len(stub_server.requests) == 3
+        assert api.retry_policy.circuit_breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_trial(self):
+        """Test that only one trial request passes while the circuit is half open."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+        breaker.before_call()
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.before_call()
+        breaker.record_failure()
+        assert breaker._state == CircuitBreaker.OPEN
+
+    def test_trial_released_after_unrelated_error(self):
+        """Test that a trial ending without a verdict does not keep the circuit open."""
+        policy = RetryPolicy(
+            TigerGraphConnectionConfig(
+                circuit_breaker_threshold=1, circuit_breaker_reset_timeout=0.0
+            )
+        )
+        breaker = policy.circuit_breaker
+        breaker.record_failure()
+        endpoint = {"method": "GET"}
+
+        def fail():
+            raise KeyError("no recorded response")
+
+        with pytest.raises(KeyError):
+            policy.call(endpoint, fail)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        async def cancel():
+            raise asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(policy.call_async(endpoint, cancel))
+
+        response = MagicMock(status_code=200, headers={})
+        assert policy.call(endpoint, lambda: response) is response
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_connect_error_classification(self):
+        """Test that refused connections are retried for every endpoint."""
+        with pytest.raises(requests.exceptions.ConnectionError) as exc_info:
+            requests.get("http://127.0.0.1:1", timeout=1)
+        assert RetryPolicy._is_retryable_exception(exc_info.value, idempotent=False)
+
+        reset = requests.exceptions.ConnectionError("Connection reset by peer")
+        assert not RetryPolicy._is_retryable_exception(reset, idempotent=False)
+        assert RetryPolicy._is_retryable_exception(reset, idempotent=True)
+
+    def test_parse_retry_after(self):
+        """Test parsing Retry-After in seconds and as an HTTP date."""
+        response = MagicMock()
+        response.headers = {"Retry-After": "3"}
+        assert RetryPolicy._parse_retry_after(response) == 3.0
+
+        response.headers = {"Retry-After": formatdate(time.time() + 60, usegmt=True)}
+        assert 55 <= RetryPolicy._parse_retry_after(response) <= 60  # type: ignore
+
+        response.headers = {"Retry-After": "soon"}
+        assert RetryPolicy._parse_retry_after(response) is None
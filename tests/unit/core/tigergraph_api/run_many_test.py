@@ -0,0 +1,125 @@
+import asyncio
+import time
+import pytest
+from pydantic import HttpUrl
+
+from tigergraphx.core.tigergraph_api import AsyncTigerGraphAPI, TigerGraphAPI
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestRunMany:
+    @pytest.fixture
+    def config(self, stub_server):
+        """Fixture for a config that points to the stub server."""
+        return TigerGraphConnectionConfig(
+            host=HttpUrl(stub_server.host),
+            gsql_port=stub_server.port,
+            restpp_port=stub_server.port,
+            max_retries=0,
+        )
+
+    @pytest.fixture
+    def jobs(self, stub_server):
+        """Fixture for slow installed queries, an interpreted query and a bad job."""
+        for name in ["q1", "q2", "q3", "q4"]:
+            stub_server.add_route(
+                "GET",
+                f"/restpp/query/MyGraph/{name}",
+                {"error": False, "results": [{"name": name}]},
+                delay=0.2,
+            )
+        stub_server.add_route(
+            "POST",
+            "/gsql/v1/queries/interpret",
+            {"error": False, "results": [{"name": "interpreted"}]},
+            delay=0.2,
+        )
+        stub_server.add_route(
+            "GET",
+            "/restpp/query/MyGraph/missing",
+            {"error": True, "message": "Query not found"},
+        )
+        return [
+            {"graph_name": "MyGraph", "query_name": name} for name in ["q1", "q2"]
+        ] + [
+            {"query": "INTERPRET QUERY () FOR GRAPH MyGraph { PRINT 1; }"},
+            {"graph_name": "MyGraph", "query_name": "missing"},
+            {"params": {}},
+            {"graph_name": "MyGraph", "query_name": "q3", "params": {"k": 1}},
+            {"graph_name": "MyGraph", "query_name": "q4"},
+        ]
+
+    def test_run_many(self, config, jobs):
+        """Test that jobs run concurrently, in order, with per-item errors."""
+        api = TigerGraphAPI(config)
+        try:
+            start = time.perf_counter()
+            results = api.run_many(jobs)
+            elapsed = time.perf_counter() - start
+        finally:
+            api.close()
+
+        assert elapsed < 0.6
+        assert results[0] == [{"name": "q1"}]
+        assert results[1] == [{"name": "q2"}]
+        assert results[2] == [{"name": "interpreted"}]
+        assert isinstance(results[3], Exception)
+        assert "Query not found" in str(results[3])
+        assert isinstance(results[4], ValueError)
+        assert results[5] == [{"name": "q3"}]
+        assert results[6] == [{"name": "q4"}]
+
+    def test_run_many_bounded(self, config, jobs):
+        """Test that max_workers bounds the concurrency."""
+        api = TigerGraphAPI(config)
+        try:
+            start = time.perf_counter()
+            results = api.run_many(jobs[:2], max_workers=1)
+            elapsed = time.perf_counter() - start
+        finally:
+            api.close()
+        assert results == [[{"name": "q1"}], [{"name": "q2"}]]
+        assert elapsed >= 0.4
+
+    def test_run_many_empty(self, config):
+        """Test that no jobs yield no results."""
+        api = TigerGraphAPI(config)
+        assert api.run_many([]) == []
+        api.close()
+
+    def test_async_run_many(self, config, jobs):
+        """Test the async client runs jobs concurrently with per-item errors."""
+
+        async def run():
+            async with AsyncTigerGraphAPI(config) as api:
+                return await api.run_many(jobs)
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        assert time.perf_counter() - start < 0.6
+        assert results[0] == [{"name": "q1"}]
+        assert results[2] == [{"name": "interpreted"}]
+        assert isinstance(results[3], Exception)
+        assert isinstance(results[4], ValueError)
+        assert results[6] == [{"name": "q4"}]
+
+    def test_large_set_parameter_switches_to_post(self, stub_server, config):
+        """Test that installed queries with huge vertex sets use a JSON body."""
+        for method in ["GET", "POST"]:
+            stub_server.add_route(
+                method,
+                "/restpp/query/MyGraph/q",
+                {"error": False, "results": [{"method": method}]},
+            )
+        api = TigerGraphAPI(config)
+        try:
+            small = api.run_installed_query("MyGraph", "q", {"s": [("a", "Person")]})
+            large = api.run_installed_query(
+                "MyGraph", "q", {"s": [(f"node{i}", "Person") for i in range(5000)]}
+            )
+        finally:
+            api.close()
+
+        assert small == [{"method": "GET"}]
+        assert large == [{"method": "POST"}]
+        assert b'{"id":"node4999","type":"Person"}' in stub_server.requests[-1]["body"]
@@ -0,0 +1,173 @@
+import asyncio
+import gzip
+import time
+from types import SimpleNamespace
+import pytest
+from pydantic import HttpUrl
+
+from tigergraphx.core.tigergraph_api import (
+    AsyncTigerGraphAPI,
+    ReplayMissError,
+    TigerGraphAPI,
+)
+from tigergraphx.core.tigergraph_api.transport_recorder import TransportRecording
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class TestTransportRecorder:
+    @pytest.fixture
+    def recording_file(self, tmp_path):
+        """Fixture for the path of a recording file."""
+        return str(tmp_path / "recording.jsonl.gz")
+
+    @pytest.fixture
+    def routes(self, stub_server):
+        """Fixture for the routes of two installed queries."""
+        stub_server.add_route(
+            "GET",
+            "/restpp/query/MyGraph/q1",
+            {"error": False, "results": [{"count": 1}]},
+            delay=0.05,
+        )
+        stub_server.add_route(
+            "POST",
+            "/restpp/query/MyGraph/q2",
+            {"error": False, "results": [{"count": 2}]},
+        )
+
+    def make_config(self, stub_server, **kwargs):
+        return TigerGraphConnectionConfig(
+            host=HttpUrl(stub_server.host),
+            gsql_port=stub_server.port,
+            restpp_port=stub_server.port,
+            max_retries=0,
+            json_codec="stdlib",
+            **kwargs,
+        )
+
+    def test_record_and_replay(self, stub_server, routes, recording_file):
+        """Test that recorded responses are replayed with the server stopped."""
+        api = TigerGraphAPI(
+            self.make_config(
+                stub_server, transport_mode="record", transport_file=recording_file
+            )
+        )
+        recorded = [
+            api.run_installed_query("MyGraph", "q1", {"k": 1}),
+            api.run_installed_query("MyGraph", "q2", {"k": 2}, use_post=True),
+        ]
+        api.close()
+        stub_server.stop()
+
+        recording = TransportRecording.load(recording_file)
+        assert [i["path"] for i in recording.interactions] == [
+            "/restpp/query/MyGraph/q1?k=1",
+            "/restpp/query/MyGraph/q2",
+        ]
+        assert recording.interactions[0]["latency"] >= 0.05
+
+        api = TigerGraphAPI(
+            self.make_config(
+                stub_server, transport_mode="replay", transport_file=recording_file
+            )
+        )
+        try:
+            replayed = [
+                api.run_installed_query("MyGraph", "q1", {"k": 1}),
+                api.run_installed_query("MyGraph", "q2", {"k": 2}, use_post=True),
+            ]
+            assert replayed == recorded
+            with pytest.raises(ReplayMissError, match="No recorded response"):
+                api.run_installed_query("MyGraph", "q1", {"k": 2})
+        finally:
+            api.close()
+
+    def test_record_and_replay_compressed(
+        self, stub_server, routes, recording_file, monkeypatch
+    ):
+        """Test that gzip request bodies match on replay at a later time."""
+        params = {"names": [f"name_{i}" for i in range(100)]}
+
+        def run(mode):
+            api = TigerGraphAPI(
+                self.make_config(
+                    stub_server,
+                    transport_mode=mode,
+                    transport_file=recording_file,
+                    request_compression=True,
+                    compression_min_size=0,
+                )
+            )
+            try:
+                return api.run_installed_query("MyGraph", "q2", params, use_post=True)
+            finally:
+                api.close()
+
+        recorded = run("record")
+        assert stub_server.requests[0]["headers"].get("Content-Encoding") == "gzip"
+        stub_server.stop()
+        # gzip would otherwise write the current time into the header
+        monkeypatch.setattr(gzip, "time", SimpleNamespace(time=lambda: 2e9))
+        assert run("replay") == recorded == [{"count": 2}]
+
+    def test_replay_latency(self, stub_server, routes, recording_file):
+        """Test recorded and synthetic replay latency."""
+        api = TigerGraphAPI(
+            self.make_config(
+                stub_server, transport_mode="record", transport_file=recording_file
+            )
+        )
+        api.run_installed_query("MyGraph", "q1")
+        api.close()
+
+        for latency, minimum in [("recorded", 0.05), (0.1, 0.1)]:
+            api = TigerGraphAPI(
+                self.make_config(
+                    stub_server,
+                    transport_mode="replay",
+                    transport_file=recording_file,
+                    replay_latency=latency,
+                )
+            )
+            start = time.perf_counter()
+            api.run_installed_query("MyGraph", "q1")
+            assert time.perf_counter() - start >= minimum
+            api.close()
+
+    def test_async_record_and_replay(self, stub_server, routes, recording_file):
+        """Test that the async API records and replays through httpx transports."""
+
+        async def run(mode):
+            api = AsyncTigerGraphAPI(
+                self.make_config(
+                    stub_server, transport_mode=mode, transport_file=recording_file
+                )
+            )
+            try:
+                return await api.run_installed_query("MyGraph", "q1", {"k": 1})
+            finally:
+                await api.close()
+
+        recorded = asyncio.run(run("record"))
+        stub_server.stop()
+        assert asyncio.run(run("replay")) == recorded == [{"count": 1}]
+
+    def test_repeated_requests(self):
+        """Test that repeated requests replay in order and reuse the last response."""
+        recording = TransportRecording()
+        for count in [1, 2]:
+            recording.add(
+                TransportRecording.build_interaction(
+                    "GET", "/restpp/echo", None, 200, {}, str(count).encode(), 0.0
+                )
+            )
+        contents = [
+            TransportRecording.get_content(recording.match("GET", "/restpp/echo", b""))
+            for _ in range(3)
+        ]
+        assert contents == [b"1", b"2", b"2"]
+
+    def test_transport_file_required(self):
+        """Test that the record and replay modes require a recording file."""
+        with pytest.raises(ValueError, match="transport_file"):
+            TigerGraphConnectionConfig(transport_mode="replay")
@@ -13,6 +13,7 @@ class MockGraph:
         self.get_node_data = MagicMock(return_value={})
         self.has_node = MagicMock(return_value=False)
         self.get_nodes = MagicMock(return_value=pd.DataFrame())
+        self.iter_nodes = MagicMock(return_value=iter([]))
         self.number_of_nodes = MagicMock(return_value=0)
 
 
@@ -88,22 +89,31 @@ class TestNodeView:
 
     def test_iter_homogeneous(self):
         """Test __iter__ for a homogeneous graph to return just node IDs."""
-        # Create a dataframe with node IDs only.
-        df = pd.DataFrame({"v_id": ["node_1", "node_2", "node_3"]})
+        # Create batches of dataframes with node IDs only.
+        batches = [
+            pd.DataFrame({"v_id": ["node_1", "node_2"]}),
+            pd.DataFrame({"v_id": ["node_3"]}),
+        ]
         graph = MockGraph(node_types=["default"])
-        graph.get_nodes = MagicMock(return_value=df)
+        graph.iter_nodes = MagicMock(return_value=iter(batches))
 
         node_view = NodeView(graph)
         # Iteration should only yield the 'v_id' values.
         node_ids = list(iter(node_view))
         assert node_ids == ["node_1", "node_2", "node_3"]
+        graph.iter_nodes.assert_called_once_with(node_type="default")
 
     def test_iter_heterogeneous(self):
         """Test __iter__ for a heterogeneous graph to return (node_type, node_id) pairs."""
-        # Create a dataframe with both node IDs and types.
-        df = pd.DataFrame({"v_id": ["node_1", "node_2"], "v_type": ["user", "item"]})
+        # Create one batch of nodes per node type.
+        batches = {
+            "user": [pd.DataFrame({"v_id": ["node_1"], "v_type": ["user"]})],
+            "item": [pd.DataFrame({"v_id": ["node_2"], "v_type": ["item"]})],
+        }
         graph = MockGraph(node_types=["user", "item"])
-        graph.get_nodes = MagicMock(return_value=df)
+        graph.iter_nodes = MagicMock(
+            side_effect=lambda node_type: iter(batches[node_type])
+        )
 
         node_view = NodeView(graph)
         nodes = list(iter(node_view))
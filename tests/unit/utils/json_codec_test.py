@@ -0,0 +1,72 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from tigergraphx.utils.json_codec import (
+    OrjsonJSONCodec,
+    StdlibJSONCodec,
+    get_json_codec,
+)
+
+
+def _available_codecs():
+    names = ["stdlib"]
+    for name in ("orjson", "msgspec"):
+        try:
+            __import__(name)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+class TestJSONCodec:
+    @pytest.mark.parametrize("name", _available_codecs())
+    def test_round_trip(self, name):
+        """Test that every installed backend round-trips TigerGraph payloads."""
+        codec = get_json_codec(name)
+        payload = {
+            "vertices": {"Doc": {"d1": {"emb": {"value": [0.1, -2.5e-08, 3.0]}}}},
+            "name": "Zoë",
+            "flags": [True, False, None],
+        }
+        encoded = codec.encode(payload)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == payload
+        assert codec.decode(encoded) == payload
+        assert codec.decode(encoded.decode("utf-8")) == payload
+
+    @pytest.mark.parametrize("name", _available_codecs())
+    def test_invalid_json_raises_value_error(self, name):
+        """Test that all backends report malformed JSON as ValueError."""
+        with pytest.raises(ValueError):
+            get_json_codec(name).decode(b'{"results": [')
+
+    @pytest.mark.parametrize("name", _available_codecs())
+    def test_encode_array_like_and_sets(self, name):
+        """Test that objects exposing `tolist()` and sets are serialized as lists."""
+        array_like = MagicMock()
+        array_like.tolist.return_value = [1.0, 2.0]
+        encoded = get_json_codec(name).encode({"v": array_like, "s": {"a"}})
+        assert json.loads(encoded) == {"v": [1.0, 2.0], "s": ["a"]}
+
+    def test_decode_response(self):
+        """Test that the stdlib codec delegates to `response.json()`."""
+        response = MagicMock()
+        response.json.return_value = {"error": False}
+        assert StdlibJSONCodec().decode_response(response) == {"error": False}
+
+        pytest.importorskip("orjson")
+        response.content = b'{"error": true}'
+        assert OrjsonJSONCodec().decode_response(response) == {"error": True}
+
+    def test_auto_and_caching(self):
+        """Test that 'auto' resolves to an installed backend and codecs are shared."""
+        expected = (_available_codecs()[1:] or ["stdlib"])[0]
+        assert get_json_codec("auto").name == expected
+        assert get_json_codec("stdlib") is get_json_codec("stdlib")
+
+    def test_unknown_codec(self):
+        """Test that an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_json_codec("ujson")  # type: ignore[arg-type]
@@ -9,6 +9,7 @@ from .base_config import BaseConfig
 from .graph_db import (
     # configurations for TigerGraph server
     TigerGraphConnectionConfig,
+    RequestLimitConfig,
     # configurations for graph schema
     DataType,
     AttributeSchema,
@@ -51,6 +52,7 @@ __all__ = [
     "BaseConfig",
     # configurations for TigerGraph server
     "TigerGraphConnectionConfig",
+    "RequestLimitConfig",
     # configurations for graph schema
     "DataType",
     "AttributeSchema",
@@ -5,7 +5,10 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from .tigergraph_connection_config import TigerGraphConnectionConfig
+from .tigergraph_connection_config import (
+    TigerGraphConnectionConfig,
+    RequestLimitConfig,
+)
 from .schema import (
     DataType,
     AttributeSchema,
@@ -30,6 +33,7 @@ from .loading_job_config import (
 __all__ = [
     # configurations for TigerGraph server
     "TigerGraphConnectionConfig",
+    "RequestLimitConfig",
     # configurations for graph schema
     "DataType",
     "AttributeSchema",
@@ -5,13 +5,36 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from pydantic import HttpUrl, Field, model_validator
 from pydantic_settings import SettingsConfigDict
 
 from tigergraphx.config import BaseConfig
 
 
+class RequestLimitConfig(BaseConfig):
+    """
+    Client-side limits for one class of TigerGraph endpoints.
+    """
+
+    max_in_flight: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="The maximum number of concurrent requests. Unlimited if None.",
+    )
+    requests_per_second: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="The sustained request rate of the token bucket. Unlimited if None.",
+    )
+    burst: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="The token bucket capacity, i.e. how many requests may be sent at "
+        "once after an idle period. Defaults to the rounded-up request rate.",
+    )
+
+
 class TigerGraphConnectionConfig(BaseConfig):
     """
     Configuration for connecting to a TigerGraph instance.
@@ -37,6 +60,26 @@ class TigerGraphConnectionConfig(BaseConfig):
         default="14240", validation_alias="TG_GSQL_PORT", description="The port for GSQL."
     )
 
+    # Multi-node clusters
+    hosts: List[HttpUrl] = Field(
+        default_factory=list,
+        validation_alias="TG_HOSTS",
+        description="Additional host URLs of the same cluster. Requests are spread "
+        "over `host` and these hosts, which must use the same ports.",
+    )
+    load_balancing: Literal["round_robin", "least_latency"] = Field(
+        default="round_robin",
+        validation_alias="TG_LOAD_BALANCING",
+        description="How to pick a host for each request when several are configured.",
+    )
+    health_check_interval: float = Field(
+        default=30.0,
+        ge=0,
+        validation_alias="TG_HEALTH_CHECK_INTERVAL",
+        description="Seconds a failed host is kept out of rotation before it is pinged "
+        "again.",
+    )
+
     # User/password authentication
     username: Optional[str] = Field(
         default=None,
@@ -63,6 +106,203 @@ class TigerGraphConnectionConfig(BaseConfig):
         description="The API token for TigerGraph authentication. Use only for token-based authentication.",
     )
 
+    # HTTP connection pooling
+    pool_connections: int = Field(
+        default=10,
+        ge=1,
+        validation_alias="TG_POOL_CONNECTIONS",
+        description="The number of per-host connection pools to cache.",
+    )
+    pool_maxsize: int = Field(
+        default=10,
+        ge=1,
+        validation_alias="TG_POOL_MAXSIZE",
+        description="The maximum number of connections to keep alive per host.",
+    )
+    pool_block: bool = Field(
+        default=False,
+        validation_alias="TG_POOL_BLOCK",
+        description="Whether to wait for a free pooled connection instead of opening a "
+        "throwaway one when the pool is exhausted.",
+    )
+    tcp_keepalive: bool = Field(
+        default=True,
+        validation_alias="TG_TCP_KEEPALIVE",
+        description="Whether to enable TCP keep-alive on pooled sockets.",
+    )
+    socket_options: Optional[List[Tuple[int, int, int]]] = Field(
+        default=None,
+        validation_alias="TG_SOCKET_OPTIONS",
+        description="Extra (level, option, value) socket options applied to new connections.",
+    )
+
+    # JSON serialization
+    json_codec: Literal["auto", "orjson", "msgspec", "stdlib"] = Field(
+        default="auto",
+        validation_alias="TG_JSON_CODEC",
+        description="The JSON backend for request and response bodies. 'auto' uses "
+        "orjson or msgspec if installed and falls back to the standard library.",
+    )
+
+    # Result decoding
+    result_backend: Literal["numpy", "pyarrow"] = Field(
+        default="numpy",
+        validation_alias="TG_RESULT_BACKEND",
+        description="The array backend of the DataFrames returned by `get_nodes` and "
+        "`get_neighbors`. 'pyarrow' returns Arrow-backed columns and requires pyarrow.",
+    )
+    result_dtypes: Literal["inferred", "schema"] = Field(
+        default="inferred",
+        validation_alias="TG_RESULT_DTYPES",
+        description="How the column dtypes of the DataFrames returned by `get_nodes` "
+        "and `get_neighbors` are chosen. 'inferred' matches `pd.json_normalize`; "
+        "'schema' uses the attribute types, e.g. int64, uint64 and datetime64, with "
+        "nullable dtypes for missing values, and a categorical `v_type`.",
+    )
+    result_string_dtype: Literal["object", "pyarrow"] = Field(
+        default="object",
+        validation_alias="TG_RESULT_STRING_DTYPE",
+        description="The dtype of string columns with the 'numpy' result backend. "
+        "'pyarrow' stores them as Arrow strings and requires pyarrow.",
+    )
+
+    # Query parameters
+    max_query_string_length: int = Field(
+        default=4096,
+        ge=256,
+        validation_alias="TG_MAX_QUERY_STRING_LENGTH",
+        description="The longest URL query string to send. Installed queries with "
+        "longer parameters are sent with a JSON body instead, and vertex sets of "
+        "interpreted queries are split into several requests.",
+    )
+
+    # Generated queries
+    auto_install_queries: bool = Field(
+        default=False,
+        validation_alias="TG_AUTO_INSTALL_QUERIES",
+        description="Whether to install each distinct shape of the queries that "
+        "TigerGraphX generates, e.g. for `get_nodes` or `get_neighbors`, once under a "
+        "hash-derived name in the background and run it as an installed query once "
+        "installed; until then it is interpreted. Installing a query takes a while, "
+        "so this pays off for shapes that are run many times.",
+    )
+    query_promotion_threshold: Optional[int] = Field(
+        default=None,
+        ge=1,
+        validation_alias="TG_QUERY_PROMOTION_THRESHOLD",
+        description="The number of times a query shape is run through "
+        "`run_interpreted_query` before it is installed in the background. Later "
+        "runs of the shape use the installed query, falling back to interpreting it "
+        "if the installation fails. Disabled if None.",
+    )
+
+    # Result cache
+    result_cache_max_bytes: int = Field(
+        default=0,
+        ge=0,
+        validation_alias="TG_RESULT_CACHE_MAX_BYTES",
+        description="The maximum memory usage in bytes of the results of `get_nodes` "
+        "and `get_neighbors` cached per graph. Writes through the same graph drop the "
+        "cached results of the node and edge types they touch. Disabled if 0.",
+    )
+    result_cache_ttl: Optional[float] = Field(
+        default=None,
+        gt=0,
+        validation_alias="TG_RESULT_CACHE_TTL",
+        description="The number of seconds after which a cached result expires, "
+        "which bounds the staleness caused by writes from other clients. Cached "
+        "results do not expire if None.",
+    )
+
+    # HTTP compression
+    request_compression: bool = Field(
+        default=False,
+        validation_alias="TG_REQUEST_COMPRESSION",
+        description="Whether to compress request bodies for endpoints whose "
+        "`compression` policy in endpoint_definitions.yaml is gzip or deflate. Enable "
+        "it only if the server or its proxy accepts compressed request bodies.",
+    )
+    compression_min_size: int = Field(
+        default=1024,
+        ge=0,
+        validation_alias="TG_COMPRESSION_MIN_SIZE",
+        description="The minimum request body size in bytes worth compressing.",
+    )
+    accept_compressed_responses: bool = Field(
+        default=True,
+        validation_alias="TG_ACCEPT_COMPRESSED_RESPONSES",
+        description="Whether to advertise gzip and deflate in Accept-Encoding so the "
+        "server can compress responses.",
+    )
+
+    # Retry and circuit breaker
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        validation_alias="TG_MAX_RETRIES",
+        description="The maximum number of retries for a failed request. Set to 0 to "
+        "disable retries.",
+    )
+    retry_initial_wait: float = Field(
+        default=0.5,
+        ge=0,
+        validation_alias="TG_RETRY_INITIAL_WAIT",
+        description="The initial backoff in seconds, doubled on every retry and "
+        "randomized by up to the same amount.",
+    )
+    retry_max_wait: float = Field(
+        default=10.0,
+        ge=0,
+        validation_alias="TG_RETRY_MAX_WAIT",
+        description="The maximum wait in seconds between retries, including waits "
+        "requested by a Retry-After header.",
+    )
+    circuit_breaker_threshold: int = Field(
+        default=5,
+        ge=0,
+        validation_alias="TG_CIRCUIT_BREAKER_THRESHOLD",
+        description="The number of consecutive failed requests that opens the circuit "
+        "breaker. Only transport errors and 429, 502, 503 and 504 responses count as "
+        "failures. Set to 0 to disable the circuit breaker.",
+    )
+    circuit_breaker_reset_timeout: float = Field(
+        default=30.0,
+        ge=0,
+        validation_alias="TG_CIRCUIT_BREAKER_RESET_TIMEOUT",
+        description="The number of seconds an open circuit breaker waits before "
+        "letting a trial request through.",
+    )
+
+    # Client-side request limits
+    request_limits: Dict[str, RequestLimitConfig] = Field(
+        default_factory=dict,
+        validation_alias="TG_REQUEST_LIMITS",
+        description="Concurrency and rate limits per endpoint class, e.g. 'gsql', "
+        "'interpret', 'query' or 'upsert', as set by `limit_class` in "
+        "endpoint_definitions.yaml.",
+    )
+
+    # Record and replay
+    transport_mode: Literal["live", "record", "replay"] = Field(
+        default="live",
+        validation_alias="TG_TRANSPORT_MODE",
+        description="'record' saves every request/response pair with its latency to "
+        "`transport_file` when the connection is closed, and 'replay' answers requests "
+        "from that file without any network I/O.",
+    )
+    transport_file: Optional[str] = Field(
+        default=None,
+        validation_alias="TG_TRANSPORT_FILE",
+        description="The gzip-compressed recording file used by the record and replay "
+        "transport modes.",
+    )
+    replay_latency: Literal["none", "recorded"] | float = Field(
+        default="none",
+        validation_alias="TG_REPLAY_LATENCY",
+        description="The latency added to replayed responses: none, the recorded "
+        "latency, or a fixed number of seconds.",
+    )
+
     @model_validator(mode="before")
     def check_exclusive_authentication(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -125,6 +365,25 @@ class TigerGraphConnectionConfig(BaseConfig):
             "You must provide either 'username/password', 'secret', or 'token' for authentication."
         )
 
+    @model_validator(mode="after")
+    def check_transport_file(self) -> "TigerGraphConnectionConfig":
+        """
+        Ensure that a recording file is given for the record and replay modes.
+
+        Returns:
+            The validated config.
+
+        Raises:
+            ValueError: If `transport_mode` is not 'live' and `transport_file` is
+                missing.
+        """
+        if self.transport_mode != "live" and not self.transport_file:
+            raise ValueError(
+                f"'transport_file' is required when 'transport_mode' is "
+                f"'{self.transport_mode}'."
+            )
+        return self
+
     @classmethod
     def create(cls, **kwargs):
         """
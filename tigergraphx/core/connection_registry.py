@@ -0,0 +1,145 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Dict, Iterator
+from contextlib import contextmanager
+import logging
+import threading
+
+from pyTigerGraph import TigerGraphConnection
+
+from tigergraphx.config import TigerGraphConnectionConfig
+from tigergraphx.core.tigergraph_api import TigerGraphAPI
+
+logger = logging.getLogger(__name__)
+
+
+class _RegistryEntry:
+    def __init__(self, tigergraph_api: TigerGraphAPI):
+        self.tigergraph_api = tigergraph_api
+        self.connections: Dict[str, TigerGraphConnection] = {}
+        self.references = 0
+
+
+class ConnectionRegistry:
+    """
+    Process-wide, reference-counted pool of transports keyed by connection config.
+
+    Every `GraphContext` with an equal `TigerGraphConnectionConfig` shares one
+    `TigerGraphAPI`, and thus one pooled session, and one pyTigerGraph connection per
+    graph name. The transports are closed when the last context releases them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _RegistryEntry] = {}
+
+    def acquire(self, config: TigerGraphConnectionConfig) -> TigerGraphAPI:
+        """
+        Take a reference to the transport of a connection config, creating it if needed.
+
+        Args:
+            config: The connection config.
+
+        Returns:
+            The shared TigerGraphAPI. Call `release` with the same config when done.
+        """
+        key = self._get_key(config)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                logger.debug(f"Creating a transport for {config.host}.")
+                entry = _RegistryEntry(TigerGraphAPI(config))
+                self._entries[key] = entry
+            entry.references += 1
+            return entry.tigergraph_api
+
+    def get_connection(
+        self, config: TigerGraphConnectionConfig, graph_name: str
+    ) -> TigerGraphConnection:
+        """
+        Return the shared pyTigerGraph connection of a graph. The config must have been
+        acquired.
+
+        Args:
+            config: The connection config.
+            graph_name: The name of the graph.
+
+        Returns:
+            The shared pyTigerGraph connection.
+        """
+        key = self._get_key(config)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                raise RuntimeError(
+                    "The connection config must be acquired before its connections "
+                    "are used."
+                )
+            connection = entry.connections.get(graph_name)
+            if connection is None:
+                connection = TigerGraphConnection(
+                    graphname=graph_name,
+                    host=str(config.host),
+                    restppPort=config.restpp_port,
+                    gsPort=config.gsql_port,
+                    username=config.username or "",
+                    password=config.password or "",
+                    gsqlSecret=config.secret or "",
+                    apiToken=config.token or "",
+                )
+                entry.connections[graph_name] = connection
+            return connection
+
+    def release(self, config: TigerGraphConnectionConfig) -> None:
+        """
+        Drop a reference taken by `acquire`, closing the transport after the last one.
+
+        Args:
+            config: The connection config.
+        """
+        key = self._get_key(config)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.references -= 1
+            if entry.references > 0:
+                return
+            del self._entries[key]
+        logger.debug(f"Closing the transport for {config.host}.")
+        entry.tigergraph_api.close()
+
+    @contextmanager
+    def hold(self, config: TigerGraphConnectionConfig) -> Iterator[TigerGraphAPI]:
+        """
+        Keep the transport of a config open for the duration of a `with` block.
+        """
+        tigergraph_api = self.acquire(config)
+        try:
+            yield tigergraph_api
+        finally:
+            self.release(config)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return the number of shared transports and of references held to them.
+        """
+        with self._lock:
+            return {
+                "transports": len(self._entries),
+                "references": sum(e.references for e in self._entries.values()),
+                "connections": sum(len(e.connections) for e in self._entries.values()),
+            }
+
+    @staticmethod
+    def _get_key(config: TigerGraphConnectionConfig) -> str:
+        return config.model_dump_json()
+
+
+# The registry shared by all graphs of this process
+connection_registry = ConnectionRegistry()
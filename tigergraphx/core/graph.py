@@ -14,9 +14,11 @@ from tigergraphx.config import (
     TigerGraphConnectionConfig,
     GraphSchema,
     LoadingJobConfig,
+    NodeSpec,
 )
 
 from tigergraphx.core.graph_context import GraphContext
+from tigergraphx.core.connection_registry import connection_registry
 from tigergraphx.core.managers import (
     SchemaManager,
     DataManager,
@@ -26,6 +28,7 @@ from tigergraphx.core.managers import (
     StatisticsManager,
     VectorManager,
 )
+from tigergraphx.core.managers.query_manager import BFSResult, NodeIterator
 
 logger = logging.getLogger(__name__)
 
@@ -116,16 +119,40 @@ class Graph:
         Returns:
             An instance of Graph initialized from the database schema.
         """
-        # Retrieve schema using SchemaManager
-        graph_schema = SchemaManager.get_schema_from_db(
-            graph_name, tigergraph_connection_config
-        )
-        # Initialize the graph with the retrieved schema
-        return cls(
-            graph_schema=graph_schema,
-            tigergraph_connection_config=tigergraph_connection_config,
-            mode="lazy",
-        )
+        if tigergraph_connection_config is None:
+            tigergraph_connection_config = TigerGraphConnectionConfig()
+        else:
+            tigergraph_connection_config = TigerGraphConnectionConfig.ensure_config(
+                tigergraph_connection_config
+            )
+
+        # Hold the transport so that the schema lookup and the graph share it
+        with connection_registry.hold(tigergraph_connection_config):
+            # Retrieve schema using SchemaManager
+            graph_schema = SchemaManager.get_schema_from_db(
+                graph_name, tigergraph_connection_config
+            )
+            # Initialize the graph with the retrieved schema
+            return cls(
+                graph_schema=graph_schema,
+                tigergraph_connection_config=tigergraph_connection_config,
+                mode="lazy",
+            )
+
+    def close(self) -> None:
+        """
+        Release the connection to TigerGraph.
+
+        Graphs with equal connection configs share one connection, which is closed
+        when the last of them is closed. Closing a graph twice has no effect.
+        """
+        self._context.close()
+
+    def __enter__(self) -> "Graph":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     from tigergraphx.core.view.node_view import NodeView
 
@@ -482,6 +509,25 @@ class Graph:
         """
         return self._query_manager.run_query(query_name, params)
 
+    def run_queries(
+        self,
+        queries: Sequence[str | Tuple[str, Dict]],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run pre-installed queries on the graph concurrently.
+
+        Args:
+            queries: The queries, each as a query name or a `(query_name, params)` tuple.
+            max_workers: The maximum number of concurrent queries. Defaults to the
+                connection pool size.
+
+        Returns:
+            The result of each query in order. A query that failed yields the exception
+            it raised instead, so one failure does not discard the others.
+        """
+        return self._query_manager.run_queries(queries, max_workers)
+
     def get_nodes(
         self,
         node_type: Optional[str] = None,
@@ -516,6 +562,56 @@ class Graph:
             limit=limit,
         )
 
+    def iter_nodes(
+        self,
+        node_type: Optional[str] = None,
+        batch_size: int = 10000,
+        return_attributes: Optional[str | List[str]] = None,
+        filter_expression: Optional[str] = None,
+        node_alias: str = "s",
+        output_format: Literal["dataframe", "records"] = "dataframe",
+        cursor: Optional[int] = None,
+    ) -> NodeIterator:
+        """
+        Iterate over the nodes of a type in batches.
+
+        The nodes are paged on the server in the order of their internal IDs, so
+        client memory is bounded by `batch_size` however many nodes the type has.
+        Nodes added while iterating may be skipped.
+
+        GSQL cannot seek to the cursor, so each batch scans all nodes of the type
+        and sorts those after the cursor to keep the first `batch_size`. Iterating
+        over N nodes therefore visits about N * N / batch_size nodes on the
+        server; prefer large batches, and `get_nodes` when the nodes fit in
+        memory at once.
+
+        Args:
+            node_type: Node type to iterate over.
+            batch_size: Maximum number of nodes per batch. Each batch rescans all
+                nodes of the type, so the number of batches, not their size,
+                drives the server cost; keep it in the tens of thousands
+                unless client memory is tight.
+            return_attributes: Attributes to return.
+            filter_expression: Filter expression.
+            node_alias: Alias for the node. Used in filter_expression.
+            output_format: Whether to yield each batch as a DataFrame with the same
+                columns as `get_nodes`, or as a list of records.
+            cursor: The `cursor` of an earlier iterator, to resume after the last
+                batch it yielded.
+
+        Returns:
+            An iterator over batches of nodes. Its `cursor` attribute tracks the
+            progress of the iteration.
+        """
+        node_type = self._validate_node_type(node_type)
+        spec = NodeSpec(
+            node_type=node_type,
+            node_alias=node_alias,
+            filter_expression=filter_expression,
+            return_attributes=return_attributes,
+        )
+        return self._query_manager.iter_nodes(spec, batch_size, output_format, cursor)
+
     def get_neighbors(
         self,
         start_nodes: str | int | List[str | int],
@@ -577,18 +673,20 @@ class Graph:
         limit: Optional[int] = None,
     ) -> pd.DataFrame:
         """
-        Perform BFS traversal from a set of start nodes, using batch processing.
+        Perform BFS traversal from a set of start nodes in a single query.
 
         Args:
             start_nodes: Starting node(s) for BFS.
             node_type: Type of the nodes.
             edge_types: Edge types to consider.
-            limit: Maximum number of neighbors per hop.
-            max_hops: Maximum depth (number of hops) for BFS traversal.
+            limit: Maximum number of new nodes per hop.
+            max_hops: Maximum depth (number of hops) for BFS traversal, or None to
+                traverse until no new nodes are found.
 
         Returns:
-            A DataFrame containing the BFS results with the same structure as get_neighbors(),
-            plus an additional '_bfs_level' column.
+            A DataFrame of the nodes of the last level, i.e. at a distance of
+            `max_hops`, or of the deepest level if `max_hops` is None, with the same
+            structure as get_neighbors(), plus an additional '_bfs_level' column.
         """
         if isinstance(start_nodes, str | int):
             new_start_nodes = self._to_str_node_id(start_nodes)
@@ -605,6 +703,61 @@ class Graph:
             limit=limit,
         )
 
+    def multi_source_bfs(
+        self,
+        start_nodes: str | int | List[str | int],
+        node_type: Optional[str] = None,
+        edge_types: Optional[str | List[str]] = None,
+        max_hops: Optional[int] = None,
+        return_predecessors: bool = False,
+    ) -> BFSResult:
+        """
+        Perform BFS traversal from many start nodes and return every level.
+
+        Unlike `bfs`, which only returns the last level, every reached node is
+        returned with its level and the start node it was reached from, in arrays
+        indexed by node position. With `return_predecessors`, the edges to the
+        previous level are returned as well, to reconstruct shortest paths.
+
+        Args:
+            start_nodes: Starting node(s) for BFS.
+            node_type: Type of the nodes.
+            edge_types: Edge types to consider.
+            max_hops: Maximum depth (number of hops) for BFS traversal, or None to
+                traverse until no new nodes are found.
+            return_predecessors: Whether to return the predecessor edges.
+
+        Returns:
+            The BFS result, with the arrays `node_ids`, `levels`, `sources` and,
+            if requested, `predecessors`.
+        """
+        if isinstance(start_nodes, str | int):
+            new_start_nodes = self._to_str_node_id(start_nodes)
+        else:
+            new_start_nodes = self._to_str_node_ids(start_nodes)
+        node_type = self._validate_node_type(node_type)
+        edge_type_set = self._validate_edge_types_as_set(edge_types)
+
+        return self._query_manager.multi_source_bfs(
+            start_nodes=new_start_nodes,
+            node_type=node_type,
+            edge_type_set=edge_type_set,
+            max_hops=max_hops,
+            return_predecessors=return_predecessors,
+        )
+
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get the statistics of the cache of `get_nodes` and `get_neighbors` results.
+
+        The cache is enabled by `result_cache_max_bytes` in the connection config.
+
+        Returns:
+            The hits, misses, hit rate, evictions and invalidations so far, and the
+            current number of entries and bytes.
+        """
+        return self._query_manager.get_result_cache_stats()
+
     # ------------------------------ Vector Operations ------------------------------
     def upsert(
         self,
@@ -9,11 +9,13 @@ from typing import Dict, Optional
 from pathlib import Path
 import logging
 
-from pyTigerGraph import TigerGraphConnection
 from tigergraphx.config import (
     TigerGraphConnectionConfig,
     GraphSchema,
 )
+from tigergraphx.core.connection_registry import connection_registry
+from tigergraphx.core.result_cache import ResultCache
+from tigergraphx.utils.json_codec import get_json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +39,29 @@ class GraphContext:
                 tigergraph_connection_config
             )
         logger.debug(f"tigergraph_connection_config: {tigergraph_connection_config}")
-        self.connection = TigerGraphConnection(
-            graphname=self.graph_schema.graph_name,
-            host=str(tigergraph_connection_config.host),
-            restppPort=tigergraph_connection_config.restpp_port,
-            gsPort=tigergraph_connection_config.gsql_port,
-            username=tigergraph_connection_config.username or "",
-            password=tigergraph_connection_config.password or "",
-            gsqlSecret=tigergraph_connection_config.secret or "",
-            apiToken=tigergraph_connection_config.token or "",
+        self.tigergraph_connection_config = tigergraph_connection_config
+
+        # Reuse the transports of other contexts with an equal connection config
+        self._closed = False
+        self.tigergraph_api = connection_registry.acquire(tigergraph_connection_config)
+        self.connection = connection_registry.get_connection(
+            tigergraph_connection_config, self.graph_schema.graph_name
         )
+
+        # JSON codec for payloads serialized outside of pyTigerGraph
+        self.json_codec = get_json_codec(tigergraph_connection_config.json_codec)
+
+        # Results of reads, dropped by the writes made through this context
+        self.result_cache = ResultCache(
+            tigergraph_connection_config.result_cache_max_bytes,
+            tigergraph_connection_config.result_cache_ttl,
+        )
+
+    def close(self) -> None:
+        """
+        Release the shared transports. They are closed once no context uses them.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        connection_registry.release(self.tigergraph_connection_config)
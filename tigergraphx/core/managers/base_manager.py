@@ -11,4 +11,7 @@ from tigergraphx.core.graph_context import GraphContext
 class BaseManager:
     def __init__(self, context: GraphContext):
         self._connection = context.connection
+        self._tigergraph_api = context.tigergraph_api
         self._graph_schema = context.graph_schema
+        self._json_codec = context.json_codec
+        self._result_cache = context.result_cache
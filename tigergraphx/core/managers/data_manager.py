@@ -29,7 +29,11 @@ class DataManager(BaseManager):
         )
         gsql_script = self._create_gsql_load_data(loading_job_config)
 
-        result = self._connection.gsql(gsql_script)
+        try:
+            result = self._connection.gsql(gsql_script)
+        finally:
+            # A loading job may write to any node or edge type
+            self._result_cache.invalidate()
         graph_name = self._graph_schema.graph_name
         if "LOAD SUCCESSFUL for loading jobid" not in result:
             error_msg = f"Data load process failed. GSQL response: {result}"
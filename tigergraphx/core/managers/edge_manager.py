@@ -30,12 +30,19 @@ class EdgeManager(BaseManager):
         **attr,
     ):
         try:
-            self._connection.upsertEdge(
-                src_node_type, src_node_id, edge_type, tgt_node_type, tgt_node_id, attr
+            self._tigergraph_api.upsert_edges(
+                self._graph_schema.graph_name,
+                src_node_type,
+                edge_type,
+                tgt_node_type,
+                [(src_node_id, tgt_node_id, attr)],
             )
         except Exception as e:
             logger.error(f"Error adding from {src_node_id} to {tgt_node_id}: {e}")
             return None
+        finally:
+            # Upserting an edge also creates missing source and target nodes
+            self._result_cache.invalidate([src_node_type, edge_type, tgt_node_type])
 
     def add_edges_from(
         self,
@@ -45,16 +52,25 @@ class EdgeManager(BaseManager):
         tgt_node_type: str,
     ) -> Optional[int]:
         try:
-            result = self._connection.upsertEdges(
-                sourceVertexType=src_node_type,
-                edgeType=edge_type,
-                targetVertexType=tgt_node_type,
-                edges=normalized_edges,
+            # Upsert all edges of the type with one REST++ request
+            result = self._tigergraph_api.upsert_edges(
+                self._graph_schema.graph_name,
+                src_node_type,
+                edge_type,
+                tgt_node_type,
+                normalized_edges,
             )
-            return result
+            if result["skipped_edges"]:
+                logger.warning(
+                    f"Skipped {result['skipped_edges']} of {len(normalized_edges)} "
+                    f"edges of type '{edge_type}'."
+                )
+            return result["accepted_edges"]
         except Exception as e:
             logger.error(f"Error adding edges: {e}")
             return None
+        finally:
+            self._result_cache.invalidate([src_node_type, edge_type, tgt_node_type])
 
     def has_edge(
         self,
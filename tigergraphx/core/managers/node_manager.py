@@ -22,35 +22,53 @@ class NodeManager(BaseManager):
 
     def add_node(self, node_id: str, node_type: str, **attr):
         try:
-            self._connection.upsertVertex(node_type, node_id, attr)
+            self._tigergraph_api.upsert_vertices(
+                self._graph_schema.graph_name, node_type, [(node_id, attr)]
+            )
         except Exception as e:
             logger.error(f"Error adding node {node_id}: {e}")
             return None
+        finally:
+            self._result_cache.invalidate([node_type])
 
     def add_nodes_from(
         self,
         normalized_nodes: List[Tuple[str, Dict[str, Any]]],
         node_type: str,
     ) -> Optional[int]:
-        # Call upsertVertices with the list of nodes and attributes
+        # Upsert all nodes of the type with one REST++ request
         try:
-            result = self._connection.upsertVertices(
-                vertexType=node_type, vertices=normalized_nodes
+            result = self._tigergraph_api.upsert_vertices(
+                self._graph_schema.graph_name, node_type, normalized_nodes
             )
-            return result
+            if result["skipped_vertices"]:
+                logger.warning(
+                    f"Skipped {result['skipped_vertices']} of {len(normalized_nodes)} "
+                    f"nodes of type '{node_type}'."
+                )
+            return result["accepted_vertices"]
         except Exception as e:
             logger.error(f"Error adding nodes: {e}")
             return None
+        finally:
+            self._result_cache.invalidate([node_type])
 
     def remove_node(self, node_id: str, node_type: str) -> bool:
         try:
-            if self._connection.delVerticesById(node_type, node_id) > 0:
+            deleted = self._tigergraph_api.delete_vertices(
+                self._graph_schema.graph_name, node_type, [node_id]
+            )
+            if deleted > 0:
                 return True
             else:
                 return False
         except Exception as e:
             logger.error(f"Error removing node {node_id}: {e}")
             return False
+        finally:
+            # Deleting a node also deletes its edges, but every cached result that
+            # traverses them starts or ends at the node type
+            self._result_cache.invalidate([node_type])
 
     def has_node(self, node_id: str, node_type: str) -> bool:
         try:
@@ -84,7 +102,7 @@ class NodeManager(BaseManager):
             params = {
                 "input": node_id,
             }
-            result = self._connection.runInterpretedQuery(gsql_script, params)
+            result = self._tigergraph_api.run_generated_query(gsql_script, params)
             if result and isinstance(result, list):
                 return result[0].get("edges")
         except Exception as e:
@@ -95,11 +113,15 @@ class NodeManager(BaseManager):
         try:
             # Attempt to delete vertices for each node type
             for node_type in self._graph_schema.nodes:
-                self._connection.delVertices(node_type)
+                self._tigergraph_api.delete_vertices(
+                    self._graph_schema.graph_name, node_type
+                )
             return True
         except Exception as e:
             logger.error(f"Error clearing graph: {e}")
             return False
+        finally:
+            self._result_cache.invalidate()
 
     def _create_gsql_get_node_edges(
         self, node_type: str, edge_types: Optional[Set[str]] = None
@@ -117,7 +139,7 @@ class NodeManager(BaseManager):
                 edge_type = edge_types if isinstance(edge_types, str) else edge_types[0]
                 from_clause = f"FROM Nodes:s -({edge_type}:e)- :t"
             else:
-                edge_types_str = "|".join(edge_types)
+                edge_types_str = "|".join(sorted(edge_types))
                 from_clause = f"FROM Nodes:s -({edge_types_str}:e)- :t"
 
         # Generate the query
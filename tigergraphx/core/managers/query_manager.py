@@ -6,7 +6,10 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 import logging
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Any, List, Dict, Literal, Optional, Sequence, Set, Tuple
+from functools import lru_cache
+from urllib.parse import quote
+import numpy as np
 import pandas as pd
 
 from tigergraphx.config import (
@@ -17,24 +20,57 @@ from tigergraphx.config import (
 from .base_manager import BaseManager
 
 from tigergraphx.core.graph_context import GraphContext
+from tigergraphx.core.result_cache import ANY_TYPE
+from tigergraphx.core.result_decoder import ResultDecoder
 
 
 logger = logging.getLogger(__name__)
 
+# The maximum number of generated query texts cached per query kind
+GSQL_CACHE_SIZE = 1024
+
 
 class QueryManager(BaseManager):
     def __init__(self, context: GraphContext):
         super().__init__(context)
+        config = self._tigergraph_api.config
+        self._result_decoder = ResultDecoder(
+            self._graph_schema,
+            backend=config.result_backend,
+            dtypes=config.result_dtypes,
+            string_dtype=config.result_string_dtype,
+        )
 
     def run_query(self, query_name: str, params: Dict = {}):
         try:
-            return self._connection.runInstalledQuery(
-                queryName=query_name, params=params
+            return self._tigergraph_api.run_installed_query(
+                self._graph_schema.graph_name, query_name, params
             )
         except Exception as e:
             logger.error(f"Error running query {query_name}: {e}")
             return None
 
+    def run_queries(
+        self,
+        queries: Sequence[str | Tuple[str, Dict]],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        jobs = []
+        for query in queries:
+            query_name, params = (query, {}) if isinstance(query, str) else query
+            jobs.append(
+                {
+                    "graph_name": self._graph_schema.graph_name,
+                    "query_name": query_name,
+                    "params": params,
+                }
+            )
+        results = self._tigergraph_api.run_many(jobs, max_workers=max_workers)
+        for job, result in zip(jobs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error running query {job['query_name']}: {result}")
+        return results
+
     def get_nodes(
         self,
         node_type: Optional[str] = None,
@@ -63,47 +99,84 @@ class QueryManager(BaseManager):
         Core function to retrieve nodes based on a NodeSpec object.
         """
         gsql_script = self._create_gsql_get_nodes(spec)
+        cache_key = ("nodes", gsql_script)
+        df = self._result_cache.get(cache_key)
+        if df is not None:
+            return df
+        generation = self._result_cache.generation
         try:
-            result = self._connection.runInterpretedQuery(gsql_script)
-            if not result or not isinstance(result, list):
-                return pd.DataFrame()
-            nodes = result[0].get("Nodes")
-            if not nodes or not isinstance(nodes, list):
-                return pd.DataFrame()
-            df = pd.DataFrame(pd.json_normalize(nodes))
-            if df.empty:
-                return pd.DataFrame()
-            attribute_columns = [
-                col for col in df.columns if col.startswith("attributes.")
-            ]
-            if spec.return_attributes is None:
-                rename_map = {
-                    col: col.replace("attributes.", "") for col in attribute_columns
-                }
-                reordered_columns = []
-            else:
-                rename_map = {
-                    f"attributes.{attr}": attr for attr in spec.return_attributes
-                }
-                reordered_columns = [
-                    attr
-                    for attr in spec.return_attributes
-                    if attr in rename_map.values()
-                ]
-            df.rename(columns=rename_map, inplace=True)
-            drop_columns = []
-            if spec.return_attributes is not None:
-                drop_columns = ["v_id"]
-                if spec.node_type is not None and "v_type" in df.columns:
-                    drop_columns.append("v_type")
-            df.drop(columns=drop_columns, inplace=True)
-            remaining_columns = [
-                col for col in df.columns if col not in reordered_columns
-            ]
-            return pd.DataFrame(df[reordered_columns + remaining_columns])
+            result = self._tigergraph_api.run_generated_query(gsql_script)
+            df = self._get_nodes_dataframe(result, spec)
         except Exception as e:
             logger.error(f"Error retrieving nodes for type {spec.node_type}: {e}")
-        return pd.DataFrame()
+            return pd.DataFrame()
+        self._result_cache.put(
+            cache_key,
+            df,
+            [ANY_TYPE if spec.all_node_types else str(spec.node_type)],
+            generation,
+        )
+        return df
+
+    def _get_nodes_dataframe(self, result: Any, spec: NodeSpec) -> pd.DataFrame:
+        """
+        Converts the result of a get_nodes query into a DataFrame.
+        """
+        if not result or not isinstance(result, list):
+            return pd.DataFrame()
+        nodes = result[0].get("Nodes")
+        if not nodes or not isinstance(nodes, list):
+            return pd.DataFrame()
+        if spec.return_attributes is None:
+            meta_columns = ["v_id", "v_type"]
+        else:
+            meta_columns = [] if spec.node_type is not None else ["v_type"]
+        return self._result_decoder.decode_vertices(
+            nodes,
+            node_types=None if spec.all_node_types else [str(spec.node_type)],
+            return_attributes=spec.return_attributes,
+            meta_columns=meta_columns,
+            meta_first=spec.return_attributes is None,
+        )
+
+    def iter_nodes(
+        self,
+        spec: NodeSpec,
+        batch_size: int = 10000,
+        output_format: Literal["dataframe", "records"] = "dataframe",
+        cursor: Optional[int] = None,
+    ) -> "NodeIterator":
+        """
+        Pages through the nodes of a NodeSpec in the order of their internal IDs.
+        """
+        if spec.node_type is None:
+            raise ValueError("A node type is required to iterate over nodes.")
+        if batch_size < 1:
+            raise ValueError("The batch size must be positive.")
+        return NodeIterator(
+            self, spec, batch_size, output_format, cursor if cursor is not None else -1
+        )
+
+    def _get_node_batch(
+        self, spec: NodeSpec, batch_size: int, after_vid: int
+    ) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Retrieves the next page of nodes after an internal ID.
+        Returns the nodes and the largest internal ID among them.
+        """
+        gsql_script = self._create_gsql_iter_nodes(spec)
+        result = self._tigergraph_api.run_generated_query(
+            gsql_script, {"after_vid": after_vid, "batch_size": batch_size}
+        )
+        if not result or not isinstance(result, list):
+            return [], None
+        nodes = result[0].get("Nodes")
+        if not nodes or not isinstance(nodes, list):
+            return [], None
+        # The internal ID is only needed for the cursor
+        key = "@tgx_vid" if spec.return_attributes is None else "tgx_vid"
+        last_vid = max(int(node["attributes"].pop(key)) for node in nodes)
+        return nodes, last_vid
 
     def get_neighbors(
         self,
@@ -140,46 +213,90 @@ class QueryManager(BaseManager):
         """
         Core function to retrieve neighbors based on a NeighborSpec object.
         """
-        gsql_script, params = self._create_gsql_get_neighbors(spec)
+        gsql_script, param_chunks = self._create_gsql_get_neighbors(spec)
+        start_nodes = (
+            {spec.start_nodes}
+            if isinstance(spec.start_nodes, str)
+            else set(spec.start_nodes)
+        )
+        # The start nodes are a set, so their order does not change the result
+        cache_key = ("neighbors", gsql_script, tuple(sorted(start_nodes)))
+        df = self._result_cache.get(cache_key)
+        if df is not None:
+            return df
+        generation = self._result_cache.generation
         try:
-            result = self._connection.runInterpretedQuery(gsql_script, params)
-            if not result or not isinstance(result, list):
-                return pd.DataFrame()
-            neighbors = result[0].get("Neighbors")
-            if not neighbors or not isinstance(neighbors, list):
-                return pd.DataFrame()
-            df = pd.DataFrame(pd.json_normalize(neighbors))
-            if df.empty:
-                return pd.DataFrame()
-            attribute_columns = [
-                col for col in df.columns if col.startswith("attributes.")
-            ]
-            if spec.return_attributes is None:
-                rename_map = {
-                    col: col.replace("attributes.", "") for col in attribute_columns
-                }
-                reordered_columns = []
-            else:
-                rename_map = {
-                    f"attributes.{attr}": attr for attr in spec.return_attributes
-                }
-                reordered_columns = [
-                    attr
-                    for attr in spec.return_attributes
-                    if attr in rename_map.values()
-                ]
-            df.rename(columns=rename_map, inplace=True)
-            drop_columns = [col for col in ["v_id", "v_type"] if col in df.columns]
-            df.drop(columns=drop_columns, inplace=True)
-            remaining_columns = [
-                col for col in df.columns if col not in reordered_columns
-            ]
-            return pd.DataFrame(df[reordered_columns + remaining_columns])
+            neighbors = self._run_neighbor_query(gsql_script, param_chunks, spec.limit)
+            df = self._get_neighbors_dataframe(neighbors, spec)
         except Exception as e:
             logger.error(
                 f"Error retrieving neighbors for node(s) {spec.start_nodes}: {e}"
             )
-        return pd.DataFrame()
+            return pd.DataFrame()
+        self._result_cache.put(
+            cache_key, df, self._get_neighbor_spec_types(spec), generation
+        )
+        return df
+
+    def _get_neighbors_dataframe(
+        self, neighbors: List[Dict], spec: NeighborSpec
+    ) -> pd.DataFrame:
+        """
+        Converts the neighbors returned by a get_neighbors query into a DataFrame.
+        """
+        return self._result_decoder.decode_vertices(
+            neighbors,
+            node_types=spec.target_node_type_set,
+            return_attributes=spec.return_attributes,
+            meta_columns=[],
+        )
+
+    @staticmethod
+    def _get_neighbor_spec_types(spec: NeighborSpec) -> List[str]:
+        """
+        Returns the node and edge types a get_neighbors query reads from.
+        """
+        types = [spec.start_node_type]
+        for type_set in [spec.edge_type_set, spec.target_node_type_set]:
+            types.extend(type_set if type_set is not None else [ANY_TYPE])
+        return types
+
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        return self._result_cache.get_stats()
+
+    def _run_neighbor_query(
+        self, gsql_script: str, param_chunks: List[str], limit: Optional[int]
+    ) -> List[Dict]:
+        """
+        Runs a neighbor query once per chunk of start nodes and merges the neighbors.
+        """
+        if len(param_chunks) == 1:
+            results = [
+                self._tigergraph_api.run_generated_query(gsql_script, param_chunks[0])
+            ]
+        else:
+            results = self._tigergraph_api.run_many(
+                [{"query": gsql_script, "params": params} for params in param_chunks]
+            )
+        neighbors = []
+        seen = set()
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+            if not result or not isinstance(result, list):
+                continue
+            chunk = result[0].get("Neighbors")
+            if not chunk or not isinstance(chunk, list):
+                continue
+            if len(results) == 1:
+                return chunk
+            # Chunks may reach the same neighbor
+            for neighbor in chunk:
+                key = (neighbor.get("v_id"), neighbor.get("v_type"))
+                if key not in seen:
+                    seen.add(key)
+                    neighbors.append(neighbor)
+        return neighbors[:limit] if limit else neighbors
 
     def bfs(
         self,
@@ -190,24 +307,89 @@ class QueryManager(BaseManager):
         limit: Optional[int] = None,
     ) -> pd.DataFrame:
         """
-        Perform BFS traversal from a set of start nodes, using batch processing.
+        Perform BFS traversal from a set of start nodes in a single query.
+
+        The query keeps a visited accumulator on the server and expands the frontier
+        in a WHILE loop, so the frontier never leaves the server. Only start nodes
+        that do not fit into one query string fall back to one query per hop.
 
         Args:
             start_nodes: Starting node(s) for BFS.
             node_type: Type of the nodes.
             edge_type_set: Edge types to consider.
-            max_hops: Maximum depth (number of hops) for BFS traversal.
-            limit: Maximum number of neighbors per hop.
+            max_hops: Maximum depth (number of hops) for BFS traversal, or None to
+                traverse until no new nodes are found.
+            limit: Maximum number of new nodes per hop.
 
         Returns:
-            A DataFrame containing the BFS results with the same structure as get_neighbors(),
-            plus an additional '_bfs_level' column.
+            A DataFrame of the nodes of the last level, i.e. at a distance of
+            `max_hops`, or of the deepest level if `max_hops` is None, with the same
+            structure as get_neighbors(), plus an additional '_bfs_level' column. The
+            DataFrame is empty if no node is that far from the start nodes.
         """
-        start_node_set = (
-            {start_nodes} if isinstance(start_nodes, str) else set(start_nodes)
+        start_node_list = (
+            [start_nodes] if isinstance(start_nodes, str) else list(start_nodes)
         )
-        visited = start_node_set.copy()
-        queue = start_node_set.copy()
+        gsql_script, param_chunks = self._create_gsql_bfs(
+            start_node_list, node_type, edge_type_set, max_hops, limit
+        )
+        if len(param_chunks) > 1:
+            return self._bfs_by_hops(
+                start_node_list, node_type, edge_type_set, max_hops, limit
+            )
+
+        cache_key = ("bfs", gsql_script, param_chunks[0])
+        df = self._result_cache.get(cache_key)
+        if df is not None:
+            return df
+        generation = self._result_cache.generation
+        try:
+            result = self._tigergraph_api.run_generated_query(
+                gsql_script, param_chunks[0]
+            )
+            nodes = self._get_bfs_nodes(result)
+            df = self._result_decoder.decode_vertices(
+                nodes, node_types=[node_type], meta_columns=[]
+            )
+        except Exception as e:
+            logger.error(f"Error running BFS from node(s) {start_nodes}: {e}")
+            return pd.DataFrame()
+        types = [node_type]
+        types.extend(edge_type_set if edge_type_set is not None else [ANY_TYPE])
+        self._result_cache.put(cache_key, df, types, generation)
+        return df
+
+    @staticmethod
+    def _get_bfs_nodes(result: Any) -> List[Dict]:
+        """
+        Returns the nodes printed by a BFS query, with their level as the attribute
+        `_bfs_level`.
+        """
+        if not result or not isinstance(result, list):
+            return []
+        nodes = result[0].get("Result")
+        if not nodes or not isinstance(nodes, list):
+            return []
+        for node in nodes:
+            attributes = node["attributes"]
+            attributes.pop("@tgx_visited", None)
+            attributes["_bfs_level"] = attributes.pop("@tgx_level")
+        return nodes
+
+    def _bfs_by_hops(
+        self,
+        start_nodes: List[str],
+        node_type: str,
+        edge_type_set: Optional[Set[str]],
+        max_hops: Optional[int],
+        limit: Optional[int],
+    ) -> pd.DataFrame:
+        """
+        Perform BFS traversal with one get_neighbors() query per hop, for start nodes
+        that do not fit into the query string of a single BFS query.
+        """
+        visited = set(start_nodes)
+        queue = set(start_nodes)
         level = 0  # BFS level counter
         last_level_df = pd.DataFrame()
         primary_key = self._graph_schema.nodes[node_type].primary_key
@@ -228,110 +410,494 @@ class QueryManager(BaseManager):
             if not next_queue:
                 break  # No new nodes to explore
 
-            if max_hops and level == max_hops - 1:
-                last_level_df = pd.DataFrame(df[~df[primary_key].isin(list(visited))])
-
+            level += 1  # Increment BFS depth
+            last_level_df = pd.DataFrame(df[~df[primary_key].isin(list(visited))])
+            last_level_df["_bfs_level"] = level
             visited.update(next_queue)
             queue = next_queue
-            level += 1  # Increment BFS depth
 
+        if max_hops and level < max_hops:
+            return pd.DataFrame()
         return last_level_df
 
-    def _create_gsql_get_nodes(self, spec: NodeSpec) -> str:
+    def multi_source_bfs(
+        self,
+        start_nodes: str | List[str],
+        node_type: str,
+        edge_type_set: Optional[Set[str]] = None,
+        max_hops: Optional[int] = None,
+        return_predecessors: bool = False,
+    ) -> "BFSResult":
         """
-        Core function to generate a GSQL query based on a NodeSpec object.
+        Perform BFS traversal from many start nodes at once and keep every level.
+
+        Start nodes that do not fit into one query string are split into chunks,
+        each traversed by its own query, and the levels are merged by keeping the
+        smallest distance of each node.
+
+        Args:
+            start_nodes: Starting node(s) for BFS.
+            node_type: Type of the nodes.
+            edge_type_set: Edge types to consider.
+            max_hops: Maximum depth (number of hops) for BFS traversal, or None to
+                traverse until no new nodes are found.
+            return_predecessors: Whether to return the predecessor edges, i.e. the
+                edges that connect each node to nodes of the previous level.
+
+        Returns:
+            The reached nodes, including the start nodes at level 0, with their
+            levels and sources of origin. The result is empty if the query fails.
         """
-        graph_name = self._graph_schema.graph_name
-        node_type_str = f"{spec.node_type}.*" if not spec.all_node_types else "ANY"
-        filter_expression_str = (
-            f"WHERE {spec.filter_expression}" if spec.filter_expression else ""
+        start_node_list = (
+            [start_nodes] if isinstance(start_nodes, str) else list(start_nodes)
         )
-        limit_clause = f"LIMIT {spec.limit}" if spec.limit else ""
-        return_attributes = spec.return_attributes or []
+        gsql_script, param_chunks = self._create_gsql_multi_source_bfs(
+            start_node_list, node_type, edge_type_set, max_hops, return_predecessors
+        )
+        try:
+            nodes = self._run_multi_source_bfs_query(gsql_script, param_chunks)
+        except Exception as e:
+            logger.error(f"Error running BFS from node(s) {start_nodes}: {e}")
+            nodes = []
+        return BFSResult.from_nodes(nodes, return_predecessors)
 
-        # Generate the base query
-        query = f"""
-INTERPRET QUERY() FOR GRAPH {graph_name} {{
-  Nodes = {{{node_type_str}}};
-"""
-        # Add SELECT block only if filter or limit is specified
-        if filter_expression_str or limit_clause:
-            query += f"""  Nodes =
-    SELECT {spec.node_alias}
-    FROM Nodes:{spec.node_alias}
-"""
-            if filter_expression_str:
-                query += f"    {filter_expression_str}\n"
-            if limit_clause:
-                query += f"    {limit_clause}\n"
-            query += "  ;\n"
-
-        # Add PRINT statement
-        if return_attributes:
-            prefixed_attributes = ",\n    ".join(
-                [f"Nodes.{attr} AS {attr}" for attr in return_attributes]
-            )
-            query += f"  PRINT Nodes[\n    {prefixed_attributes}\n  ];"
+    def _run_multi_source_bfs_query(
+        self, gsql_script: str, param_chunks: List[str]
+    ) -> List[Dict]:
+        """
+        Runs a multi-source BFS query once per chunk of start nodes and returns the
+        reached nodes of all chunks.
+        """
+        if len(param_chunks) == 1:
+            results = [
+                self._tigergraph_api.run_generated_query(gsql_script, param_chunks[0])
+            ]
         else:
-            query += "  PRINT Nodes;"
+            results = self._tigergraph_api.run_many(
+                [{"query": gsql_script, "params": params} for params in param_chunks]
+            )
+        nodes = []
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+            if result and isinstance(result, list):
+                nodes.extend(result[0].get("Reached") or [])
+        return nodes
+
+    def _create_gsql_get_nodes(self, spec: NodeSpec) -> str:
+        """
+        Core function to generate a GSQL query based on a NodeSpec object.
+        """
+        return _build_get_nodes_query(
+            self._graph_schema.graph_name,
+            f"{spec.node_type}.*" if not spec.all_node_types else "ANY",
+            spec.node_alias,
+            spec.filter_expression or None,
+            spec.limit or None,
+            self._get_attribute_key(spec.return_attributes) or (),
+        )
 
-        query += "\n}"
-        return query.strip()
+    def _create_gsql_iter_nodes(self, spec: NodeSpec) -> str:
+        """
+        Core function to generate the paging GSQL query of a NodeSpec.
+        """
+        return _build_iter_nodes_query(
+            self._graph_schema.graph_name,
+            str(spec.node_type),
+            spec.node_alias,
+            spec.filter_expression or None,
+            self._get_attribute_key(spec.return_attributes),
+        )
 
-    def _create_gsql_get_neighbors(self, spec: NeighborSpec) -> Tuple[str, str]:
+    def _create_gsql_get_neighbors(
+        self, spec: NeighborSpec
+    ) -> Tuple[str, List[str]]:
         """
         Core function to generate a GSQL query based on a NeighborSpec object.
+        Returns the query and its start nodes as one or more encoded query strings.
         """
-        # Normalize fields to lists
-        graph_name = self._graph_schema.graph_name
-        params = "&".join(
-            [
-                f"start_nodes={node}"
-                for node in (
-                    [spec.start_nodes]
-                    if isinstance(spec.start_nodes, str)
-                    else spec.start_nodes
-                )
-            ]
+        params = self._encode_vertex_set_parameter(
+            "start_nodes",
+            (
+                [spec.start_nodes]
+                if isinstance(spec.start_nodes, str)
+                else spec.start_nodes
+            ),
+            self._tigergraph_api.config.max_query_string_length,
         )
-        return_attributes = (
-            [spec.return_attributes]
-            if isinstance(spec.return_attributes, str)
-            else spec.return_attributes
+        query = _build_get_neighbors_query(
+            self._graph_schema.graph_name,
+            spec.start_node_type,
+            spec.start_node_alias,
+            self._get_type_set_key(spec.edge_type_set),
+            spec.edge_alias,
+            self._get_type_set_key(spec.target_node_type_set),
+            spec.target_node_alias,
+            spec.filter_expression or None,
+            spec.limit or None,
+            self._get_attribute_key(spec.return_attributes),
         )
+        return (query, params)
+
+    def _create_gsql_bfs(
+        self,
+        start_nodes: List[str],
+        node_type: str,
+        edge_type_set: Optional[Set[str]],
+        max_hops: Optional[int],
+        limit: Optional[int],
+    ) -> Tuple[str, List[str]]:
+        """
+        Generates the GSQL query of a BFS traversal.
+        Returns the query and its parameters as one or more encoded query strings.
+        """
+        max_hops_param = f"max_hops={max_hops or 0}"
+        params = self._encode_vertex_set_parameter(
+            "start_nodes",
+            start_nodes,
+            self._tigergraph_api.config.max_query_string_length
+            - len(max_hops_param)
+            - 1,
+        )
+        query = _build_bfs_query(
+            self._graph_schema.graph_name,
+            node_type,
+            self._get_type_set_key(edge_type_set),
+            limit or None,
+        )
+        return (query, [f"{chunk}&{max_hops_param}" for chunk in params])
+
+    def _create_gsql_multi_source_bfs(
+        self,
+        start_nodes: List[str],
+        node_type: str,
+        edge_type_set: Optional[Set[str]],
+        max_hops: Optional[int],
+        return_predecessors: bool,
+    ) -> Tuple[str, List[str]]:
+        """
+        Generates the GSQL query of a multi-source BFS traversal.
+        Returns the query and its parameters as one or more encoded query strings.
+        """
+        max_hops_param = f"max_hops={max_hops or 0}"
+        params = self._encode_vertex_set_parameter(
+            "start_nodes",
+            start_nodes,
+            self._tigergraph_api.config.max_query_string_length
+            - len(max_hops_param)
+            - 1,
+        )
+        query = _build_multi_source_bfs_query(
+            self._graph_schema.graph_name,
+            node_type,
+            self._get_type_set_key(edge_type_set),
+            return_predecessors,
+        )
+        return (query, [f"{chunk}&{max_hops_param}" for chunk in params])
+
+    @staticmethod
+    def _get_type_set_key(type_set: Optional[Set[str]]) -> Optional[Tuple[str, ...]]:
+        """
+        Canonicalizes a set of types as a sorted tuple, so that equal sets always
+        produce the same query text.
+        """
+        return tuple(sorted(type_set)) if type_set is not None else None
 
-        # Handle filter expression
-        filter_expression = spec.filter_expression
-        filter_expression_str = (
-            filter_expression if isinstance(filter_expression, str) else None
+    @staticmethod
+    def _get_attribute_key(
+        return_attributes: Optional[str | List[str]],
+    ) -> Optional[Tuple[str, ...]]:
+        """
+        Converts the attributes to return into a tuple, keeping their order.
+        """
+        if return_attributes is None:
+            return None
+        if isinstance(return_attributes, str):
+            return (return_attributes,)
+        return tuple(return_attributes)
+
+    @staticmethod
+    def _encode_vertex_set_parameter(
+        name: str, vertex_ids: List[str], max_length: int
+    ) -> List[str]:
+        """
+        Encodes a `SET<VERTEX<T>>` parameter as query strings of at most `max_length`.
+
+        Interpreted queries only take parameters in the URL, so large vertex sets are
+        split into several query strings, each to be sent with its own request.
+        """
+        prefix = f"{quote(name, safe='')}="
+        items = [prefix + quote(str(vertex_id), safe="") for vertex_id in vertex_ids]
+        chunks: List[str] = []
+        start = 0
+        length = -1
+        for i, item in enumerate(items):
+            # Each item after the first in a chunk adds a separating "&"
+            if length + 1 + len(item) > max_length and i > start:
+                chunks.append("&".join(items[start:i]))
+                start = i
+                length = -1
+            length += 1 + len(item)
+        chunks.append("&".join(items[start:]))
+        return chunks
+
+
+class NodeIterator:
+    """
+    Iterator over the nodes of one type in batches, as returned by `Graph.iter_nodes`.
+
+    Nodes are paged in the order of their internal IDs, so only one batch is held in
+    memory at a time. `cursor` is the internal ID of the last node of the last batch
+    that was fully consumed; passing it to `Graph.iter_nodes` resumes after it, e.g.
+    when a request failed or the processing of a batch raised an exception.
+    """
+
+    def __init__(
+        self,
+        query_manager: QueryManager,
+        spec: NodeSpec,
+        batch_size: int,
+        output_format: Literal["dataframe", "records"],
+        cursor: int,
+    ):
+        self._query_manager = query_manager
+        self._spec = spec
+        self._batch_size = batch_size
+        self._output_format = output_format
+        self.cursor = cursor
+        self._next_cursor: Optional[int] = cursor
+        self._done = False
+
+    def __iter__(self) -> "NodeIterator":
+        return self
+
+    def __next__(self) -> pd.DataFrame | List[Dict]:
+        # The previous batch was consumed once the next one is requested
+        if self._next_cursor is not None:
+            self.cursor = self._next_cursor
+        if self._done:
+            raise StopIteration
+        nodes, last_vid = self._query_manager._get_node_batch(
+            self._spec, self._batch_size, self.cursor
         )
+        if not nodes:
+            self._done = True
+            raise StopIteration
+        self._done = len(nodes) < self._batch_size
+        self._next_cursor = last_vid
+        df = self._query_manager._get_nodes_dataframe([{"Nodes": nodes}], self._spec)
+        if self._output_format == "records":
+            return df.to_dict(orient="records")
+        return df
+
+
+class BFSResult:
+    """
+    The result of a multi-source BFS traversal, as returned by
+    `Graph.multi_source_bfs`.
+
+    Nodes are numbered by their position in `node_ids`, sorted by level, and the
+    other arrays refer to nodes by these positions, which keeps large traversals
+    compact and ready for vectorized processing.
+
+    Attributes:
+        node_ids: The IDs of the reached nodes, starting with the start nodes.
+        levels: The level, i.e. the number of hops from the nearest start node, of
+            each node.
+        sources: The position of the start node each node was reached from. A node
+            reached from several start nodes at the same level keeps one of them.
+        predecessors: If requested, an array of shape (n, 2) of the positions of the
+            predecessor and of the node of each predecessor edge, or None.
+    """
+
+    def __init__(
+        self,
+        node_ids: np.ndarray,
+        levels: np.ndarray,
+        sources: np.ndarray,
+        predecessors: Optional[np.ndarray] = None,
+    ):
+        self.node_ids = node_ids
+        self.levels = levels
+        self.sources = sources
+        self.predecessors = predecessors
+        self._index = pd.Index(node_ids)
 
-        # Prepare components
-        start_node_type = spec.start_node_type
-        edge_types_str = (
-            f"(({'|'.join(spec.edge_type_set)}):{spec.edge_alias})"
-            if spec.edge_type_set and len(spec.edge_type_set) > 1
-            else f"({'|'.join(spec.edge_type_set)}:{spec.edge_alias})"
-            if spec.edge_type_set is not None
-            else f"(:{spec.edge_alias})"
+    @classmethod
+    def from_nodes(
+        cls, nodes: List[Dict], return_predecessors: bool = False
+    ) -> "BFSResult":
+        """
+        Merges the nodes printed by one or more multi-source BFS queries. A node
+        reached by several queries keeps its smallest level, and the predecessors
+        of the queries that reached it at that level.
+        """
+        ids = np.array([node["v_id"] for node in nodes], dtype=object)
+        attributes = [node["attributes"] for node in nodes]
+        levels = np.fromiter(
+            (a["level"] for a in attributes), dtype=np.int64, count=len(nodes)
         )
-        target_node_types_str = (
-            f"(({'|'.join(spec.target_node_type_set)}))"
-            if spec.target_node_type_set and len(spec.target_node_type_set) > 1
-            else f"{'|'.join(spec.target_node_type_set)}"
-            if spec.target_node_type_set is not None
-            else ""
+        source_ids = np.array([a["source"] for a in attributes], dtype=object)
+
+        # Keep the first row of each node in level order
+        order = np.argsort(levels, kind="stable")
+        _, first = np.unique(ids[order].astype(str), return_index=True)
+        keep = order[np.sort(first)]
+        result = cls(ids[keep], levels[keep], np.empty(0, dtype=np.int64))
+        result.sources = result._index.get_indexer(source_ids[keep])
+        if not return_predecessors:
+            return result
+
+        # Only rows at the smallest level of their node contribute predecessors
+        positions = result._index.get_indexer(ids)
+        rows = np.flatnonzero(levels == result.levels[positions])
+        parent_lists = [attributes[row].get("parents") or [] for row in rows]
+        counts = np.fromiter(map(len, parent_lists), dtype=np.int64, count=len(rows))
+        parent_ids = [parent for parents in parent_lists for parent in parents]
+        edges = np.column_stack(
+            [
+                result._index.get_indexer(parent_ids),
+                np.repeat(positions[rows], counts),
+            ]
+        ).astype(np.int64)
+        result.predecessors = np.unique(edges, axis=0) if len(edges) else edges
+        return result
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def get_level(self, level: int) -> List[str]:
+        """
+        Returns the IDs of the nodes at a level.
+        """
+        return list(self.node_ids[self.levels == level])
+
+    def get_path(self, node_id: str) -> List[str]:
+        """
+        Returns a shortest path from a start node to a node, following the
+        predecessor edges.
+
+        Args:
+            node_id: The ID of a reached node.
+
+        Returns:
+            The IDs of the nodes on the path, starting with a start node and ending
+            with `node_id`.
+        """
+        if self.predecessors is None:
+            raise ValueError(
+                "The BFS result has no predecessors. "
+                "Set `return_predecessors=True` to reconstruct paths."
+            )
+        if node_id not in self._index:
+            raise KeyError(f"Node {node_id} was not reached.")
+        # The first predecessor edge of each node
+        children, first = np.unique(self.predecessors[:, 1], return_index=True)
+        parent_of = np.full(len(self), -1, dtype=np.int64)
+        parent_of[children] = self.predecessors[first, 0]
+        path = [int(self._index.get_loc(node_id))]
+        while parent_of[path[-1]] >= 0:
+            path.append(int(parent_of[path[-1]]))
+        return list(self.node_ids[path[::-1]])
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the reached nodes as a DataFrame with the columns `v_id`,
+        `_bfs_level` and `_bfs_source`.
+        """
+        return pd.DataFrame(
+            {
+                "v_id": self.node_ids,
+                "_bfs_level": self.levels,
+                "_bfs_source": self.node_ids[self.sources],
+            }
         )
 
-        where_clause = (
-            f"    WHERE {filter_expression_str}" if filter_expression_str else ""
+
+def _format_edge_pattern(edge_types: Optional[Tuple[str, ...]], edge_alias: str) -> str:
+    """
+    Formats the edge types of a pattern, e.g. `((Knows|Likes):e)`.
+    """
+    return (
+        f"(({'|'.join(edge_types)}):{edge_alias})"
+        if edge_types and len(edge_types) > 1
+        else f"({'|'.join(edge_types)}:{edge_alias})"
+        if edge_types is not None
+        else f"(:{edge_alias})"
+    )
+
+
+@lru_cache(maxsize=GSQL_CACHE_SIZE)
+def _build_get_nodes_query(
+    graph_name: str,
+    node_type_str: str,
+    node_alias: str,
+    filter_expression: Optional[str],
+    limit: Optional[int],
+    return_attributes: Tuple[str, ...],
+) -> str:
+    """
+    Generates the GSQL query of a canonicalized NodeSpec once per process.
+    """
+    # Generate the base query
+    query = f"""
+INTERPRET QUERY() FOR GRAPH {graph_name} {{
+  Nodes = {{{node_type_str}}};
+"""
+    # Add SELECT block only if filter or limit is specified
+    if filter_expression or limit:
+        query += f"""  Nodes =
+    SELECT {node_alias}
+    FROM Nodes:{node_alias}
+"""
+        if filter_expression:
+            query += f"    WHERE {filter_expression}\n"
+        if limit:
+            query += f"    LIMIT {limit}\n"
+        query += "  ;\n"
+
+    # Add PRINT statement
+    if return_attributes:
+        prefixed_attributes = ",\n    ".join(
+            [f"Nodes.{attr} AS {attr}" for attr in return_attributes]
         )
-        limit_clause = f"    LIMIT {spec.limit}" if spec.limit else ""
+        query += f"  PRINT Nodes[\n    {prefixed_attributes}\n  ];"
+    else:
+        query += "  PRINT Nodes;"
 
-        # Generate the query
-        s_alias = spec.start_node_alias
-        t_alias = spec.target_node_alias
-        query = f"""
+    query += "\n}"
+    return query.strip()
+
+
+@lru_cache(maxsize=GSQL_CACHE_SIZE)
+def _build_get_neighbors_query(
+    graph_name: str,
+    start_node_type: str,
+    s_alias: str,
+    edge_types: Optional[Tuple[str, ...]],
+    edge_alias: str,
+    target_node_types: Optional[Tuple[str, ...]],
+    t_alias: str,
+    filter_expression: Optional[str],
+    limit: Optional[int],
+    return_attributes: Optional[Tuple[str, ...]],
+) -> str:
+    """
+    Generates the GSQL query of a canonicalized NeighborSpec once per process. The
+    start nodes are a parameter, so they are not part of the key.
+    """
+    # Prepare components
+    edge_types_str = _format_edge_pattern(edge_types, edge_alias)
+    target_node_types_str = (
+        f"(({'|'.join(target_node_types)}))"
+        if target_node_types and len(target_node_types) > 1
+        else f"{'|'.join(target_node_types)}"
+        if target_node_types is not None
+        else ""
+    )
+
+    # Generate the query
+    query = f"""
 INTERPRET QUERY(
   SET<VERTEX<{start_node_type}>> start_nodes
 ) FOR GRAPH {graph_name} {{
@@ -340,21 +906,182 @@ INTERPRET QUERY(
     SELECT {t_alias}
     FROM Nodes:{s_alias} -{edge_types_str}- {target_node_types_str}:{t_alias}
 """
-        if where_clause:
-            query += f"{where_clause}\n"
-        if limit_clause:
-            query += f"{limit_clause}\n"
+    if filter_expression:
+        query += f"    WHERE {filter_expression}\n"
+    if limit:
+        query += f"    LIMIT {limit}\n"
 
-        query += "  ;\n"
+    query += "  ;\n"
 
-        # Add PRINT statement
-        if return_attributes:
-            prefixed_attributes = ",\n    ".join(
-                [f"Neighbors.{attr} AS {attr}" for attr in return_attributes]
-            )
-            query += f"  PRINT Neighbors[\n    {prefixed_attributes}\n  ];"
-        else:
-            query += "  PRINT Neighbors;"
+    # Add PRINT statement
+    if return_attributes:
+        prefixed_attributes = ",\n    ".join(
+            [f"Neighbors.{attr} AS {attr}" for attr in return_attributes]
+        )
+        query += f"  PRINT Neighbors[\n    {prefixed_attributes}\n  ];"
+    else:
+        query += "  PRINT Neighbors;"
+
+    query += "\n}"
+    return query.strip()
+
+
+@lru_cache(maxsize=GSQL_CACHE_SIZE)
+def _build_iter_nodes_query(
+    graph_name: str,
+    node_type: str,
+    node_alias: str,
+    filter_expression: Optional[str],
+    return_attributes: Optional[Tuple[str, ...]],
+) -> str:
+    """
+    Generates the paging GSQL query of a canonicalized NodeSpec once per process.
+
+    Each page selects the `batch_size` nodes with the smallest internal IDs greater
+    than `after_vid` and returns their internal IDs, which are stable for the
+    lifetime of a node, as the attribute `@tgx_vid` or `tgx_vid`. GSQL cannot seek
+    to `after_vid`, so every page scans all nodes of the type and sorts the
+    ones that match; the ID and filter predicates are kept in the WHERE clause so
+    that only those reach the POST-ACCUM and ORDER BY.
+    """
+    where_clause = f"getvid({node_alias}) > after_vid"
+    if filter_expression:
+        where_clause += f" AND ({filter_expression})"
+    query = f"""
+INTERPRET QUERY(INT after_vid, INT batch_size) FOR GRAPH {graph_name} {{
+  MaxAccum<INT> @tgx_vid;
+  Nodes = {{{node_type}.*}};
+  Nodes =
+    SELECT {node_alias}
+    FROM Nodes:{node_alias}
+    WHERE {where_clause}
+    POST-ACCUM {node_alias}.@tgx_vid = getvid({node_alias})
+    ORDER BY {node_alias}.@tgx_vid ASC
+    LIMIT batch_size
+  ;
+"""
+    # Add PRINT statement
+    if return_attributes is not None:
+        prefixed_attributes = ",\n    ".join(
+            [f"Nodes.{attr} AS {attr}" for attr in return_attributes]
+            + ["Nodes.@tgx_vid AS tgx_vid"]
+        )
+        query += f"  PRINT Nodes[\n    {prefixed_attributes}\n  ];"
+    else:
+        query += "  PRINT Nodes;"
 
-        query += "\n}"
-        return (query.strip(), params)
+    query += "\n}"
+    return query.strip()
+
+
+@lru_cache(maxsize=GSQL_CACHE_SIZE)
+def _build_bfs_query(
+    graph_name: str,
+    node_type: str,
+    edge_types: Optional[Tuple[str, ...]],
+    limit: Optional[int],
+) -> str:
+    """
+    Generates the GSQL query of a BFS traversal once per process.
+
+    Each iteration of the WHILE loop selects the unvisited neighbors of the frontier,
+    at most `limit` of them, and marks them as visited with their level. The query
+    prints the nodes of the last level if it reached `max_hops`, or of the deepest
+    level if `max_hops` is 0.
+    """
+    query = f"""
+INTERPRET QUERY(
+  SET<VERTEX<{node_type}>> start_nodes,
+  INT max_hops
+) FOR GRAPH {graph_name} {{
+  OrAccum @tgx_visited;
+  MaxAccum<INT> @tgx_level;
+  INT hops = 0;
+  Frontier = {{start_nodes}};
+  Frontier =
+    SELECT s
+    FROM Frontier:s
+    POST-ACCUM s.@tgx_visited = TRUE
+  ;
+  LastLevel = Frontier;
+  WHILE Frontier.size() > 0 AND (max_hops <= 0 OR hops < max_hops) DO
+    Frontier =
+      SELECT t
+      FROM Frontier:s -{_format_edge_pattern(edge_types, "e")}- {node_type}:t
+      WHERE t.@tgx_visited == FALSE
+"""
+    if limit:
+        query += f"      LIMIT {limit}\n"
+    query += """    ;
+    IF Frontier.size() > 0 THEN
+      hops = hops + 1;
+      Frontier =
+        SELECT t
+        FROM Frontier:t
+        POST-ACCUM t.@tgx_visited = TRUE, t.@tgx_level = hops
+      ;
+      LastLevel = Frontier;
+    END;
+  END;
+  Result =
+    SELECT t
+    FROM LastLevel:t
+    WHERE hops > 0 AND (max_hops <= 0 OR hops == max_hops)
+  ;
+  PRINT Result;
+}"""
+    return query.strip()
+
+
+@lru_cache(maxsize=GSQL_CACHE_SIZE)
+def _build_multi_source_bfs_query(
+    graph_name: str,
+    node_type: str,
+    edge_types: Optional[Tuple[str, ...]],
+    return_predecessors: bool,
+) -> str:
+    """
+    Generates the GSQL query of a multi-source BFS traversal once per process.
+
+    Each iteration of the WHILE loop selects the unvisited neighbors of the frontier,
+    and each of them takes its source of origin from a node of the frontier. The
+    query prints every reached node with its level, source and, if requested, its
+    predecessors, but without its attributes.
+    """
+    accums = ["t.@tgx_source += s.@tgx_source"]
+    printed = ["Reached.@tgx_level AS level", "Reached.@tgx_source AS source"]
+    declarations = "  MinAccum<VERTEX> @tgx_source;\n"
+    if return_predecessors:
+        accums.append("t.@tgx_parents += s")
+        printed.append("Reached.@tgx_parents AS parents")
+        declarations += "  SetAccum<VERTEX> @tgx_parents;\n"
+    query = f"""
+INTERPRET QUERY(
+  SET<VERTEX<{node_type}>> start_nodes,
+  INT max_hops
+) FOR GRAPH {graph_name} {{
+  OrAccum @tgx_visited;
+  SumAccum<INT> @tgx_level;
+{declarations}  INT hops = 0;
+  Frontier = {{start_nodes}};
+  Frontier =
+    SELECT s
+    FROM Frontier:s
+    POST-ACCUM s.@tgx_visited = TRUE, s.@tgx_source = s
+  ;
+  Reached = Frontier;
+  WHILE Frontier.size() > 0 AND (max_hops <= 0 OR hops < max_hops) DO
+    hops = hops + 1;
+    Frontier =
+      SELECT t
+      FROM Frontier:s -{_format_edge_pattern(edge_types, "e")}- {node_type}:t
+      WHERE t.@tgx_visited == FALSE
+      ACCUM {", ".join(accums)}
+      POST-ACCUM t.@tgx_visited = TRUE, t.@tgx_level = hops
+    ;
+    Reached = Reached UNION Frontier;
+  END;
+"""
+    prefixed = ",\n    ".join(printed)
+    query += f"  PRINT Reached[\n    {prefixed}\n  ];\n}}"
+    return query.strip()
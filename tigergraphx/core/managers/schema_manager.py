@@ -364,7 +364,10 @@ INSTALL QUERY *
         )
 
         # Retrieve the schema from TigerGraph DB
-        raw_schema = context.connection.getSchema()
+        try:
+            raw_schema = context.connection.getSchema()
+        finally:
+            context.close()
         logger.debug(f"The raw schema: {raw_schema}")
 
         # Construct nodes dictionary
@@ -29,7 +29,7 @@ class StatisticsManager(BaseManager):
         gsql_script = self._create_gsql_degree(node_type, edge_type_set)
         try:
             params = {"input": node_id}
-            result = self._connection.runInterpretedQuery(gsql_script, params)
+            result = self._tigergraph_api.run_generated_query(gsql_script, params)
             if not result or not isinstance(result, list):
                 return 0
             return result[0].get("degree", 0)
@@ -128,7 +128,7 @@ class StatisticsManager(BaseManager):
                 )
                 from_clause = f"FROM Nodes:s -({edge_type})- :t"
             else:
-                edge_types_str = "|".join(edge_type_set)
+                edge_types_str = "|".join(sorted(edge_type_set))
                 from_clause = f"FROM Nodes:s -({edge_types_str})- :t"
 
         # Generate the query
@@ -72,15 +72,18 @@ class VectorManager(BaseManager):
                 }
                 nodes_to_upsert.append((node_id, node_data))
 
-        # Attempt to upsert the nodes into the graph
+        # Attempt to upsert the nodes into the graph. The payload is serialized by the
+        # configured JSON codec, which matters for large embedding lists.
         try:
-            result = self._connection.upsertVertices(
-                vertexType=node_type, vertices=nodes_to_upsert
+            result = self._tigergraph_api.upsert_vertices(
+                self._graph_schema.graph_name, node_type, nodes_to_upsert
             )
-            return result
+            return result["accepted_vertices"]
         except Exception as e:
             logger.error(f"Error adding nodes: {e}")
             return None
+        finally:
+            self._result_cache.invalidate([node_type])
 
     def fetch_node(
         self, node_id: str, vector_attribute_name: str, node_type: str
@@ -99,7 +102,9 @@ class VectorManager(BaseManager):
         """
         try:
             params = {"input": [(node_id, node_type) for node_id in node_ids]}
-            result = self._connection.runInstalledQuery("api_fetch", params)
+            result = self._tigergraph_api.run_installed_query(
+                self._graph_schema.graph_name, "api_fetch", params, use_post=True
+            )
 
             if not result or not isinstance(result, list):
                 logger.error("Query result is empty or invalid.")
@@ -264,8 +269,8 @@ class VectorManager(BaseManager):
         Executes the search query and performs initial error checks.
         """
         try:
-            result = self._connection.runInstalledQuery(
-                query_name, params, usePost=True
+            result = self._tigergraph_api.run_installed_query(
+                self._graph_schema.graph_name, query_name, params, use_post=True
             )
         except Exception as e:
             logger.error(f"Error executing query {query_name}: {e}")
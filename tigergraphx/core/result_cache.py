@@ -0,0 +1,187 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Optional
+from collections import OrderedDict
+import threading
+import time
+
+import pandas as pd
+
+# The type of results that depend on every node or edge type, e.g. `get_nodes` with
+# `all_node_types`
+ANY_TYPE = "*"
+
+
+class _CacheEntry:
+    __slots__ = ("value", "types", "size", "expires_at")
+
+    def __init__(
+        self,
+        value: pd.DataFrame,
+        types: FrozenSet[str],
+        size: int,
+        expires_at: Optional[float],
+    ):
+        self.value = value
+        self.types = types
+        self.size = size
+        self.expires_at = expires_at
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of query results, bounded by their memory usage in bytes.
+
+    Each result is tagged with the node and edge types it was read from, so that a
+    write can drop exactly the results it may have changed. The cache is disabled
+    when `max_bytes` is 0.
+    """
+
+    def __init__(self, max_bytes: int = 0, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: The maximum total memory usage of the cached results.
+            ttl: The number of seconds after which a result expires, or None to keep
+                results until they are evicted or invalidated.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def generation(self) -> int:
+        """
+        The number of invalidations so far. Pass it to `put` to drop results read
+        while a write was in progress.
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """
+        Look up a result.
+
+        Args:
+            key: The canonical key of the query.
+
+        Returns:
+            A copy of the cached result, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None:
+                if time.monotonic() >= entry.expires_at:
+                    self._remove(key)
+                    entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry.value
+        return value.copy()
+
+    def put(
+        self,
+        key: Hashable,
+        value: pd.DataFrame,
+        types: Iterable[str],
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store a result, evicting the least recently used results beyond `max_bytes`.
+
+        Args:
+            key: The canonical key of the query.
+            value: The result.
+            types: The node and edge types the result was read from. Use `ANY_TYPE`
+                for results that depend on all types.
+            generation: The `generation` read before the query was run. The result is
+                not stored if a write invalidated the cache since.
+        """
+        if not self.enabled:
+            return
+        value = value.copy()
+        size = int(value.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._remove(key)
+            self._entries[key] = _CacheEntry(value, frozenset(types), size, expires_at)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, types: Optional[Iterable[str]] = None) -> int:
+        """
+        Drop the results read from any of the given types.
+
+        Args:
+            types: The node and edge types that were written, or None to drop all
+                results.
+
+        Returns:
+            The number of dropped results.
+        """
+        if not self.enabled:
+            return 0
+        with self._lock:
+            self._generation += 1
+            if types is None:
+                keys = list(self._entries)
+            else:
+                written = set(types)
+                keys = [
+                    key
+                    for key, entry in self._entries.items()
+                    if ANY_TYPE in entry.types or entry.types & written
+                ]
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return the hit, miss, eviction and invalidation counts and the current size.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
@@ -0,0 +1,319 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple
+import importlib
+
+import numpy as np
+import pandas as pd
+
+from tigergraphx.config import DataType, GraphSchema
+
+ResultBackend = Literal["numpy", "pyarrow"]
+ResultDtypes = Literal["inferred", "schema"]
+StringDtype = Literal["object", "pyarrow"]
+
+# Vertex fields that are not attributes
+META_COLUMNS = ("v_id", "v_type")
+
+# The dtypes tried in order, like pandas does: UINT values beyond the int64 range
+# become uint64 rather than float64
+_NUMPY_DTYPES: Dict[DataType, Tuple[Any, ...]] = {
+    DataType.INT: (np.int64,),
+    DataType.UINT: (np.int64, np.uint64),
+    DataType.FLOAT: (np.float64,),
+    DataType.DOUBLE: (np.float64,),
+}
+
+# The dtypes of `schema` mode, and the nullable dtypes used if values are missing
+_SCHEMA_DTYPES: Dict[DataType, Tuple[Any, str]] = {
+    DataType.INT: (np.int64, "Int64"),
+    DataType.UINT: (np.uint64, "UInt64"),
+    DataType.FLOAT: (np.float64, "Float64"),
+    DataType.DOUBLE: (np.float64, "Float64"),
+    DataType.BOOL: (np.bool_, "boolean"),
+}
+
+# The format of DATETIME values in query results
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _import_pyarrow() -> Any:
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError as e:
+        raise ImportError(
+            "The 'pyarrow' result backend requires pyarrow. Install it with "
+            "`pip install pyarrow`."
+        ) from e
+
+
+class ResultDecoder:
+    """
+    Decodes the vertices printed by a query into a DataFrame column by column.
+
+    Instead of flattening every vertex with `pd.json_normalize` and then renaming,
+    dropping and reordering the columns, each output column is read straight from
+    the vertices into one array typed by the `GraphSchema`, and the DataFrame is
+    built once from those arrays. Attributes of types the schema does not know, e.g.
+    accumulators, are inferred by pandas, and results with nested attributes fall
+    back to `pd.json_normalize`.
+    """
+
+    def __init__(
+        self,
+        graph_schema: GraphSchema,
+        backend: ResultBackend = "numpy",
+        dtypes: ResultDtypes = "inferred",
+        string_dtype: StringDtype = "object",
+    ):
+        """
+        Initialize the decoder.
+
+        Args:
+            graph_schema: The schema of the graph the vertices belong to.
+            backend: "numpy" for NumPy-backed columns, or "pyarrow" for Arrow-backed
+                columns, which requires pyarrow.
+            dtypes: "inferred" for the same dtypes as `pd.json_normalize`, or
+                "schema" for the native dtypes of the attribute types: int64, uint64,
+                float64, bool and datetime64, nullable if values are missing, and a
+                categorical `v_type`.
+            string_dtype: "object" for Python strings, or "pyarrow" for Arrow-backed
+                strings, which requires pyarrow. Only used by the "numpy" backend.
+        """
+        self._graph_schema = graph_schema
+        self.backend = backend
+        self.dtypes = dtypes
+        self.string_dtype = string_dtype
+        self._pa = (
+            _import_pyarrow()
+            if backend == "pyarrow" or string_dtype == "pyarrow"
+            else None
+        )
+        self._attribute_types: Dict[
+            Optional[Tuple[str, ...]], Dict[str, DataType]
+        ] = {}
+
+    def decode_vertices(
+        self,
+        vertices: List[Dict[str, Any]],
+        node_types: Optional[Iterable[str]] = None,
+        return_attributes: Optional[str | List[str]] = None,
+        meta_columns: Sequence[str] = META_COLUMNS,
+        meta_first: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Decode printed vertices into a DataFrame.
+
+        Args:
+            vertices: The vertices, each with `v_id`, `v_type` and `attributes`.
+            node_types: The node types the vertices may have, or None for any type.
+            return_attributes: The attributes that come first, in this order. The
+                other attributes follow in the order they first appear.
+            meta_columns: The vertex fields to keep as columns, e.g. `v_id`.
+            meta_first: Whether the vertex fields come before or after the
+                attributes.
+
+        Returns:
+            The DataFrame, which has no columns if there are no vertices.
+        """
+        if not vertices:
+            return pd.DataFrame()
+        if isinstance(return_attributes, str):
+            return_attributes = [return_attributes]
+
+        attribute_rows = [vertex.get("attributes") or {} for vertex in vertices]
+        names = dict.fromkeys(return_attributes or [])
+        # Vertices of one type share their attribute names, so only look at the
+        # attributes of each new key set
+        seen_key_sets = set()
+        for attributes in attribute_rows:
+            keys = tuple(attributes)
+            if keys not in seen_key_sets:
+                seen_key_sets.add(keys)
+                names.update(dict.fromkeys(keys))
+
+        attribute_types = self._get_attribute_types(node_types)
+        attribute_columns: Dict[str, Any] = {}
+        for name in names:
+            values = [attributes.get(name) for attributes in attribute_rows]
+            data_type = attribute_types.get(name)
+            if data_type is None and any(isinstance(v, dict) for v in values):
+                return self._decode_nested(
+                    vertices, return_attributes, meta_columns, meta_first
+                )
+            attribute_columns[name] = self._to_array(values, data_type)
+
+        meta = {
+            column: self._to_meta_array(
+                column, [vertex.get(column) for vertex in vertices]
+            )
+            for column in meta_columns
+            if column in vertices[0]
+        }
+        columns = (
+            {**meta, **attribute_columns}
+            if meta_first
+            else {**attribute_columns, **meta}
+        )
+        return pd.DataFrame(columns, copy=False)
+
+    def _get_attribute_types(
+        self, node_types: Optional[Iterable[str]]
+    ) -> Dict[str, DataType]:
+        """
+        Return the data types of the attributes of some node types. Attributes whose
+        type differs between the node types are left out, so that pandas infers them.
+        """
+        key = tuple(sorted(node_types)) if node_types is not None else None
+        attribute_types = self._attribute_types.get(key)
+        if attribute_types is not None:
+            return attribute_types
+        attribute_types = {}
+        conflicting = set()
+        for node_type in key if key is not None else self._graph_schema.nodes:
+            node_schema = self._graph_schema.nodes.get(node_type)
+            if node_schema is None:
+                continue
+            for name, attribute in node_schema.attributes.items():
+                if attribute_types.setdefault(name, attribute.data_type) != (
+                    attribute.data_type
+                ):
+                    conflicting.add(name)
+        for name in conflicting:
+            del attribute_types[name]
+        self._attribute_types[key] = attribute_types
+        return attribute_types
+
+    def _to_meta_array(self, column: str, values: List[Any]) -> Any:
+        """
+        Convert the vertex IDs or types into an array. In "schema" mode, the few
+        distinct types are stored once as categories.
+        """
+        if column == "v_type" and self.dtypes == "schema":
+            return pd.Categorical(values)
+        return self._to_array(values, DataType.STRING)
+
+    def _to_array(self, values: List[Any], data_type: Optional[DataType]) -> Any:
+        """
+        Convert the values of one column into an array of the schema type. Values
+        that do not match the type are left to pandas to infer.
+        """
+        if self.backend == "pyarrow":
+            return self._to_arrow_array(values, data_type)
+        if data_type == DataType.STRING and self.string_dtype == "pyarrow":
+            return self._to_arrow_array(values, data_type)
+        if self.dtypes == "schema" and data_type is not None:
+            return self._to_schema_array(values, data_type)
+        dtypes = _NUMPY_DTYPES.get(data_type) if data_type is not None else None
+        if dtypes is not None:
+            for dtype in dtypes:
+                try:
+                    return np.fromiter(values, dtype=dtype, count=len(values))
+                except (TypeError, ValueError, OverflowError):
+                    pass
+            # Missing values become NaN, like with `pd.json_normalize`; other
+            # values that fit no dtype are kept as objects rather than rounded
+            if any(value is None for value in values):
+                try:
+                    return np.array(values, dtype=np.float64)
+                except (TypeError, ValueError):
+                    pass
+            return values
+        if data_type == DataType.BOOL:
+            array = np.array(values)
+            return array if array.dtype == np.bool_ else values
+        return values
+
+    @staticmethod
+    def _to_schema_array(values: List[Any], data_type: DataType) -> Any:
+        """
+        Convert the values of one column into an array of the native dtype of the
+        schema type.
+        """
+        if data_type == DataType.DATETIME:
+            return pd.to_datetime(values, format=DATETIME_FORMAT, errors="coerce")
+        dtypes = _SCHEMA_DTYPES.get(data_type)
+        if dtypes is None:
+            return values
+        dtype, nullable_dtype = dtypes
+        if dtype is np.bool_:
+            array = np.array(values)
+            if array.dtype == np.bool_:
+                return array
+        else:
+            try:
+                return np.fromiter(values, dtype=dtype, count=len(values))
+            except (TypeError, ValueError, OverflowError):
+                pass
+        try:
+            return pd.array(values, dtype=nullable_dtype)
+        except (TypeError, ValueError, OverflowError):
+            return values
+
+    def _to_arrow_array(self, values: List[Any], data_type: Optional[DataType]) -> Any:
+        """
+        Convert the values of one column into an Arrow-backed array.
+        """
+        pa = self._pa
+        arrow_types = {
+            DataType.INT: pa.int64(),
+            DataType.UINT: pa.uint64(),
+            DataType.FLOAT: pa.float64(),
+            DataType.DOUBLE: pa.float64(),
+            DataType.BOOL: pa.bool_(),
+            DataType.STRING: pa.string(),
+            DataType.DATETIME: pa.string(),
+        }
+        for arrow_type in [arrow_types.get(data_type) if data_type else None, None]:
+            try:
+                array = pa.array(values, type=arrow_type)
+            except (pa.ArrowException, TypeError, ValueError):
+                continue
+            if pa.types.is_null(array.type):
+                break
+            if data_type == DataType.DATETIME and self.dtypes == "schema":
+                array = self._parse_arrow_datetimes(array)
+            return pd.arrays.ArrowExtensionArray(array)
+        return values
+
+    def _parse_arrow_datetimes(self, array: Any) -> Any:
+        """
+        Parse an Arrow array of DATETIME strings into timestamps. Values that do
+        not match the format become null.
+        """
+        if not self._pa.types.is_string(array.type):
+            return array
+        compute = importlib.import_module("pyarrow.compute")
+        return compute.strptime(
+            array, format=DATETIME_FORMAT, unit="s", error_is_null=True
+        )
+
+    @staticmethod
+    def _decode_nested(
+        vertices: List[Dict[str, Any]],
+        return_attributes: Optional[List[str]],
+        meta_columns: Sequence[str],
+        meta_first: bool,
+    ) -> pd.DataFrame:
+        """
+        Decode vertices with nested attributes, which are flattened into one column
+        per leaf.
+        """
+        df = pd.DataFrame(pd.json_normalize(vertices))
+        df.columns = [
+            column.removeprefix("attributes.") if column not in META_COLUMNS else column
+            for column in df.columns
+        ]
+        meta = [column for column in meta_columns if column in df.columns]
+        first = [attr for attr in return_attributes or [] if attr in df.columns]
+        attributes = first + [
+            column
+            for column in df.columns
+            if column not in META_COLUMNS and column not in first
+        ]
+        return pd.DataFrame(df[meta + attributes if meta_first else attributes + meta])
@@ -6,21 +6,52 @@
 # under the License. The software is provided "AS IS", without warranty.
 
 from .tigergraph_api import TigerGraphAPI
+from .async_tigergraph_api import AsyncTigerGraphAPI
 from .endpoint_handler import EndpointRegistry
+from .retry_policy import RetryPolicy, CircuitBreaker
+from .request_limiter import RequestLimiter, TokenBucket
+from .request_hooks import RequestContext, RequestHook
+from .metrics_registry import MetricsRegistry
+from .host_selector import HostSelector
 from .api import (
     TigerGraphAPIError,
+    CircuitBreakerOpenError,
+    ReplayMissError,
     AdminAPI,
     GSQLAPI,
     SchemaAPI,
     QueryAPI,
+    DataAPI,
+    AsyncAdminAPI,
+    AsyncGSQLAPI,
+    AsyncSchemaAPI,
+    AsyncQueryAPI,
+    AsyncDataAPI,
 )
 
 __all__ = [
     "EndpointRegistry",
     "TigerGraphAPI",
     "TigerGraphAPIError",
+    "CircuitBreakerOpenError",
+    "ReplayMissError",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "RequestLimiter",
+    "TokenBucket",
+    "RequestContext",
+    "RequestHook",
+    "MetricsRegistry",
+    "HostSelector",
     "AdminAPI",
     "GSQLAPI",
     "SchemaAPI",
     "QueryAPI",
+    "DataAPI",
+    "AsyncTigerGraphAPI",
+    "AsyncAdminAPI",
+    "AsyncGSQLAPI",
+    "AsyncSchemaAPI",
+    "AsyncQueryAPI",
+    "AsyncDataAPI",
 ]
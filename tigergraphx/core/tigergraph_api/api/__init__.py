@@ -5,16 +5,32 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from .base_api import TigerGraphAPIError
+from .base_api import TigerGraphAPIError, CircuitBreakerOpenError, ReplayMissError
 from .admin_api import AdminAPI
 from .gsql_api import GSQLAPI
 from .schema_api import SchemaAPI
-from .query_api import QueryAPI 
+from .query_api import QueryAPI
+from .data_api import DataAPI
+from .async_base_api import AsyncBaseAPI
+from .async_admin_api import AsyncAdminAPI
+from .async_gsql_api import AsyncGSQLAPI
+from .async_schema_api import AsyncSchemaAPI
+from .async_query_api import AsyncQueryAPI
+from .async_data_api import AsyncDataAPI
 
 __all__ = [
     "TigerGraphAPIError",
+    "CircuitBreakerOpenError",
+    "ReplayMissError",
     "AdminAPI",
     "GSQLAPI",
     "SchemaAPI",
     "QueryAPI",
+    "DataAPI",
+    "AsyncBaseAPI",
+    "AsyncAdminAPI",
+    "AsyncGSQLAPI",
+    "AsyncSchemaAPI",
+    "AsyncQueryAPI",
+    "AsyncDataAPI",
 ]
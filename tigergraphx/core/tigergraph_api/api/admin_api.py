@@ -5,12 +5,14 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
+from typing import Optional
+
 from .base_api import BaseAPI
 
 
 class AdminAPI(BaseAPI):
-    def ping(self) -> str:
-        result = self._request(endpoint_name="ping", version="4.x")
+    def ping(self, host: Optional[str] = None) -> str:
+        result = self._request(endpoint_name="ping", version="4.x", host=host)
         if not isinstance(result, str):
             raise TypeError(f"Expected str, but got {type(result).__name__}: {result}")
         return result
@@ -0,0 +1,18 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Optional
+
+from .async_base_api import AsyncBaseAPI
+
+
+class AsyncAdminAPI(AsyncBaseAPI):
+    async def ping(self, host: Optional[str] = None) -> str:
+        result = await self._request(endpoint_name="ping", version="4.x", host=host)
+        if not isinstance(result, str):
+            raise TypeError(f"Expected str, but got {type(result).__name__}: {result}")
+        return result
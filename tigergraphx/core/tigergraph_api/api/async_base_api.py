@@ -0,0 +1,198 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+)
+import logging
+import httpx
+from requests.exceptions import ConnectionError, HTTPError
+
+from .base_api import BaseAPI, TigerGraphAPIError
+from ..endpoint_handler.endpoint_registry import EndpointRegistry
+from ..request_hooks import RequestContext, RequestHook
+
+from tigergraphx.config import TigerGraphConnectionConfig
+
+if TYPE_CHECKING:
+    from ..host_selector import HostSelector
+    from ..request_limiter import RequestLimiter
+    from ..retry_policy import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseAPI(BaseAPI):
+    def __init__(
+        self,
+        config: TigerGraphConnectionConfig,
+        endpoint_registry: EndpointRegistry,
+        session: httpx.AsyncClient,
+        retry_policy: Optional["RetryPolicy"] = None,
+        request_limiter: Optional["RequestLimiter"] = None,
+        hooks: Optional[List[RequestHook]] = None,
+        host_selector: Optional["HostSelector"] = None,
+    ):
+        """
+        Initializes the AsyncBaseAPI with a shared async client and endpoint registry.
+        """
+        super().__init__(
+            config,
+            endpoint_registry,
+            session,  # pyright: ignore
+            retry_policy,
+            request_limiter,
+            hooks,
+            host_selector,
+        )
+
+    async def _request(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        endpoint_name: str,
+        version: Literal["4.x", "3.x"] = "4.x",
+        params: Optional[Dict] = None,
+        data: Optional[Dict | str | bytes] = None,
+        json: Optional[Dict] = None,
+        host: Optional[str] = None,
+        **path_kwargs,
+    ) -> Dict | List | str:
+        """
+        Sends an HTTP request on the event loop using resolved endpoint details.
+        Raises the same exceptions as `BaseAPI._request` on failure.
+        """
+        try:
+            # Resolve endpoint details
+            endpoint = self.endpoint_registry.get_endpoint(
+                endpoint_name, version, **path_kwargs
+            )
+            url = self._build_url(endpoint, host)
+            headers = self._build_headers(endpoint)
+            data, json = self._encode_body(data, json)
+            data = self._compress_body(endpoint, data, headers)
+
+            logger.debug(
+                f"method: {endpoint['method']}, url: {url}; params: {params}; "
+                f"data: {data}; json: {json}; headers: {headers}"
+            )
+
+            # Make the request
+            async def send(url: str):
+                return await self.session.request(
+                    method=endpoint["method"],
+                    url=url,
+                    params=params,
+                    content=data if isinstance(data, (str, bytes)) else None,
+                    data=data if isinstance(data, dict) else None,
+                    json=json,
+                    headers=headers,
+                )
+
+            context = self._create_request_context(endpoint_name, endpoint, url, data)
+            response = await self._send_async(endpoint, send, context, host)
+            return self._process_response(response)
+
+        except HTTPError as e:
+            raise RuntimeError(f"HTTP request failed: {str(e)}") from e
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"Request timed out: {str(e)}") from e
+        except (httpx.ConnectError, httpx.NetworkError) as e:
+            raise ConnectionError(f"Failed to connect to TigerGraph: {str(e)}") from e
+        except httpx.TooManyRedirects as e:
+            raise RuntimeError(f"Too many redirects: {str(e)}") from e
+        except (httpx.InvalidURL, httpx.UnsupportedProtocol) as e:
+            raise ValueError("Invalid request URL") from e
+        except httpx.DecodingError as e:
+            raise RuntimeError(f"Failed to decode response: {str(e)}") from e
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Request error: {str(e)}") from e
+        except TigerGraphAPIError:
+            raise
+        except Exception as e:
+            raise RuntimeError(
+                f"Unexpected error: {type(e).__name__} - {str(e)}"
+            ) from e
+
+    async def _send_async(
+        self,
+        endpoint: Dict[str, Any],
+        send: Callable[[str], Awaitable[Any]],
+        context: Optional[RequestContext] = None,
+        host: Optional[str] = None,
+    ) -> Any:
+        """
+        Async counterpart of `BaseAPI._send`.
+        """
+        attempt = self._route_async(endpoint, send, context, host)
+        if self.request_limiter is not None:
+            attempt = self.request_limiter.wrap_async(
+                endpoint.get("limit_class", "default"), attempt
+            )
+        if context is None:
+            return await self._send_with_retries_async(endpoint, attempt, host)
+
+        attempt = self._count_attempts_async(context, attempt)
+        self._call_hooks("on_request_start", context)
+        try:
+            response = await self._send_with_retries_async(endpoint, attempt, host)
+        except Exception as e:
+            self._finish_request_context(context)
+            self._call_hooks("on_error", context, e)
+            raise
+        self._finish_request_context(context, response)
+        self._call_hooks("on_response", context, response)
+        return response
+
+    async def _send_with_retries_async(
+        self,
+        endpoint: Dict[str, Any],
+        send: Callable[[], Awaitable[Any]],
+        host: Optional[str] = None,
+    ) -> Any:
+        if self.retry_policy is None or host is not None:
+            return await send()
+        return await self.retry_policy.call_async(endpoint, send)
+
+    def _route_async(
+        self,
+        endpoint: Dict[str, Any],
+        send: Callable[[str], Awaitable[Any]],
+        context: Optional[RequestContext] = None,
+        host: Optional[str] = None,
+    ) -> Callable[[], Awaitable[Any]]:
+        """
+        Async counterpart of `BaseAPI._route`.
+        """
+        if host is not None or self.host_selector is None:
+            url = self._build_url(endpoint, host)
+            return lambda: send(url)
+        host_selector = self.host_selector
+
+        async def routed_send():
+            selected_host = host_selector.select(endpoint)
+            url = self._build_url(endpoint, selected_host)
+            if context is not None:
+                context.url = url
+            return await host_selector.call_async(selected_host, lambda: send(url))
+
+        return routed_send
+
+    @staticmethod
+    def _count_attempts_async(
+        context: RequestContext, send: Callable[[], Awaitable[Any]]
+    ) -> Callable[[], Awaitable[Any]]:
+        async def counted_send():
+            context.attempts += 1
+            return await send()
+
+        return counted_send
@@ -0,0 +1,55 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, Optional, Sequence
+from urllib.parse import quote
+
+from .async_base_api import AsyncBaseAPI
+from .data_api import DataAPI
+
+
+class AsyncDataAPI(AsyncBaseAPI, DataAPI):
+    async def upsert_graph_data(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        graph_name: str,
+        payload: Dict[str, Any],
+        vertex_must_exist: bool = False,
+    ) -> Dict[str, int]:
+        result = await self._request(
+            endpoint_name="upsert_graph_data",
+            version="4.x",
+            json=payload,
+            params=self._build_upsert_params(vertex_must_exist),
+            graph_name=graph_name,
+        )
+        return self._parse_upsert_result(payload, result)
+
+    async def delete_vertices(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        graph_name: str,
+        vertex_type: str,
+        vertex_ids: Optional[Sequence[str | int]] = None,
+    ) -> int:
+        if vertex_ids is None:
+            result = await self._request(
+                endpoint_name="delete_vertices",
+                version="4.x",
+                graph_name=graph_name,
+                vertex_type=vertex_type,
+            )
+            return self._parse_delete_result(result)
+        deleted = 0
+        for vertex_id in vertex_ids:
+            result = await self._request(
+                endpoint_name="delete_vertex",
+                version="4.x",
+                graph_name=graph_name,
+                vertex_type=vertex_type,
+                vertex_id=quote(str(vertex_id), safe=""),
+            )
+            deleted += self._parse_delete_result(result)
+        return deleted
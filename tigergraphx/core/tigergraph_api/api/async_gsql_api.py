@@ -0,0 +1,16 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from .async_base_api import AsyncBaseAPI
+
+
+class AsyncGSQLAPI(AsyncBaseAPI):
+    async def gsql(self, command: str) -> str:
+        result = await self._request(endpoint_name="gsql", version="4.x", data=command)
+        if not isinstance(result, str):
+            raise TypeError(f"Expected str, but got {type(result).__name__}: {result}")
+        return result
@@ -0,0 +1,59 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Optional
+
+from .async_base_api import AsyncBaseAPI
+from .query_api import QueryAPI
+
+
+class AsyncQueryAPI(AsyncBaseAPI, QueryAPI):
+    async def run_interpreted_query(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, query: str, params: Optional[Dict[str, Any] | str] = None
+    ) -> List:
+        parsed_params = self._prepare_query_parameters(params)
+        result = await self._request(
+            endpoint_name="run_interpreted_query",
+            version="4.x",
+            data=query,
+            params=parsed_params,
+        )
+        if not isinstance(result, list):
+            raise TypeError(f"Expected list, but got {type(result).__name__}: {result}")
+        return result
+
+    async def run_installed_query_get(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        graph_name: str,
+        query_name: str,
+        params: Optional[Dict[str, Any] | str] = None,
+    ) -> List:
+        parsed_params = self._prepare_query_parameters(params)
+        result = await self._request(
+            endpoint_name="run_installed_query_get",
+            version="4.x",
+            params=parsed_params,
+            graph_name=graph_name,
+            query_name=query_name,
+        )
+        if not isinstance(result, list):
+            raise TypeError(f"Expected list, but got {type(result).__name__}: {result}")
+        return result
+
+    async def run_installed_query_post(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, graph_name: str, query_name: str, params: Optional[Dict[str, Any]] = None
+    ) -> List:
+        result = await self._request(
+            endpoint_name="run_installed_query_post",
+            version="4.x",
+            json=self._convert_query_parameters_to_json(params or {}),
+            graph_name=graph_name,
+            query_name=query_name,
+        )
+        if not isinstance(result, list):
+            raise TypeError(f"Expected list, but got {type(result).__name__}: {result}")
+        return result
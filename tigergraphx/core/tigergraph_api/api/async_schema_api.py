@@ -0,0 +1,22 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Dict
+from .async_base_api import AsyncBaseAPI
+
+
+class AsyncSchemaAPI(AsyncBaseAPI):
+    async def get_schema(self, graph_name) -> Dict:
+        """
+        Retrieves the schema for a specific graph.
+        """
+        result = await self._request(
+            endpoint_name="get_schema", version="4.x", graph_name=graph_name
+        )
+        if not isinstance(result, dict):
+            raise TypeError(f"Expected dict, but got {type(result).__name__}: {result}")
+        return result
@@ -5,7 +5,21 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from typing import Any, Dict, List, Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+from contextlib import contextmanager
+import gzip
+import time
+import zlib
 from requests.sessions import Session
 from requests.exceptions import (
     RequestException,
@@ -23,11 +37,23 @@ from requests.exceptions import (
 import logging
 
 from ..endpoint_handler.endpoint_registry import EndpointRegistry
+from ..json_stream import iter_batches, iter_result_records
+from ..request_hooks import RequestContext, RequestHook
 
 from tigergraphx.config import TigerGraphConnectionConfig
+from tigergraphx.utils.json_codec import get_json_codec
+
+if TYPE_CHECKING:
+    from ..host_selector import HostSelector
+    from ..request_limiter import RequestLimiter
+    from ..retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 64 * 1024
+# Favor speed: float arrays compress well even at low levels
+COMPRESSION_LEVEL = 1
+
 
 class BaseAPI:
     def __init__(
@@ -35,40 +61,51 @@ class BaseAPI:
         config: TigerGraphConnectionConfig,
         endpoint_registry: EndpointRegistry,
         session: Session,
+        retry_policy: Optional["RetryPolicy"] = None,
+        request_limiter: Optional["RequestLimiter"] = None,
+        hooks: Optional[List[RequestHook]] = None,
+        host_selector: Optional["HostSelector"] = None,
     ):
         """
         Initializes the BaseAPI with a shared session and endpoint registry.
+        Requests are sent once and unthrottled unless a shared retry policy and
+        request limiter are provided. `hooks` is shared, so hooks added to it later
+        apply to subsequent requests. Without a host selector, all requests go to
+        `config.host`.
         """
         self.config = config
         self.endpoint_registry = endpoint_registry
         self.session = session
+        self.retry_policy = retry_policy
+        self.request_limiter = request_limiter
+        self.hooks = hooks if hooks is not None else []
+        self.host_selector = host_selector
+        self.json_codec = get_json_codec(config.json_codec)
 
     def _request(
         self,
         endpoint_name: str,
         version: Literal["4.x", "3.x"] = "4.x",
         params: Optional[Dict] = None,
-        data: Optional[Dict | str] = None,
+        data: Optional[Dict | str | bytes] = None,
         json: Optional[Dict] = None,
+        host: Optional[str] = None,
         **path_kwargs,
     ) -> Dict | List | str:
         """
         Sends an HTTP request using resolved endpoint details.
-        Raises exceptions on failure.
+        A request pinned to `host` bypasses the host selector and retries, e.g. for
+        health checks. Raises exceptions on failure.
         """
-        try:
+        with self._handle_request_errors():
             # Resolve endpoint details
             endpoint = self.endpoint_registry.get_endpoint(
                 endpoint_name, version, **path_kwargs
             )
-            base_url = f"{str(self.config.host).rstrip('/')}"
-            url = (
-                f"{base_url}:{getattr(self.config, endpoint['port'])}{endpoint['path']}"
-            )
-
-            # Get Content-Type from endpoint config (default to application/json)
-            content_type = endpoint.get("content_type", "application/json")
-            headers = {**self.session.headers, "Content-Type": content_type}
+            url = self._build_url(endpoint, host)
+            headers = self._build_headers(endpoint)
+            data, json = self._encode_body(data, json)
+            data = self._compress_body(endpoint, data, headers)
 
             logger.debug(
                 f"method: {endpoint['method']}, url: {url}; params: {params}; "
@@ -76,55 +113,232 @@ class BaseAPI:
             )
 
             # Make the request
-            response = self.session.request(
-                method=endpoint["method"],
-                url=url,
-                params=params,
-                data=data,
-                json=json,
-                headers=headers,
+            context = self._create_request_context(endpoint_name, endpoint, url, data)
+            response = self._send(
+                endpoint,
+                lambda url: self.session.request(
+                    method=endpoint["method"],
+                    url=url,
+                    params=params,
+                    data=data,
+                    json=json,
+                    headers=headers,
+                ),
+                context,
+                host,
             )
+            return self._process_response(response)
 
-            # Get Content-Type
-            content_type = response.headers.get("Content-Type", "")
+    def _request_stream(
+        self,
+        endpoint_name: str,
+        result_key: str,
+        version: Literal["4.x", "3.x"] = "4.x",
+        batch_size: int = 1000,
+        result_index: Optional[int] = None,
+        params: Optional[Dict] = None,
+        data: Optional[Dict | str | bytes] = None,
+        json: Optional[Dict] = None,
+        **path_kwargs,
+    ) -> Iterator[List[Any]]:
+        """
+        Sends an HTTP request and streams `results[i][result_key]` in batches.
+
+        The response body is decoded incrementally, so peak memory scales with
+        `batch_size` rather than with the size of the result.
+        Raises exceptions on failure.
+        """
+        with self._handle_request_errors():
+            # Resolve endpoint details
+            endpoint = self.endpoint_registry.get_endpoint(
+                endpoint_name, version, **path_kwargs
+            )
+            url = self._build_url(endpoint)
+            headers = self._build_headers(endpoint)
+            data, json = self._encode_body(data, json)
+            data = self._compress_body(endpoint, data, headers)
+
+            logger.debug(
+                f"method: {endpoint['method']}, url: {url}; params: {params}; "
+                f"data: {data}; json: {json}; headers: {headers}; stream: True"
+            )
 
-            # Handle JSON responses first
-            if "application/json" in content_type:
-                try:
-                    response_json = response.json()
-                except ValueError:
-                    raise RuntimeError(
-                        f"Invalid JSON response from TigerGraph: {response.text.strip()}"
+            # Make the request without reading the body
+            context = self._create_request_context(
+                endpoint_name, endpoint, url, data, stream=True
+            )
+            response = self._send(
+                endpoint,
+                lambda url: self.session.request(
+                    method=endpoint["method"],
+                    url=url,
+                    params=params,
+                    data=data,
+                    json=json,
+                    headers=headers,
+                    stream=True,
+                ),
+                context,
+            )
+            with response:
+                content_type = response.headers.get("Content-Type", "")
+                if (
+                    "application/json" not in content_type
+                    or response.status_code >= 400
+                ):
+                    # Errors are small; reuse the regular response handling
+                    result = self._process_response(response)
+                    raise TypeError(
+                        f"Expected a streamed JSON response, but got "
+                        f"{type(result).__name__}: {result}"
                     )
 
+                header: Dict[str, Any] = {}
+                records = iter_result_records(
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    result_key=result_key,
+                    result_index=result_index,
+                    header=header,
+                )
+                for batch in iter_batches(records, batch_size):
+                    yield batch
+
                 # Check if TigerGraph API returned an error
-                if response_json.get("error", False):
+                if header.get("error", False):
                     raise TigerGraphAPIError(
-                        response_json.get("message", "Unknown error"),
+                        header.get("message", "Unknown error"),
                         status_code=response.status_code,
                         response=response,
                     )
 
-                self._raise_for_status(response)
+    def _send(
+        self,
+        endpoint: Dict[str, Any],
+        send: Callable[[str], Any],
+        context: Optional[RequestContext] = None,
+        host: Optional[str] = None,
+    ) -> Any:
+        """
+        Sends a request to a URL through the host selector, request limiter and retry
+        policy, if any. Each attempt waits for the limits of the endpoint class, so
+        backoff sleeps do not hold a concurrency slot, and selects a host, so retries
+        fail over to other hosts. Calls the request hooks if a context is given.
+        """
+        attempt = self._route(endpoint, send, context, host)
+        if self.request_limiter is not None:
+            attempt = self.request_limiter.wrap(
+                endpoint.get("limit_class", "default"), attempt
+            )
+        if context is None:
+            return self._send_with_retries(endpoint, attempt, host)
 
-                # Extract results; if empty, return message
-                results = response_json.get("results")
-                return results if results else response_json.get("message", None)
+        attempt = self._count_attempts(context, attempt)
+        self._call_hooks("on_request_start", context)
+        try:
+            response = self._send_with_retries(endpoint, attempt, host)
+        except Exception as e:
+            self._finish_request_context(context)
+            self._call_hooks("on_error", context, e)
+            raise
+        self._finish_request_context(context, response)
+        self._call_hooks("on_response", context, response)
+        return response
 
-            # Handle text/plain responses
-            elif "text/plain" in content_type or content_type == "":
-                self._raise_for_status(response)
-                return response.text.strip()
+    def _send_with_retries(
+        self,
+        endpoint: Dict[str, Any],
+        send: Callable[[], Any],
+        host: Optional[str] = None,
+    ) -> Any:
+        if self.retry_policy is None or host is not None:
+            return send()
+        return self.retry_policy.call(endpoint, send)
 
-            # Handle unknown Content-Type
-            else:
-                self._raise_for_status(response)
-                raise TigerGraphAPIError(
-                    f"Unsupported content type: {content_type}",
-                    status_code=response.status_code,
-                    response=response,
+    def _route(
+        self,
+        endpoint: Dict[str, Any],
+        send: Callable[[str], Any],
+        context: Optional[RequestContext] = None,
+        host: Optional[str] = None,
+    ) -> Callable[[], Any]:
+        """
+        Binds a request to the pinned host, or to the host selected per attempt.
+        """
+        if host is not None or self.host_selector is None:
+            url = self._build_url(endpoint, host)
+            return lambda: send(url)
+        host_selector = self.host_selector
+
+        def routed_send():
+            selected_host = host_selector.select(endpoint)
+            url = self._build_url(endpoint, selected_host)
+            if context is not None:
+                context.url = url
+            return host_selector.call(selected_host, lambda: send(url))
+
+        return routed_send
+
+    def _create_request_context(
+        self,
+        endpoint_name: str,
+        endpoint: Dict[str, Any],
+        url: str,
+        data: Optional[Dict | str | bytes],
+        stream: bool = False,
+    ) -> Optional[RequestContext]:
+        """
+        Creates the context passed to the request hooks, or None without hooks.
+        """
+        if not self.hooks:
+            return None
+        return RequestContext(
+            endpoint_name=endpoint_name,
+            method=endpoint["method"],
+            url=url,
+            limit_class=endpoint.get("limit_class", "default"),
+            request_size=len(data) if isinstance(data, (str, bytes)) else 0,
+            stream=stream,
+        )
+
+    @staticmethod
+    def _count_attempts(context: RequestContext, send: Callable) -> Callable:
+        def counted_send():
+            context.attempts += 1
+            return send()
+
+        return counted_send
+
+    @staticmethod
+    def _finish_request_context(
+        context: RequestContext, response: Optional[Any] = None
+    ) -> None:
+        context.elapsed = time.perf_counter() - context.start_time
+        if response is None:
+            return
+        context.status_code = response.status_code
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and content_length.isdigit():
+            context.response_size = int(content_length)
+        elif not context.stream:
+            context.response_size = len(response.content)
+
+    def _call_hooks(self, name: str, context: RequestContext, *args: Any) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(context, *args)
+            except Exception as e:
+                logger.warning(
+                    f"Request hook {type(hook).__name__}.{name} failed: "
+                    f"{type(e).__name__} - {str(e)}"
                 )
 
+    @contextmanager
+    def _handle_request_errors(self) -> Iterator[None]:
+        """
+        Converts exceptions raised while sending a request into library errors.
+        """
+        try:
+            yield
         except HTTPError as e:
             raise RuntimeError(f"HTTP request failed: {str(e)}") from e
         except ConnectionError as e:
@@ -146,12 +360,124 @@ class BaseAPI:
                 f"Unexpected error: {type(e).__name__} - {str(e)}"
             ) from e
 
+    def _build_url(self, endpoint: Dict[str, Any], host: Optional[str] = None) -> str:
+        """
+        Builds the full request URL for a resolved endpoint on `host`, which defaults
+        to `config.host`. The registry prebuilds the URL for the default host.
+        """
+        if host is None and "url" in endpoint:
+            return endpoint["url"]
+        base_url = host or f"{str(self.config.host).rstrip('/')}"
+        port = endpoint.get("port_value") or getattr(self.config, endpoint["port"])
+        return f"{base_url}:{port}{endpoint['path']}"
+
+    def _encode_body(
+        self, data: Optional[Dict | str | bytes], json: Optional[Dict]
+    ) -> Tuple[Optional[Dict | str | bytes], None]:
+        """
+        Serializes a JSON body with the configured codec instead of the HTTP client.
+        """
+        if json is not None:
+            return self.json_codec.encode(json), None
+        return data, json
+
+    def _compress_body(
+        self,
+        endpoint: Dict[str, Any],
+        data: Optional[Dict | str | bytes],
+        headers: Dict[str, Any],
+    ) -> Optional[Dict | str | bytes]:
+        """
+        Compresses a raw request body according to the endpoint's compression policy.
+        Sets Content-Encoding in `headers` when the body is compressed.
+        """
+        compression = endpoint.get("compression", "none")
+        if (
+            not self.config.request_compression
+            or compression == "none"
+            or not isinstance(data, (str, bytes))
+            or len(data) < self.config.compression_min_size
+        ):
+            return data
+
+        body = data.encode("utf-8") if isinstance(data, str) else data
+        if compression == "gzip":
+            # A fixed mtime keeps equal bodies byte-identical, e.g. for replay matching
+            body = gzip.compress(body, compresslevel=COMPRESSION_LEVEL, mtime=0)
+        else:
+            body = zlib.compress(body, COMPRESSION_LEVEL)
+        headers["Content-Encoding"] = compression
+        return body
+
+    def _build_headers(self, endpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Builds the request headers for a resolved endpoint.
+        """
+        # Get Content-Type from endpoint config (default to application/json)
+        content_type = endpoint.get("content_type", "application/json")
+        headers = {**self.session.headers, "Content-Type": content_type}
+
+        # The HTTP clients advertise gzip and deflate and decode responses by default
+        if not self.config.accept_compressed_responses:
+            headers["Accept-Encoding"] = "identity"
+        return headers
+
+    def _process_response(self, response: Any) -> Dict | List | str:
+        """
+        Converts an HTTP response into results, message or text.
+        Raises exceptions on failure.
+        """
+        # Get Content-Type
+        content_type = response.headers.get("Content-Type", "")
+
+        # Handle JSON responses first
+        if "application/json" in content_type:
+            try:
+                response_json = self.json_codec.decode_response(response)
+            except ValueError:
+                raise RuntimeError(
+                    f"Invalid JSON response from TigerGraph: {response.text.strip()}"
+                )
+
+            # Check if TigerGraph API returned an error
+            if response_json.get("error", False):
+                raise TigerGraphAPIError(
+                    response_json.get("message", "Unknown error"),
+                    status_code=response.status_code,
+                    response=response,
+                )
+
+            self._raise_for_status(response)
+
+            # Extract results; if empty, return message
+            results = response_json.get("results")
+            return results if results else response_json.get("message", None)
+
+        # Handle text/plain responses
+        elif "text/plain" in content_type or content_type == "":
+            self._raise_for_status(response)
+            return response.text.strip()
+
+        # Handle unknown Content-Type
+        else:
+            self._raise_for_status(response)
+            raise TigerGraphAPIError(
+                f"Unsupported content type: {content_type}",
+                status_code=response.status_code,
+                response=response,
+            )
+
     def _raise_for_status(self, response):
         """
         Raises HTTPError with detailed messages based on the status code.
         """
         status_code = response.status_code
-        reason = response.reason or "Unknown Error"
+        # requests exposes `reason`, while httpx exposes `reason_phrase`
+        reason = (
+            getattr(response, "reason", None)
+            or getattr(response, "reason_phrase", None)
+            or "Unknown Error"
+        )
         url = response.url
 
         # Decode reason if it's in bytes (to avoid encoding issues)
@@ -219,3 +545,15 @@ class TigerGraphAPIError(Exception):
         Returns the response text if available.
         """
         return self.response.text if self.response else None
+
+
+class CircuitBreakerOpenError(TigerGraphAPIError):
+    """
+    Exception raised without sending a request while the circuit breaker is open.
+    """
+
+
+class ReplayMissError(TigerGraphAPIError):
+    """
+    Exception raised in replay mode for a request that was never recorded.
+    """
@@ -0,0 +1,162 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+from .base_api import BaseAPI
+
+
+class DataAPI(BaseAPI):
+    def upsert_graph_data(
+        self,
+        graph_name: str,
+        payload: Dict[str, Any],
+        vertex_must_exist: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Upserts vertices and edges in one REST++ request. Returns the accepted and
+        skipped vertex and edge counts.
+        """
+        result = self._request(
+            endpoint_name="upsert_graph_data",
+            version="4.x",
+            json=payload,
+            params=self._build_upsert_params(vertex_must_exist),
+            graph_name=graph_name,
+        )
+        return self._parse_upsert_result(payload, result)
+
+    def delete_vertices(
+        self,
+        graph_name: str,
+        vertex_type: str,
+        vertex_ids: Optional[Sequence[str | int]] = None,
+    ) -> int:
+        """
+        Deletes the given vertices, or all vertices of a type if no IDs are given.
+        Returns the number of deleted vertices.
+        """
+        if vertex_ids is None:
+            result = self._request(
+                endpoint_name="delete_vertices",
+                version="4.x",
+                graph_name=graph_name,
+                vertex_type=vertex_type,
+            )
+            return self._parse_delete_result(result)
+        deleted = 0
+        for vertex_id in vertex_ids:
+            result = self._request(
+                endpoint_name="delete_vertex",
+                version="4.x",
+                graph_name=graph_name,
+                vertex_type=vertex_type,
+                vertex_id=quote(str(vertex_id), safe=""),
+            )
+            deleted += self._parse_delete_result(result)
+        return deleted
+
+    @staticmethod
+    def build_vertices_payload(
+        vertex_type: str, vertices: Sequence[Tuple[str | int, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Builds the upsert payload of one vertex type from (ID, attributes) pairs.
+        """
+        return {
+            "vertices": {
+                vertex_type: {
+                    str(vertex_id): DataAPI._convert_attributes(attributes)
+                    for vertex_id, attributes in vertices
+                }
+            }
+        }
+
+    @staticmethod
+    def build_edges_payload(
+        src_vertex_type: str,
+        edge_type: str,
+        tgt_vertex_type: str,
+        edges: Sequence[Tuple[str | int, str | int, Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Builds the upsert payload of one edge type from (source ID, target ID,
+        attributes) triples. Repeated pairs, e.g. of discriminated multi-edges, are
+        sent as a list of attribute sets.
+        """
+        sources: Dict[str, Dict[str, Any]] = {}
+        for src_id, tgt_id, attributes in edges:
+            source = sources.setdefault(str(src_id), {edge_type: {tgt_vertex_type: {}}})
+            targets = source[edge_type][tgt_vertex_type]
+            value = DataAPI._convert_attributes(attributes)
+            key = str(tgt_id)
+            if key not in targets:
+                targets[key] = value
+            elif isinstance(targets[key], list):
+                targets[key].append(value)
+            else:
+                targets[key] = [targets[key], value]
+        return {"edges": {src_vertex_type: sources}}
+
+    @staticmethod
+    def _convert_attributes(attributes: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Wraps attribute values for REST++. A (value, op) tuple sets an update
+        operator, e.g. (1, "add") or (1, "max").
+        """
+        converted = {}
+        for name, value in attributes.items():
+            if isinstance(value, tuple) and len(value) == 2:
+                converted[name] = {"value": value[0], "op": value[1]}
+            else:
+                converted[name] = {"value": value}
+        return converted
+
+    @staticmethod
+    def _build_upsert_params(vertex_must_exist: bool) -> Optional[Dict[str, str]]:
+        return {"vertex_must_exist": "true"} if vertex_must_exist else None
+
+    @staticmethod
+    def _parse_upsert_result(
+        payload: Dict[str, Any], result: Dict | List | str
+    ) -> Dict[str, int]:
+        if isinstance(result, list) and result and isinstance(result[0], dict):
+            result = result[0]
+        if not isinstance(result, dict):
+            raise TypeError(f"Expected dict, but got {type(result).__name__}: {result}")
+
+        # Older servers report only accepted counts, so derive the skipped ones
+        num_vertices = sum(len(ids) for ids in payload.get("vertices", {}).values())
+        num_edges = sum(
+            len(value) if isinstance(value, list) else 1
+            for sources in payload.get("edges", {}).values()
+            for edge_types in sources.values()
+            for tgt_types in edge_types.values()
+            for targets in tgt_types.values()
+            for value in targets.values()
+        )
+        accepted_vertices = int(result.get("accepted_vertices", 0))
+        accepted_edges = int(result.get("accepted_edges", 0))
+        return {
+            "accepted_vertices": accepted_vertices,
+            "accepted_edges": accepted_edges,
+            "skipped_vertices": int(
+                result.get("skipped_vertices", max(num_vertices - accepted_vertices, 0))
+            ),
+            "skipped_edges": int(
+                result.get("skipped_edges", max(num_edges - accepted_edges, 0))
+            ),
+        }
+
+    @staticmethod
+    def _parse_delete_result(result: Dict | List | str) -> int:
+        if isinstance(result, list):
+            return sum(int(item.get("deleted_vertices", 0)) for item in result)
+        if not isinstance(result, dict):
+            raise TypeError(f"Expected dict, but got {type(result).__name__}: {result}")
+        return int(result.get("deleted_vertices", 0))
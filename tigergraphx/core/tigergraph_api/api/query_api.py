@@ -5,17 +5,22 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime
+from urllib.parse import urlencode
 
 from .base_api import BaseAPI
 
 
 class QueryAPI(BaseAPI):
     def run_interpreted_query(
-        self, query: str, params: Optional[Dict[str, Any]] = None
+        self, query: str, params: Optional[Dict[str, Any] | str] = None
     ) -> List:
-        parsed_params = self._parse_query_parameters(params) if params else None
+        """
+        Runs an interpreted query. `params` may also be an encoded query string, e.g.
+        `start_nodes=a&start_nodes=b` for a `SET<VERTEX<T>>` parameter.
+        """
+        parsed_params = self._prepare_query_parameters(params)
         result = self._request(
             endpoint_name="run_interpreted_query",
             version="4.x",
@@ -26,35 +31,83 @@ class QueryAPI(BaseAPI):
             raise TypeError(f"Expected list, but got {type(result).__name__}: {result}")
         return result
 
-    # def run_installed_query_get(
-    #     self, query_name: str, params: Optional[Dict[str, Any]] = None
-    # ) -> List:
-    #     parsed_params = self._parse_query_parameters(params) if params else None
-    #     result = self._request(
-    #         endpoint_name="run_installed_query",
-    #         version="4.x",
-    #         params=parsed_params,
-    #         method="GET",
-    #         query_name=query_name,
-    #     )
-    #     if not isinstance(result, list):
-    #         raise TypeError(f"Expected list, but got {type(result).__name__}: {result}")
-    #     return result
-    #
-    # def run_installed_query_post(
-    #     self, query_name: str, params: Optional[Dict[str, Any]] = None
-    # ) -> List:
-    #     parsed_params = self._parse_query_parameters(params) if params else None
-    #     result = self._request(
-    #         endpoint_name="run_installed_query",
-    #         version="4.x",
-    #         params=parsed_params,
-    #         method="POST",
-    #         query_name=query_name,
-    #     )
-    #     if not isinstance(result, list):
-    #         raise TypeError(f"Expected list, but got {type(result).__name__}: {result}")
-    #     return result
+    def run_interpreted_query_stream(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any] | str] = None,
+        result_key: str = "Nodes",
+        batch_size: int = 1000,
+        result_index: Optional[int] = None,
+    ) -> Iterator[List]:
+        """
+        Runs an interpreted query and streams `results[i][result_key]` in batches.
+        """
+        parsed_params = self._prepare_query_parameters(params)
+        return self._request_stream(
+            endpoint_name="run_interpreted_query",
+            result_key=result_key,
+            version="4.x",
+            batch_size=batch_size,
+            result_index=result_index,
+            data=query,
+            params=parsed_params,
+        )
+
+    def run_installed_query_get(
+        self,
+        graph_name: str,
+        query_name: str,
+        params: Optional[Dict[str, Any] | str] = None,
+    ) -> List:
+        parsed_params = self._prepare_query_parameters(params)
+        result = self._request(
+            endpoint_name="run_installed_query_get",
+            version="4.x",
+            params=parsed_params,
+            graph_name=graph_name,
+            query_name=query_name,
+        )
+        if not isinstance(result, list):
+            raise TypeError(f"Expected list, but got {type(result).__name__}: {result}")
+        return result
+
+    def run_installed_query_post(
+        self, graph_name: str, query_name: str, params: Optional[Dict[str, Any]] = None
+    ) -> List:
+        result = self._request(
+            endpoint_name="run_installed_query_post",
+            version="4.x",
+            json=self._convert_query_parameters_to_json(params or {}),
+            graph_name=graph_name,
+            query_name=query_name,
+        )
+        if not isinstance(result, list):
+            raise TypeError(f"Expected list, but got {type(result).__name__}: {result}")
+        return result
+
+    def needs_post_body(self, params: Optional[Dict[str, Any]]) -> bool:
+        """
+        Whether the parameters would exceed `max_query_string_length` in a URL.
+        """
+        if not params or not any(
+            isinstance(value, (list, set)) for value in params.values()
+        ):
+            # Scalar parameters never come close to the limit
+            return False
+        query_string = urlencode(self._parse_query_parameters(params))
+        return len(query_string) > self.config.max_query_string_length
+
+    def _prepare_query_parameters(
+        self, params: Optional[Dict[str, Any] | str]
+    ) -> Optional[Dict[str, Any] | str]:
+        """
+        Parses query parameters, passing encoded query strings through unchanged.
+        """
+        if not params:
+            return None
+        if isinstance(params, str):
+            return params
+        return self._parse_query_parameters(params)
 
     def _parse_query_parameters(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -91,3 +144,23 @@ class QueryAPI(BaseAPI):
                 parsed_params[key] = str(value)
 
         return parsed_params
+
+    def _convert_query_parameters_to_json(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Converts query parameters into a JSON body for installed queries.
+        """
+
+        def convert(value: Any) -> Any:
+            if isinstance(value, tuple):  # Handling (vertex_primary_id, vertex_type)
+                if len(value) == 2 and isinstance(value[1], str):
+                    return {"id": str(value[0]), "type": value[1]}
+                raise ValueError("Invalid parameter format: expected (id, type).")
+            elif isinstance(value, (list, set)):  # Handling SET<VERTEX> and other lists
+                return [convert(item) for item in value]
+            elif isinstance(value, datetime):  # Convert datetime to string
+                return value.strftime("%Y-%m-%d %H:%M:%S")
+            return value
+
+        return {key: convert(value) for key, value in params.items()}
@@ -0,0 +1,453 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import time
+import httpx
+
+from .endpoint_handler.endpoint_registry import EndpointRegistry
+from .retry_policy import RetryPolicy
+from .request_limiter import RequestLimiter
+from .request_hooks import RequestHook
+from .metrics_registry import MetricsRegistry
+from .host_selector import HostSelector
+from .transport_recorder import (
+    AsyncRecordingTransport,
+    AsyncReplayTransport,
+    TransportRecording,
+)
+from .api import (
+    AsyncAdminAPI,
+    AsyncGSQLAPI,
+    AsyncSchemaAPI,
+    AsyncQueryAPI,
+    AsyncDataAPI,
+)
+
+from tigergraphx.config import TigerGraphConnectionConfig
+
+
+class AsyncTigerGraphAPI:
+    def __init__(
+        self,
+        config: TigerGraphConnectionConfig,
+        endpoint_registry: Optional[EndpointRegistry] = None,
+        hooks: Optional[List[RequestHook]] = None,
+    ):
+        """
+        Initialize AsyncTigerGraphAPI with configuration, endpoint registry, and client.
+
+        All requests share one `httpx.AsyncClient`, so many requests can be awaited
+        concurrently on a single event loop.
+
+        Args:
+            config: Configuration object for TigerGraph connection.
+            endpoint_registry: An existing registry to share, e.g. the one of a
+                `TigerGraphAPI`. A new one is created if not provided.
+            hooks: Request lifecycle hooks, called after the built-in metrics registry.
+        """
+        self.config = config
+
+        # Initialize the EndpointRegistry
+        self.endpoint_registry = endpoint_registry or EndpointRegistry(config=config)
+
+        # Create a shared async client
+        self.session = self._initialize_session()
+
+        # Share one retry policy, and thus one circuit breaker, across all APIs
+        self.retry_policy = RetryPolicy(config)
+
+        # Share the per-endpoint-class concurrency and rate limits across all APIs
+        self.request_limiter = RequestLimiter(config.request_limits)
+
+        # Share one hook list across all APIs; metrics are recorded by default
+        self.metrics = MetricsRegistry()
+        self.hooks: List[RequestHook] = [self.metrics, *(hooks or [])]
+
+        # Spread requests over the hosts of a cluster; failed hosts rejoin after the
+        # health check interval or once `check_hosts` sees them answer
+        self.host_selector = HostSelector(config)
+
+        # Initialize API classes
+        self._admin_api = AsyncAdminAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
+        self._gsql_api = AsyncGSQLAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
+        self._schema_api = AsyncSchemaAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
+        self._query_api = AsyncQueryAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
+        self._data_api = AsyncDataAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
+
+    async def __aenter__(self) -> "AsyncTigerGraphAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    # ------------------------------ Admin ------------------------------
+    async def ping(self) -> str:
+        return await self._admin_api.ping()
+
+    # ------------------------------ GSQL ------------------------------
+    async def gsql(self, command: str) -> str:
+        return await self._gsql_api.gsql(command)
+
+    # ------------------------------ Schema ------------------------------
+    async def get_schema(self, graph_name: str) -> Dict:
+        """
+        Retrieve the schema of a graph.
+
+        Args:
+            graph_name: The name of the graph.
+
+        Returns:
+            The schema as JSON.
+        """
+        return await self._schema_api.get_schema(graph_name)
+
+    # ------------------------------ Query ------------------------------
+    async def run_interpreted_query(
+        self, query: str, params: Optional[Dict[str, Any] | str] = None
+    ) -> List:
+        return await self._query_api.run_interpreted_query(query, params)
+
+    async def run_installed_query(
+        self,
+        graph_name: str,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        use_post: bool = False,
+    ) -> List:
+        """
+        Run an installed query. See `TigerGraphAPI.run_installed_query`.
+        """
+        if use_post or self._query_api.needs_post_body(params):
+            return await self._query_api.run_installed_query_post(
+                graph_name, query_name, params
+            )
+        return await self._query_api.run_installed_query_get(
+            graph_name, query_name, params
+        )
+
+    async def run_many(
+        self,
+        jobs: Sequence[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run independent queries concurrently on the event loop and return their
+        results in order.
+
+        Args:
+            jobs: The query jobs, in the format of `TigerGraphAPI.run_many`.
+            max_concurrency: The maximum number of concurrent queries. Defaults to
+                `pool_maxsize`.
+
+        Returns:
+            The result of each job in the order of `jobs`, or the exception it raised.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.pool_maxsize)
+
+        async def run_job(job: Dict[str, Any]) -> List:
+            async with semaphore:
+                if "query" in job:
+                    return await self.run_interpreted_query(
+                        job["query"], job.get("params")
+                    )
+                if "query_name" in job and "graph_name" in job:
+                    return await self.run_installed_query(
+                        job["graph_name"],
+                        job["query_name"],
+                        job.get("params"),
+                        use_post=job.get("use_post", False),
+                    )
+                raise ValueError(
+                    "A query job needs either 'query', or 'graph_name' and "
+                    f"'query_name'; got keys: {', '.join(job)}."
+                )
+
+        return list(
+            await asyncio.gather(*(run_job(job) for job in jobs), return_exceptions=True)
+        )
+
+    # ------------------------------ Data ------------------------------
+    async def upsert_graph_data(
+        self,
+        graph_name: str,
+        payload: Dict[str, Any],
+        vertex_must_exist: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Upsert vertices and edges with one REST++ request.
+
+        Args:
+            graph_name: The name of the graph.
+            payload: The REST++ upsert payload with `vertices` and/or `edges`.
+            vertex_must_exist: Whether to skip edges whose endpoints do not exist
+                instead of creating the missing vertices.
+
+        Returns:
+            The accepted and skipped vertex and edge counts.
+        """
+        return await self._data_api.upsert_graph_data(
+            graph_name, payload, vertex_must_exist
+        )
+
+    async def upsert_vertices(
+        self,
+        graph_name: str,
+        vertex_type: str,
+        vertices: Sequence[Tuple[str | int, Dict[str, Any]]],
+    ) -> Dict[str, int]:
+        """
+        Upsert vertices of one type with one REST++ request.
+
+        Args:
+            graph_name: The name of the graph.
+            vertex_type: The vertex type.
+            vertices: (ID, attributes) pairs. An attribute given as a (value, op)
+                tuple is applied with the REST++ update operator `op`.
+
+        Returns:
+            The accepted and skipped vertex and edge counts.
+        """
+        payload = AsyncDataAPI.build_vertices_payload(vertex_type, vertices)
+        return await self._data_api.upsert_graph_data(graph_name, payload)
+
+    async def upsert_edges(
+        self,
+        graph_name: str,
+        src_vertex_type: str,
+        edge_type: str,
+        tgt_vertex_type: str,
+        edges: Sequence[Tuple[str | int, str | int, Dict[str, Any]]],
+        vertex_must_exist: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Upsert edges of one type with one REST++ request.
+
+        Args:
+            graph_name: The name of the graph.
+            src_vertex_type: The source vertex type.
+            edge_type: The edge type.
+            tgt_vertex_type: The target vertex type.
+            edges: (source ID, target ID, attributes) triples.
+            vertex_must_exist: Whether to skip edges whose endpoints do not exist
+                instead of creating the missing vertices.
+
+        Returns:
+            The accepted and skipped vertex and edge counts.
+        """
+        payload = AsyncDataAPI.build_edges_payload(
+            src_vertex_type, edge_type, tgt_vertex_type, edges
+        )
+        return await self._data_api.upsert_graph_data(
+            graph_name, payload, vertex_must_exist
+        )
+
+    async def delete_vertices(
+        self,
+        graph_name: str,
+        vertex_type: str,
+        vertex_ids: Optional[Sequence[str | int]] = None,
+    ) -> int:
+        """
+        Delete vertices by ID, or all vertices of a type.
+
+        Args:
+            graph_name: The name of the graph.
+            vertex_type: The vertex type.
+            vertex_ids: The IDs of the vertices to delete. All vertices of the type
+                are deleted if None.
+
+        Returns:
+            The number of deleted vertices.
+        """
+        return await self._data_api.delete_vertices(graph_name, vertex_type, vertex_ids)
+
+    # ------------------------------ Cluster ------------------------------
+    async def check_hosts(self) -> Dict[str, bool]:
+        """
+        Ping every configured host and update which hosts receive requests.
+
+        Returns:
+            Whether each host answered the ping.
+        """
+        results = {}
+        for host in self.host_selector.hosts:
+            start = time.perf_counter()
+            try:
+                await self._admin_api.ping(host=host)
+            except Exception:
+                self.host_selector.mark_down(host)
+                results[host] = False
+            else:
+                self.host_selector.record_success(host, time.perf_counter() - start)
+                results[host] = True
+        return results
+
+    def get_host_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve the health and moving-average latency of every configured host.
+
+        Returns:
+            A dictionary keyed by host URL with whether the host is healthy, its
+            latency in seconds and whether it serves sticky requests such as GSQL.
+        """
+        return self.host_selector.get_host_stats()
+
+    # ------------------------------ Connection Pool ------------------------------
+    def get_limiter_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve queueing metrics of the client-side request limits.
+
+        Returns:
+            A dictionary keyed by endpoint class with the current in-flight requests,
+            queue depth, maximum queue depth and wait times in seconds.
+        """
+        return self.request_limiter.get_stats()
+
+    # ------------------------------ Observability ------------------------------
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Register a hook that is called on the lifecycle events of every request.
+
+        Args:
+            hook: The hook, overriding any of `on_request_start`, `on_response` and
+                `on_error`.
+        """
+        self.hooks.append(hook)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve the request metrics recorded per endpoint.
+
+        Returns:
+            For each endpoint, the request, retry, status code, error and byte counters,
+            and a latency histogram with cumulative bucket counts.
+        """
+        return self.metrics.to_dict()
+
+    def export_metrics(self, prefix: str = "tigergraphx") -> str:
+        """
+        Export the request metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: The prefix of the metric names.
+
+        Returns:
+            The metrics as Prometheus text.
+        """
+        return self.metrics.to_prometheus(prefix)
+
+    async def close(self) -> None:
+        """
+        Close the shared async client and release all pooled connections. In record
+        mode, the recording is saved to `transport_file`.
+        """
+        await self.session.aclose()
+        self.save_recording()
+
+    def save_recording(self) -> None:
+        """
+        Save the requests recorded so far to `transport_file`. Does nothing unless
+        `transport_mode` is 'record'.
+        """
+        if self.config.transport_mode == "record" and self.recording is not None:
+            self.recording.save(self.config.transport_file)  # pyright: ignore
+
+    def _initialize_session(self) -> httpx.AsyncClient:
+        """
+        Create a shared httpx.AsyncClient sized from the connection pool settings.
+
+        Returns:
+            A configured async client.
+        """
+        limits = httpx.Limits(
+            max_connections=self.config.pool_connections * self.config.pool_maxsize,
+            max_keepalive_connections=self.config.pool_maxsize,
+        )
+        # Record live traffic, or answer requests from a recording without a server
+        self.recording: Optional[TransportRecording] = None
+        transport: Optional[httpx.AsyncBaseTransport] = None
+        if self.config.transport_mode == "replay":
+            self.recording = TransportRecording.load(self.config.transport_file)  # pyright: ignore
+            transport = AsyncReplayTransport(
+                self.recording, latency=self.config.replay_latency
+            )
+        elif self.config.transport_mode == "record":
+            self.recording = TransportRecording()
+            transport = AsyncRecordingTransport(
+                httpx.AsyncHTTPTransport(limits=limits), self.recording
+            )
+        return httpx.AsyncClient(
+            auth=self._get_auth(), limits=limits, timeout=None, transport=transport
+        )
+
+    def _get_auth(self) -> Optional[httpx.Auth]:
+        """
+        Generate authentication object for the client.
+
+        Returns:
+            BasicAuth for username/password or secret, BearerAuth for tokens, or None.
+        """
+        if self.config.secret:
+            return httpx.BasicAuth("__GSQL__secret", self.config.secret)
+        elif self.config.username and self.config.password:
+            return httpx.BasicAuth(self.config.username, self.config.password)
+        elif self.config.token:
+            return AsyncBearerAuth(self.config.token)
+        return None  # No authentication needed
+
+
+class AsyncBearerAuth(httpx.Auth):
+    """Custom authentication class for handling Bearer tokens."""
+
+    def __init__(self, token):
+        self.token = token
+
+    def auth_flow(self, request):
+        request.headers["Authorization"] = f"Bearer {self.token}"
+        yield request
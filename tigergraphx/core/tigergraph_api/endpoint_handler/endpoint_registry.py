@@ -5,7 +5,9 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Literal, Optional, Tuple
+from functools import lru_cache
+from string import Formatter
 import yaml
 from pathlib import Path
 
@@ -16,6 +18,9 @@ DEFAULT_ENDPOINT_PATH = (
     / "config/endpoint_definitions.yaml"
 )
 
+SUPPORTED_COMPRESSIONS = ("none", "gzip", "deflate")
+VERSIONS = ("3.x", "4.x")
+
 
 class EndpointRegistry:
     def __init__(
@@ -24,26 +29,40 @@ class EndpointRegistry:
         endpoint_path: Optional[Path] = None,
     ):
         """
-        Initializes the registry and precomputes endpoints.
+        Initializes the registry and compiles endpoints for the given config.
+
+        The endpoint definitions are parsed once per process and file version, so
+        creating further registries only binds the endpoints to the config's host and
+        ports.
         """
-        endpoint_path = endpoint_path or DEFAULT_ENDPOINT_PATH
-        with open(endpoint_path, "r") as file:
-            self.raw_config = yaml.safe_load(file)
+        endpoint_path = Path(endpoint_path or DEFAULT_ENDPOINT_PATH)
+        self.raw_config, self.endpoints = _load_endpoint_definitions(
+            str(endpoint_path), endpoint_path.stat().st_mtime_ns
+        )
 
         self.config = config
-        self.endpoints = self._precompute_endpoints()
-
-    def _precompute_endpoints(self) -> Dict[str, Dict[str, Any]]:
+        self.base_url = str(config.host).rstrip("/")
+        self._compiled = {
+            (name, version): self._compile_endpoint(name, version)
+            for name in self.endpoints
+            for version in VERSIONS
+        }
+
+    @staticmethod
+    def _precompute_endpoints(raw_config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
         Precomputes endpoints based on the YAML configuration and global settings.
         """
         endpoints = {}
-        defaults = self.raw_config.get("defaults", {})
+        defaults = raw_config.get("defaults", {})
         default_method = defaults.get("method", "GET")
         default_port = defaults.get("port", "gsql_port")
         default_content_type = defaults.get("content_type", "application/json")
+        default_compression = defaults.get("compression", "none")
+        default_limit_class = defaults.get("limit_class", "default")
+        default_sticky = defaults.get("sticky", False)
 
-        for name, details in self.raw_config["endpoints"].items():
+        for name, details in raw_config["endpoints"].items():
             # Retrieve path
             path = details.get("path", {})
             if isinstance(path, dict):
@@ -72,53 +91,139 @@ class EndpointRegistry:
             else:
                 content_types = {"3.x": content_type, "4.x": content_type}
 
+            # Retrieve compression
+            compression = details.get("compression", default_compression)
+            if isinstance(compression, dict):
+                compressions = compression  # Version-specific compressions
+            else:
+                compressions = {"3.x": compression, "4.x": compression}
+            for value in compressions.values():
+                if value not in SUPPORTED_COMPRESSIONS:
+                    raise ValueError(
+                        f"Unsupported compression '{value}' in endpoint '{name}'. "
+                        f"Expected one of: {', '.join(SUPPORTED_COMPRESSIONS)}."
+                    )
+
+            # Retrieve idempotent; defaults to whether the method is GET
+            idempotent = details.get("idempotent")
+            if isinstance(idempotent, dict):
+                idempotents = idempotent  # Version-specific flags
+            elif idempotent is not None:
+                idempotents = {"3.x": idempotent, "4.x": idempotent}
+            else:
+                idempotents = {
+                    version: method == "GET" for version, method in methods.items()
+                }
+
+            # Retrieve limit_class
+            limit_class = details.get("limit_class", default_limit_class)
+            if isinstance(limit_class, dict):
+                limit_classes = limit_class  # Version-specific limit classes
+            else:
+                limit_classes = {"3.x": limit_class, "4.x": limit_class}
+
+            # Retrieve sticky
+            sticky = details.get("sticky", default_sticky)
+            if isinstance(sticky, dict):
+                stickies = sticky  # Version-specific flags
+            else:
+                stickies = {"3.x": sticky, "4.x": sticky}
+
             endpoints[name] = {
                 "paths": paths,
                 "methods": methods,
                 "ports": ports,
                 "content_types": content_types,
+                "compressions": compressions,
+                "idempotents": idempotents,
+                "limit_classes": limit_classes,
+                "stickies": stickies,
             }
 
         return endpoints
 
-    def get_endpoint(
-        self, name: str, version: Literal["4.x", "3.x"] = "4.x", **kwargs
-    ) -> Dict[str, Any]:
+    def _compile_endpoint(self, name: str, version: str) -> Dict[str, Any]:
         """
-        Retrieves the precomputed endpoint details for a given name and version.
+        Resolves the details of an endpoint version once, binding its URL to the
+        configured host and port. Missing definitions are kept as errors, raised
+        when the endpoint version is requested.
         """
-        if name not in self.endpoints:
-            raise ValueError(f"Endpoint '{name}' not found in registry.")
-
         endpoint = self.endpoints[name]
+        for key, label in [
+            ("paths", "Path"),
+            ("methods", "Method"),
+            ("ports", "Port"),
+            ("content_types", "Content type"),
+        ]:
+            if version not in endpoint[key]:
+                return {
+                    "error": f"{label} not defined for version '{version}' in "
+                    f"endpoint '{name}'."
+                }
 
-        # Resolve path
-        if version not in endpoint["paths"]:
-            raise ValueError(
-                f"Path not defined for version '{version}' in endpoint '{name}'."
-            )
         path_template = endpoint["paths"][version]
-        path = path_template.format(**kwargs)
-
-        # Resolve method
-        if version not in endpoint["methods"]:
-            raise ValueError(
-                f"Method not defined for version '{version}' in endpoint '{name}'."
-            )
         method = endpoint["methods"][version]
-
-        # Resolve port
-        if version not in endpoint["ports"]:
-            raise ValueError(
-                f"Port not defined for version '{version}' in endpoint '{name}'."
-            )
         port = endpoint["ports"][version]
+        port_value = getattr(self.config, port)
+        # Paths without placeholders are built once rather than on every request
+        has_fields = any(
+            field is not None for _, field, _, _ in Formatter().parse(path_template)
+        )
+        return {
+            "path_template": path_template,
+            "url_prefix": f"{self.base_url}:{port_value}",
+            "has_fields": has_fields,
+            "details": {
+                "method": method,
+                "port": port,
+                "port_value": port_value,
+                "content_type": endpoint["content_types"][version],
+                # Endpoints without a compression policy send bodies as-is
+                "compression": endpoint["compressions"].get(version, "none"),
+                # Only idempotent requests are retried after the server may have
+                # processed them
+                "idempotent": endpoint["idempotents"].get(version, method == "GET"),
+                # Selects the client-side concurrency and rate limits
+                "limit_class": endpoint["limit_classes"].get(version, "default"),
+                # Sticky requests keep using one host of a cluster
+                "sticky": endpoint["stickies"].get(version, False),
+            },
+        }
 
-        # Resolve content_type
-        if version not in endpoint["content_types"]:
+    def get_endpoint(
+        self, name: str, version: Literal["4.x", "3.x"] = "4.x", **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Retrieves the precomputed endpoint details for a given name and version.
+        `url` is the full request URL on the configured host.
+        """
+        compiled = self._compiled.get((name, version))
+        if compiled is None:
+            if name not in self.endpoints:
+                raise ValueError(f"Endpoint '{name}' not found in registry.")
             raise ValueError(
-                f"Content type not defined for version '{version}' in endpoint '{name}'."
+                f"Path not defined for version '{version}' in endpoint '{name}'."
             )
-        content_type = endpoint["content_types"][version]
-
-        return {"path": path, "method": method, "port": port, "content_type": content_type}
+        if "error" in compiled:
+            raise ValueError(compiled["error"])
+
+        path = compiled["path_template"]
+        if compiled["has_fields"]:
+            path = path.format(**kwargs)
+        endpoint = compiled["details"].copy()
+        endpoint["path"] = path
+        endpoint["url"] = compiled["url_prefix"] + path
+        return endpoint
+
+
+@lru_cache(maxsize=None)
+def _load_endpoint_definitions(
+    endpoint_path: str, mtime_ns: int
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Parses and precomputes an endpoint definition file once per process. The
+    modification time is part of the key, so an edited file is parsed again.
+    """
+    with open(endpoint_path, "r") as file:
+        raw_config = yaml.safe_load(file)
+    return raw_config, EndpointRegistry._precompute_endpoints(raw_config)
@@ -0,0 +1,196 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+import logging
+import threading
+import time
+
+import httpx
+from requests.exceptions import ConnectionError, Timeout
+
+from tigergraphx.config import TigerGraphConnectionConfig
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in the moving average of host latencies
+LATENCY_SMOOTHING = 0.3
+
+
+class HostSelector:
+    """
+    Thread-safe selection of a cluster node for each request attempt.
+
+    Requests are spread over healthy hosts round-robin or by the lowest moving-average
+    latency. Sticky endpoints, e.g. GSQL DDL, keep using one host until it fails, so
+    statements that depend on each other are seen by the same node. A host that fails
+    at the transport level is taken out of rotation for `health_check_interval`
+    seconds; after that it rejoins once it answers a ping, or right away if no ping
+    function is given. Only one request pings a host at a time, and other requests
+    skip the host until the ping succeeds.
+    """
+
+    def __init__(
+        self,
+        config: TigerGraphConnectionConfig,
+        ping: Optional[Callable[[str], Any]] = None,
+    ):
+        self.hosts = self._get_hosts(config)
+        self.load_balancing = config.load_balancing
+        self.health_check_interval = config.health_check_interval
+        self._ping = ping
+        self._lock = threading.Lock()
+        self._next_index = 0
+        self._sticky_host = self.hosts[0]
+        self._down_since: Dict[str, float] = {}
+        self._probing: Set[str] = set()
+        self._latencies: Dict[str, float] = {}
+
+    def select(self, endpoint: Dict[str, Any]) -> str:
+        """
+        Select the host for one attempt of a request to the given endpoint.
+
+        Args:
+            endpoint: The resolved endpoint details.
+
+        Returns:
+            The base URL of the selected host.
+        """
+        if len(self.hosts) == 1:
+            return self.hosts[0]
+        healthy = self._get_healthy_hosts()
+        with self._lock:
+            if endpoint.get("sticky", False):
+                if self._sticky_host not in healthy:
+                    previous, self._sticky_host = self._sticky_host, healthy[0]
+                    logger.warning(
+                        f"Moving sticky requests from {previous} to {self._sticky_host}."
+                    )
+                return self._sticky_host
+            if self.load_balancing == "least_latency":
+                # Hosts without samples come first, so every host gets measured
+                return min(healthy, key=lambda host: self._latencies.get(host, 0.0))
+            host = healthy[self._next_index % len(healthy)]
+            self._next_index += 1
+            return host
+
+    def call(self, host: str, send: Callable[[], Any]) -> Any:
+        """
+        Send a request to a host and record its latency or failure.
+        """
+        start = time.perf_counter()
+        try:
+            response = send()
+        except Exception as e:
+            self._record_exception(host, e)
+            raise
+        self.record_success(host, time.perf_counter() - start)
+        return response
+
+    async def call_async(self, host: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async counterpart of `call`.
+        """
+        start = time.perf_counter()
+        try:
+            response = await send()
+        except Exception as e:
+            self._record_exception(host, e)
+            raise
+        self.record_success(host, time.perf_counter() - start)
+        return response
+
+    def record_success(self, host: str, latency: float) -> None:
+        with self._lock:
+            self._down_since.pop(host, None)
+            previous = self._latencies.get(host)
+            self._latencies[host] = (
+                latency
+                if previous is None
+                else LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * previous
+            )
+
+    def mark_down(self, host: str) -> None:
+        with self._lock:
+            if host not in self._down_since:
+                logger.warning(f"Taking host {host} out of rotation.")
+            self._down_since[host] = time.monotonic()
+
+    def check_hosts(self) -> Dict[str, bool]:
+        """
+        Ping every host and update its health.
+
+        Returns:
+            Whether each host answered the ping.
+        """
+        return {host: self._probe(host) for host in self.hosts}
+
+    def get_host_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the health and moving-average latency in seconds of every host.
+        """
+        with self._lock:
+            return {
+                host: {
+                    "healthy": host not in self._down_since,
+                    "latency": self._latencies.get(host),
+                    "sticky": host == self._sticky_host,
+                }
+                for host in self.hosts
+            }
+
+    def _get_healthy_hosts(self) -> List[str]:
+        now = time.monotonic()
+        with self._lock:
+            # Only one caller pings each host; the others skip it meanwhile
+            expired = [
+                host
+                for host, down_since in self._down_since.items()
+                if now - down_since >= self.health_check_interval
+                and host not in self._probing
+            ]
+            if self._ping is None:
+                for host in expired:
+                    self._down_since.pop(host, None)
+                expired = []
+            self._probing.update(expired)
+        for host in expired:
+            try:
+                self._probe(host)
+            finally:
+                with self._lock:
+                    self._probing.discard(host)
+        with self._lock:
+            healthy = [host for host in self.hosts if host not in self._down_since]
+        # With every host down, keep trying them all rather than failing outright
+        return healthy or list(self.hosts)
+
+    def _probe(self, host: str) -> bool:
+        if self._ping is None:
+            return host not in self._down_since
+        start = time.perf_counter()
+        try:
+            self._ping(host)
+        except Exception as e:
+            logger.debug(f"Ping of host {host} failed: {type(e).__name__} - {e}")
+            self.mark_down(host)
+            return False
+        self.record_success(host, time.perf_counter() - start)
+        return True
+
+    def _record_exception(self, host: str, exception: BaseException) -> None:
+        if isinstance(exception, (ConnectionError, Timeout, httpx.TransportError)):
+            self.mark_down(host)
+
+    @staticmethod
+    def _get_hosts(config: TigerGraphConnectionConfig) -> List[str]:
+        hosts = []
+        for url in [config.host, *config.hosts]:
+            host = str(url).rstrip("/")
+            if host not in hosts:
+                hosts.append(host)
+        return hosts
@@ -0,0 +1,97 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import socket
+from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+SocketOption = Tuple[int, int, int]
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that keeps warm keep-alive connections per host and reports pool usage.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        socket_options: Optional[List[SocketOption]] = None,
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            pool_connections: The number of per-host connection pools to cache.
+            pool_maxsize: The maximum number of connections to keep alive per host.
+            pool_block: Whether to wait for a free connection when the pool is exhausted.
+            socket_options: Socket options applied to every new connection.
+        """
+        # Must be set before HTTPAdapter.__init__, which calls init_poolmanager
+        self._socket_options = socket_options
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self._socket_options is not None:
+            pool_kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def get_pool_stats(self) -> Dict[str, int]:
+        """
+        Return connection reuse counters aggregated over the live host pools.
+
+        A pool hit is a request served on an already open connection, and a pool
+        miss is a request that had to open a new connection.
+
+        Returns:
+            A dictionary with the number of pools, requests, hits and misses.
+        """
+        pools = self.poolmanager.pools
+        num_requests = 0
+        num_connections = 0
+        keys = pools.keys()
+        for key in keys:
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            num_requests += pool.num_requests
+            num_connections += pool.num_connections
+        return {
+            "pools": len(keys),
+            "requests": num_requests,
+            "pool_hits": max(num_requests - num_connections, 0),
+            "pool_misses": num_connections,
+        }
+
+    @staticmethod
+    def build_socket_options(
+        tcp_keepalive: bool = True,
+        extra_options: Optional[List[SocketOption]] = None,
+    ) -> List[SocketOption]:
+        """
+        Build the socket options for new connections on top of urllib3's defaults.
+
+        Args:
+            tcp_keepalive: Whether to enable SO_KEEPALIVE.
+            extra_options: Additional (level, option, value) tuples.
+
+        Returns:
+            The list of socket options.
+        """
+        options: List[SocketOption] = list(HTTPConnection.default_socket_options)
+        if tcp_keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        for option in extra_options or []:
+            options.append(tuple(option))  # pyright: ignore
+        return options
@@ -0,0 +1,215 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+_WHITESPACE = " \t\r\n"
+# Characters that may continue a number, e.g. "1" in "1.5e3"
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+class JSONStreamReader:
+    """
+    Incremental reader over a JSON document delivered in chunks.
+
+    Only the container structure the caller walks through is parsed by hand; every
+    other value is decoded with `json.JSONDecoder.raw_decode`, so the buffer never
+    holds more than the value being decoded plus one chunk.
+    """
+
+    def __init__(self, chunks: Iterable[bytes | str]):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """
+        Return the next non-whitespace character without consuming it, or "" at EOF.
+        """
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """
+        Consume the next non-whitespace character, which must be `char`.
+        """
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Invalid JSON stream: expected '{char}' but got '{found or 'EOF'}'."
+            )
+        self._pos += 1
+
+    def value(self) -> Any:
+        """
+        Decode and consume the next complete JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk, and
+            # one cut off at a chunk boundary may end before a "." or an exponent
+            if (
+                isinstance(obj, (int, float))
+                and not isinstance(obj, bool)
+                and (end == len(self._buffer) or self._buffer[end] in _NUMBER_CHARS)
+                and not self._eof
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return obj
+
+    def _fill(self) -> bool:
+        """
+        Append the next chunk to the buffer, dropping the consumed prefix.
+        """
+        if self._eof:
+            return False
+        text = ""
+        for chunk in self._chunks:
+            text = (
+                self._text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            )
+            if text:
+                break
+        else:
+            text = self._text_decoder.decode(b"", final=True)
+            self._eof = True
+        if not text:
+            return False
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return True
+
+
+def iter_result_records(
+    chunks: Iterable[bytes | str],
+    result_key: str,
+    result_index: Optional[int] = None,
+    header: Optional[Dict[str, Any]] = None,
+) -> Iterator[Any]:
+    """
+    Stream the items of `results[i][result_key]` from a TigerGraph JSON response.
+
+    Args:
+        chunks: The response body as an iterable of byte or text chunks.
+        result_key: The key of the list inside each result object, e.g. "Nodes".
+        result_index: Only stream from this result object. All result objects are
+            streamed if None.
+        header: If provided, receives the top-level keys other than "results",
+            such as "error" and "message".
+
+    Returns:
+        An iterator over the decoded items.
+    """
+    reader = JSONStreamReader(chunks)
+    header = header if header is not None else {}
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "results" and reader.peek() == "[":
+            yield from _iter_results_array(reader, result_key, result_index)
+        else:
+            header[key] = reader.value()
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("}")
+        return
+
+
+def _iter_results_array(
+    reader: JSONStreamReader, result_key: str, result_index: Optional[int]
+) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    index = 0
+    while True:
+        selected = result_index is None or result_index == index
+        if selected and reader.peek() == "{":
+            yield from _iter_result_object(reader, result_key)
+        else:
+            reader.value()
+        index += 1
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("]")
+        return
+
+
+def _iter_result_object(reader: JSONStreamReader, result_key: str) -> Iterator[Any]:
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == result_key and reader.peek() == "[":
+            yield from _iter_array_items(reader)
+        else:
+            reader.value()
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("}")
+        return
+
+
+def _iter_array_items(reader: JSONStreamReader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("]")
+        return
+
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Group an iterator of items into lists of at most `batch_size` items.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
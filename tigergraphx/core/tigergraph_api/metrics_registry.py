@@ -0,0 +1,250 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Sequence, Tuple
+from bisect import bisect_left
+import threading
+
+from .request_hooks import RequestContext, RequestHook
+
+# Upper bounds in seconds, from fast REST++ lookups to long-running GSQL statements
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram in the Prometheus layout.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        # The last count is the +Inf bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            buckets[_format_bound(bound)] = cumulative
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+
+class EndpointMetrics:
+    """
+    Metrics of one endpoint.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = Histogram(buckets)
+        self.requests = 0
+        self.errors: Dict[str, int] = {}
+        self.status_codes: Dict[int, int] = {}
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "status_codes": dict(self.status_codes),
+            "errors": dict(self.errors),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "latency_seconds": self.latency.to_dict(),
+        }
+
+
+class MetricsRegistry(RequestHook):
+    """
+    In-process request metrics per endpoint, recorded through the request hooks.
+
+    Records latency histograms, request and response payload sizes, status codes,
+    errors and retries. Export them with `to_dict` or `to_prometheus`.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def on_response(self, context: RequestContext, response: Any) -> None:
+        with self._lock:
+            metrics = self._get_endpoint_metrics(context.endpoint_name)
+            self._record(metrics, context)
+            if context.status_code is not None:
+                metrics.status_codes[context.status_code] = (
+                    metrics.status_codes.get(context.status_code, 0) + 1
+                )
+            metrics.response_bytes += context.response_size or 0
+
+    def on_error(self, context: RequestContext, error: BaseException) -> None:
+        with self._lock:
+            metrics = self._get_endpoint_metrics(context.endpoint_name)
+            self._record(metrics, context)
+            error_type = type(error).__name__
+            metrics.errors[error_type] = metrics.errors.get(error_type, 0) + 1
+
+    def reset(self) -> None:
+        """
+        Discard all recorded metrics.
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Export the metrics as a dictionary keyed by endpoint name.
+
+        Returns:
+            For each endpoint, the request, retry, status code, error and byte counters,
+            and a latency histogram with cumulative bucket counts keyed by upper bound.
+        """
+        with self._lock:
+            return {
+                name: metrics.to_dict() for name, metrics in self._endpoints.items()
+            }
+
+    def to_prometheus(self, prefix: str = "tigergraphx") -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: The prefix of the metric names.
+
+        Returns:
+            The metrics as Prometheus text.
+        """
+        snapshot = self.to_dict()
+        lines: List[str] = []
+
+        def add_metric(
+            name: str, metric_type: str, help_text: str, samples: List[Tuple[str, Any]]
+        ) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            for suffix_and_labels, value in samples:
+                lines.append(f"{prefix}_{name}{suffix_and_labels} {value}")
+
+        add_metric(
+            "request_duration_seconds",
+            "histogram",
+            "Latency of TigerGraph API requests, including retries.",
+            [
+                sample
+                for endpoint, metrics in snapshot.items()
+                for sample in _histogram_samples(endpoint, metrics["latency_seconds"])
+            ],
+        )
+        add_metric(
+            "requests_total",
+            "counter",
+            "TigerGraph API requests by status code.",
+            [
+                (_labels(endpoint, status_code=code), count)
+                for endpoint, metrics in snapshot.items()
+                for code, count in sorted(metrics["status_codes"].items())
+            ],
+        )
+        add_metric(
+            "request_errors_total",
+            "counter",
+            "TigerGraph API requests that failed without a response.",
+            [
+                (_labels(endpoint, error=error), count)
+                for endpoint, metrics in snapshot.items()
+                for error, count in sorted(metrics["errors"].items())
+            ],
+        )
+        add_metric(
+            "request_retries_total",
+            "counter",
+            "Retry attempts of TigerGraph API requests.",
+            [
+                (_labels(endpoint), metrics["retries"])
+                for endpoint, metrics in snapshot.items()
+            ],
+        )
+        add_metric(
+            "request_bytes_total",
+            "counter",
+            "Request payload bytes sent, after compression.",
+            [
+                (_labels(endpoint), metrics["request_bytes"])
+                for endpoint, metrics in snapshot.items()
+            ],
+        )
+        add_metric(
+            "response_bytes_total",
+            "counter",
+            "Response payload bytes received.",
+            [
+                (_labels(endpoint), metrics["response_bytes"])
+                for endpoint, metrics in snapshot.items()
+            ],
+        )
+        return "\n".join(lines) + "\n"
+
+    def _get_endpoint_metrics(self, endpoint_name: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(endpoint_name)
+        if metrics is None:
+            metrics = EndpointMetrics(self.buckets)
+            self._endpoints[endpoint_name] = metrics
+        return metrics
+
+    @staticmethod
+    def _record(metrics: EndpointMetrics, context: RequestContext) -> None:
+        metrics.requests += 1
+        metrics.retries += context.retries
+        metrics.request_bytes += context.request_size
+        metrics.latency.observe(context.elapsed)
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _labels(endpoint: str, **labels: Any) -> str:
+    pairs = {"endpoint": endpoint, **labels}
+    escaped = (
+        str(value).replace("\\", "\\\\").replace('"', '\\"') for value in pairs.values()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(pairs, escaped)) + "}"
+
+
+def _histogram_samples(
+    endpoint: str, histogram: Dict[str, Any]
+) -> List[Tuple[str, Any]]:
+    samples = [
+        ("_bucket" + _labels(endpoint, le=bound), count)
+        for bound, count in histogram["buckets"].items()
+    ]
+    samples.append(("_sum" + _labels(endpoint), histogram["sum"]))
+    samples.append(("_count" + _labels(endpoint), histogram["count"]))
+    return samples
@@ -0,0 +1,198 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Dict, List, Literal, Optional
+from urllib.parse import urlencode
+import hashlib
+import re
+import threading
+
+# Prefix of the names of automatically installed queries
+QUERY_NAME_PREFIX = "tgx_"
+
+QueryState = Literal["installed", "failed"]
+
+_INTERPRETED_QUERY = re.compile(
+    r"^\s*INTERPRET\s+QUERY\s*\((?P<params>.*?)\)\s*FOR\s+GRAPH\s+(?P<graph>\w+)\s*"
+    r"\{(?P<body>.*)\}\s*$",
+    re.DOTALL | re.IGNORECASE,
+)
+_LIMIT_LITERAL = re.compile(r"\bLIMIT\s+(\d+)\b", re.IGNORECASE)
+_STRING_LITERAL = re.compile(r'"((?:[^"\\]|\\.)*)"')
+# A LIMIT outside string literals; strings are matched too so that they are skipped
+_LIMIT_OUTSIDE_STRINGS = re.compile(
+    _STRING_LITERAL.pattern + "|" + _LIMIT_LITERAL.pattern, re.IGNORECASE
+)
+_ESCAPED_CHARACTER = re.compile(r"\\(.)")
+
+
+class QueryShape:
+    """
+    An interpreted query turned into an installable query.
+
+    LIMIT values and string literals of the body are lifted into parameters, so that
+    queries that only differ in them share one installed query.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        graph_name: str,
+        definition: str,
+        literals: Dict[str, str],
+    ):
+        self.name = name
+        self.graph_name = graph_name
+        self.definition = definition
+        self.literals = literals
+
+    def bind(
+        self, params: Optional[Dict[str, Any] | str]
+    ) -> Optional[Dict[str, Any] | str]:
+        """
+        Add the lifted literals to the parameters of a call.
+
+        Args:
+            params: The parameters of the interpreted query, as a dictionary or an
+                encoded query string.
+
+        Returns:
+            The parameters of the installed query in the same form.
+        """
+        if not self.literals:
+            return params
+        if isinstance(params, str):
+            return "&".join(filter(None, [params, urlencode(self.literals)]))
+        return {**(params or {}), **self.literals}
+
+    def get_install_command(self) -> str:
+        """
+        Return the GSQL command that creates and installs the query.
+        """
+        return (
+            f"USE GRAPH {self.graph_name}\n"
+            f"{self.definition}\n"
+            f"INSTALL QUERY {self.name}"
+        )
+
+
+class QueryCatalog:
+    """
+    Thread-safe record of the generated queries installed on each graph.
+
+    Installed query names are derived from a hash of the query definition, so a
+    query installed by one process is found by every other process that generates the
+    same shape.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: Dict[str, Dict[str, QueryState]] = {}
+        self._install_locks: Dict[str, threading.Lock] = {}
+        self._call_counts: Dict[str, int] = {}
+
+    @staticmethod
+    def get_shape(query: str) -> Optional[QueryShape]:
+        """
+        Turn an interpreted query into an installable query.
+
+        Args:
+            query: The text of an `INTERPRET QUERY`.
+
+        Returns:
+            The query shape, or None if the query cannot be parsed.
+        """
+        match = _INTERPRETED_QUERY.match(query)
+        if match is None:
+            return None
+        graph_name = match.group("graph")
+        params = [p.strip() for p in match.group("params").split(",") if p.strip()]
+        literals: Dict[str, str] = {}
+
+        def lift_limit(limit: re.Match) -> str:
+            if limit.group(2) is None:
+                return limit.group(0)
+            name = f"tgx_limit_{len(literals)}"
+            literals[name] = limit.group(2)
+            params.append(f"INT {name}")
+            return f"LIMIT {name}"
+
+        def lift_string(string: re.Match) -> str:
+            name = f"tgx_string_{len(literals)}"
+            literals[name] = _ESCAPED_CHARACTER.sub(r"\1", string.group(1))
+            params.append(f"STRING {name}")
+            return name
+
+        body = _LIMIT_OUTSIDE_STRINGS.sub(lift_limit, match.group("body"))
+        body = _STRING_LITERAL.sub(lift_string, body)
+        signature = ", ".join(params)
+        # Whitespace does not change the query, so it does not change the name either
+        digest = hashlib.sha1(
+            " ".join(f"{graph_name} ({signature}) {body}".split()).encode("utf-8")
+        ).hexdigest()[:16]
+        name = f"{QUERY_NAME_PREFIX}{digest}"
+        definition = (
+            f"CREATE OR REPLACE QUERY {name}({signature}) FOR GRAPH {graph_name} "
+            f"{{{body}}}"
+        )
+        return QueryShape(name, graph_name, definition, literals)
+
+    def get_state(self, shape: QueryShape) -> Optional[QueryState]:
+        with self._lock:
+            return self._states.get(shape.graph_name, {}).get(shape.name)
+
+    def set_state(self, shape: QueryShape, state: QueryState) -> None:
+        with self._lock:
+            self._states.setdefault(shape.graph_name, {})[shape.name] = state
+
+    def count_call(self, shape: QueryShape) -> int:
+        """
+        Count a run of a query shape.
+
+        Returns:
+            The number of runs of the shape so far, including this one.
+        """
+        key = f"{shape.graph_name}.{shape.name}"
+        with self._lock:
+            self._call_counts[key] = self._call_counts.get(key, 0) + 1
+            return self._call_counts[key]
+
+    def get_install_lock(self, shape: QueryShape) -> threading.Lock:
+        """
+        Return the lock that serializes installing one query shape.
+        """
+        with self._lock:
+            return self._install_locks.setdefault(
+                f"{shape.graph_name}.{shape.name}", threading.Lock()
+            )
+
+    def get_installed_queries(self) -> Dict[str, List[str]]:
+        """
+        Return the names of the installed queries of each graph.
+        """
+        with self._lock:
+            return {
+                graph_name: sorted(
+                    name for name, state in states.items() if state == "installed"
+                )
+                for graph_name, states in self._states.items()
+            }
+
+    def clear(self, graph_name: Optional[str] = None) -> None:
+        """
+        Forget the installed queries of a graph, or of all graphs, e.g. after the graph
+        was dropped.
+        """
+        with self._lock:
+            if graph_name is None:
+                self._states.clear()
+                self._call_counts.clear()
+            else:
+                self._states.pop(graph_name, None)
+                prefix = f"{graph_name}."
+                for key in [k for k in self._call_counts if k.startswith(prefix)]:
+                    del self._call_counts[key]
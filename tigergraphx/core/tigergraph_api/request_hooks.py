@@ -0,0 +1,79 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Optional
+import time
+
+
+class RequestContext:
+    """
+    Details of one logical request, shared by all hooks called for it.
+
+    A logical request spans all of its retry attempts. `elapsed` is measured until the
+    response headers arrive, so streamed bodies are not included.
+    """
+
+    def __init__(
+        self,
+        endpoint_name: str,
+        method: str,
+        url: str,
+        limit_class: str = "default",
+        request_size: int = 0,
+        stream: bool = False,
+    ):
+        self.endpoint_name = endpoint_name
+        self.method = method
+        self.url = url
+        self.limit_class = limit_class
+        self.request_size = request_size
+        self.stream = stream
+        self.attempts = 0
+        self.status_code: Optional[int] = None
+        self.response_size: Optional[int] = None
+        self.start_time = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+
+class RequestHook:
+    """
+    Base class for request lifecycle hooks. Override any of the methods below.
+
+    Hooks are called synchronously on the thread or event loop that sends the request,
+    so they should be fast. Exceptions raised by hooks are logged and ignored.
+    """
+
+    def on_request_start(self, context: RequestContext) -> None:
+        """
+        Called before the first attempt of a request is sent.
+
+        Args:
+            context: The request details.
+        """
+
+    def on_response(self, context: RequestContext, response: Any) -> None:
+        """
+        Called once a final response is received, including HTTP error responses.
+
+        Args:
+            context: The request details, with status code, response size, elapsed
+                time and attempts filled in.
+            response: The response of the HTTP client.
+        """
+
+    def on_error(self, context: RequestContext, error: BaseException) -> None:
+        """
+        Called when a request fails without a response, e.g. on a connection error.
+
+        Args:
+            context: The request details, with elapsed time and attempts filled in.
+            error: The exception raised by the HTTP client.
+        """
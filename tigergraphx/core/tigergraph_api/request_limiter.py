@@ -0,0 +1,232 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+from contextlib import asynccontextmanager, contextmanager
+import asyncio
+import math
+import threading
+import time
+
+from tigergraphx.config import RequestLimitConfig
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that hands out waits instead of blocking itself.
+
+    Tokens may go negative, so every caller reserves its own future slot and callers
+    are served in arrival order at the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token and return how many seconds to wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class EndpointLimiter:
+    """
+    Concurrency and rate limits for one endpoint class, with queueing metrics.
+    """
+
+    def __init__(self, limit_class: str, config: RequestLimitConfig):
+        self.limit_class = limit_class
+        self.max_in_flight = config.max_in_flight
+        self._bucket = (
+            TokenBucket(
+                rate=config.requests_per_second,
+                capacity=config.burst or math.ceil(config.requests_per_second),
+            )
+            if config.requests_per_second
+            else None
+        )
+        self._semaphore = (
+            threading.BoundedSemaphore(config.max_in_flight)
+            if config.max_in_flight
+            else None
+        )
+        # Async semaphores are bound to the event loop they are first used on
+        self._async_semaphores: Dict[int, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "in_flight": 0,
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+            "requests": 0,
+            "queued_requests": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """
+        Block until a request of this class may be sent.
+        """
+        start = self._enter_queue()
+        try:
+            if self._semaphore is not None:
+                self._semaphore.acquire()
+            delay = self._bucket.reserve() if self._bucket else 0.0
+            if delay > 0:
+                time.sleep(delay)
+        except BaseException:
+            self._leave_queue(start, acquired=False)
+            raise
+        self._leave_queue(start, acquired=True)
+        try:
+            yield
+        finally:
+            self._release()
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    @asynccontextmanager
+    async def acquire_async(self) -> AsyncIterator[None]:
+        """
+        Wait on the event loop until a request of this class may be sent.
+        """
+        semaphore = self._get_async_semaphore()
+        start = self._enter_queue()
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+            delay = self._bucket.reserve() if self._bucket else 0.0
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self._leave_queue(start, acquired=False)
+            raise
+        self._leave_queue(start, acquired=True)
+        try:
+            yield
+        finally:
+            self._release()
+            if semaphore is not None:
+                semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of the in-flight, queue-depth and wait-time metrics.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["avg_wait_seconds"] = (
+            stats["total_wait_seconds"] / stats["requests"] if stats["requests"] else 0.0
+        )
+        return stats
+
+    def _get_async_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if not self.max_in_flight:
+            return None
+        loop_id = id(asyncio.get_running_loop())
+        with self._lock:
+            semaphore = self._async_semaphores.get(loop_id)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_in_flight)
+                self._async_semaphores[loop_id] = semaphore
+            return semaphore
+
+    def _enter_queue(self) -> float:
+        with self._lock:
+            self._stats["queue_depth"] += 1
+            self._stats["max_queue_depth"] = max(
+                self._stats["max_queue_depth"], self._stats["queue_depth"]
+            )
+        return time.monotonic()
+
+    def _leave_queue(self, start: float, acquired: bool) -> None:
+        waited = time.monotonic() - start
+        with self._lock:
+            self._stats["queue_depth"] -= 1
+            if not acquired:
+                return
+            self._stats["in_flight"] += 1
+            self._stats["requests"] += 1
+            if waited > 0.001:
+                self._stats["queued_requests"] += 1
+            self._stats["total_wait_seconds"] += waited
+            self._stats["max_wait_seconds"] = max(
+                self._stats["max_wait_seconds"], waited
+            )
+
+    def _release(self) -> None:
+        with self._lock:
+            self._stats["in_flight"] -= 1
+
+
+class RequestLimiter:
+    """
+    Client-side concurrency and rate limits keyed by endpoint class.
+
+    Endpoint classes are set by `limit_class` in endpoint_definitions.yaml. Classes
+    without configured limits are not throttled.
+    """
+
+    def __init__(self, request_limits: Dict[str, RequestLimitConfig]):
+        self._limiters = {
+            limit_class: EndpointLimiter(limit_class, config)
+            for limit_class, config in request_limits.items()
+            if config.max_in_flight or config.requests_per_second
+        }
+
+    def wrap(self, limit_class: str, send: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Wrap a request so that it waits for the limits of its endpoint class.
+        """
+        limiter = self._limiters.get(limit_class)
+        if limiter is None:
+            return send
+
+        def limited_send():
+            with limiter.acquire():
+                return send()
+
+        return limited_send
+
+    def wrap_async(
+        self, limit_class: str, send: Callable[[], Awaitable[Any]]
+    ) -> Callable[[], Awaitable[Any]]:
+        """
+        Async counterpart of `wrap`.
+        """
+        limiter = self._limiters.get(limit_class)
+        if limiter is None:
+            return send
+
+        async def limited_send():
+            async with limiter.acquire_async():
+                return await send()
+
+        return limited_send
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the metrics of every limited endpoint class.
+        """
+        return {
+            limit_class: limiter.get_stats()
+            for limit_class, limiter in self._limiters.items()
+        }
@@ -0,0 +1,316 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Awaitable, Callable, Dict, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import logging
+import threading
+import time
+
+import httpx
+from requests import Response
+from requests.exceptions import (
+    ChunkedEncodingError,
+    ConnectTimeout,
+    ConnectionError,
+    ReadTimeout,
+    RequestException,
+)
+from urllib3.exceptions import NewConnectionError
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
+
+from .api.base_api import CircuitBreakerOpenError
+
+from tigergraphx.config import TigerGraphConnectionConfig
+
+logger = logging.getLogger(__name__)
+
+# The server rejected the request without processing it; safe to resend anything
+RETRYABLE_STATUS_CODES = {429, 503}
+# The request may have been processed; only resend idempotent requests
+IDEMPOTENT_RETRYABLE_STATUS_CODES = {502, 504}
+# The server is overloaded or unreachable; other errors such as 500 come from the
+# request itself and do not count towards the circuit breaker
+CIRCUIT_BREAKER_STATUS_CODES = (
+    RETRYABLE_STATUS_CODES | IDEMPOTENT_RETRYABLE_STATUS_CODES
+)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker shared by all requests of one client.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests fail
+    fast. Once `reset_timeout` seconds have passed, one trial request is let through;
+    its success closes the circuit and its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                return self.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> bool:
+        """
+        Raise CircuitBreakerOpenError if requests should not be sent right now.
+
+        Returns:
+            Whether the request is the trial request of a half-open circuit, which
+            must be ended with `record_success`, `record_failure` or `release_trial`.
+        """
+        if self.failure_threshold <= 0:
+            return False
+        with self._lock:
+            if self._state == self.CLOSED:
+                return False
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed >= self.reset_timeout and not self._trial_in_flight:
+                # Let a single trial request through
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = True
+                return True
+            retry_in = max(self.reset_timeout - elapsed, 0.0)
+        raise CircuitBreakerOpenError(
+            f"Circuit breaker is open after {self._failures} consecutive failures; "
+            f"retry in {retry_in:.1f}s."
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """
+        Let another trial request through after a trial that ended without telling
+        whether the server recovered, e.g. because it was cancelled.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"Opening circuit breaker after {self._failures} consecutive "
+                        "failures."
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """
+    Retry policy with jittered exponential backoff and a circuit breaker.
+
+    Requests rejected before processing (HTTP 429 or 503, connection failures) are
+    retried for every endpoint. Responses and errors after which the server may have
+    processed the request (HTTP 502 or 504, read timeouts, dropped connections) are
+    retried for idempotent endpoints only. A `Retry-After` header takes precedence over
+    the computed backoff.
+    """
+
+    def __init__(self, config: TigerGraphConnectionConfig):
+        self.max_retries = config.max_retries
+        self.initial_wait = config.retry_initial_wait
+        self.max_wait = config.retry_max_wait
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=config.circuit_breaker_threshold,
+            reset_timeout=config.circuit_breaker_reset_timeout,
+        )
+        self._backoff = wait_exponential(
+            multiplier=self.initial_wait, max=self.max_wait
+        ) + wait_random(0, self.initial_wait)
+
+    def call(self, endpoint: Dict[str, Any], send: Callable[[], Any]) -> Any:
+        """
+        Send a request with retries, returning the last response.
+
+        Args:
+            endpoint: The resolved endpoint details.
+            send: Sends the request once and returns the response.
+
+        Returns:
+            The first non-retryable response, or the last response once retries are
+            exhausted.
+        """
+        is_trial = self.circuit_breaker.before_call()
+        retryer = Retrying(**self._retrying_kwargs(endpoint))
+        try:
+            response = retryer(send)
+        except Exception as e:
+            self._record_exception(e)
+            raise
+        else:
+            self._record_response(response)
+        finally:
+            # Errors that say nothing about the server must not block later trials
+            if is_trial:
+                self.circuit_breaker.release_trial()
+        return response
+
+    async def call_async(
+        self, endpoint: Dict[str, Any], send: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Async counterpart of `call`.
+        """
+        is_trial = self.circuit_breaker.before_call()
+        retryer = AsyncRetrying(**self._retrying_kwargs(endpoint))
+        try:
+            response = await retryer(send)
+        except Exception as e:
+            self._record_exception(e)
+            raise
+        else:
+            self._record_response(response)
+        finally:
+            if is_trial:
+                self.circuit_breaker.release_trial()
+        return response
+
+    def _retrying_kwargs(self, endpoint: Dict[str, Any]) -> Dict[str, Any]:
+        idempotent = endpoint.get("idempotent", endpoint.get("method") == "GET")
+        return {
+            "stop": stop_after_attempt(self.max_retries + 1),
+            "wait": self._wait,
+            "retry": (
+                retry_if_exception(lambda e: self._is_retryable_exception(e, idempotent))
+                | retry_if_result(lambda r: self._is_retryable_response(r, idempotent))
+            ),
+            "before_sleep": self._before_sleep,
+            # Hand the last response or exception back to the caller
+            "retry_error_callback": lambda retry_state: retry_state.outcome.result(),  # type: ignore[union-attr]
+        }
+
+    def _wait(self, retry_state: RetryCallState) -> float:
+        outcome = retry_state.outcome
+        if outcome is not None and not outcome.failed:
+            retry_after = self._parse_retry_after(outcome.result())
+            if retry_after is not None:
+                return min(retry_after, self.max_wait)
+        return min(self._backoff(retry_state), self.max_wait)
+
+    def _before_sleep(self, retry_state: RetryCallState) -> None:
+        outcome = retry_state.outcome
+        if outcome is None:
+            return
+        if outcome.failed:
+            reason = repr(outcome.exception())
+        else:
+            response = outcome.result()
+            reason = f"HTTP {response.status_code}"
+            # Release the connection of a streamed response before resending
+            if isinstance(response, Response):
+                response.close()
+        logger.warning(
+            f"Retrying request (attempt {retry_state.attempt_number}/"
+            f"{self.max_retries}) after {reason}; waiting "
+            f"{retry_state.upcoming_sleep:.2f}s."
+        )
+
+    @staticmethod
+    def _is_retryable_response(response: Any, idempotent: bool) -> bool:
+        status_code = getattr(response, "status_code", None)
+        if status_code in RETRYABLE_STATUS_CODES:
+            return True
+        return idempotent and status_code in IDEMPOTENT_RETRYABLE_STATUS_CODES
+
+    @staticmethod
+    def _is_retryable_exception(exception: BaseException, idempotent: bool) -> bool:
+        if RetryPolicy._is_connect_error(exception):
+            return True
+        if idempotent:
+            return isinstance(
+                exception,
+                (
+                    ConnectionError,
+                    ReadTimeout,
+                    ChunkedEncodingError,
+                    httpx.NetworkError,
+                    httpx.ReadTimeout,
+                    httpx.RemoteProtocolError,
+                ),
+            )
+        return False
+
+    @staticmethod
+    def _is_connect_error(exception: BaseException) -> bool:
+        """
+        Whether the request failed before it reached the server.
+        """
+        if isinstance(exception, (ConnectTimeout, httpx.ConnectError, httpx.ConnectTimeout)):
+            return True
+        if isinstance(exception, ConnectionError) and exception.args:
+            # requests wraps urllib3's NewConnectionError for refused connections
+            reason = getattr(exception.args[0], "reason", None)
+            return isinstance(reason, NewConnectionError)
+        return False
+
+    @staticmethod
+    def _parse_retry_after(response: Any) -> Optional[float]:
+        headers = getattr(response, "headers", None) or {}
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def _record_exception(self, exception: BaseException) -> None:
+        # Only transport failures count; e.g. an invalid URL says nothing about the server
+        if isinstance(exception, (RequestException, httpx.TransportError)):
+            self.circuit_breaker.record_failure()
+
+    def _record_response(self, response: Any) -> None:
+        status_code = getattr(response, "status_code", 0)
+        if status_code in CIRCUIT_BREAKER_STATUS_CODES:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
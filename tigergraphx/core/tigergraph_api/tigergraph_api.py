@@ -5,20 +5,37 @@
 # Permission is granted to use, copy, modify, and distribute this software
 # under the License. The software is provided "AS IS", without warranty.
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import logging
 from requests import Session
 from requests.auth import AuthBase, HTTPBasicAuth
 
 from .endpoint_handler.endpoint_registry import EndpointRegistry
+from .retry_policy import RetryPolicy
+from .request_limiter import RequestLimiter
+from .request_hooks import RequestHook
+from .metrics_registry import MetricsRegistry
+from .host_selector import HostSelector
+from .http_adapter import PooledHTTPAdapter
+from .transport_recorder import RecordingAdapter, ReplayAdapter, TransportRecording
+from .query_catalog import QueryCatalog, QueryShape
 from .api import (
+    TigerGraphAPIError,
     AdminAPI,
     GSQLAPI,
     SchemaAPI,
     QueryAPI,
+    DataAPI,
 )
 
 from tigergraphx.config import TigerGraphConnectionConfig
 
+logger = logging.getLogger(__name__)
+
+# The REST++ error code of a request to an unknown endpoint, e.g. a missing query
+MISSING_ENDPOINT_ERROR_CODE = "REST-1000"
+
 
 class BearerAuth(AuthBase):
     """Custom authentication class for handling Bearer tokens."""
@@ -32,13 +49,17 @@ class BearerAuth(AuthBase):
 
 
 class TigerGraphAPI:
-    def __init__(self, config: TigerGraphConnectionConfig):
+    def __init__(
+        self,
+        config: TigerGraphConnectionConfig,
+        hooks: Optional[List[RequestHook]] = None,
+    ):
         """
         Initialize TigerGraphAPI with configuration, endpoint registry, and session.
 
         Args:
             config: Configuration object for TigerGraph connection.
-            endpoint_config_path: Path to the YAML file defining endpoints.
+            hooks: Request lifecycle hooks, called after the built-in metrics registry.
         """
         self.config = config
 
@@ -48,11 +69,76 @@ class TigerGraphAPI:
         # Create a shared session
         self.session = self._initialize_session()
 
+        # Share one retry policy, and thus one circuit breaker, across all APIs
+        self.retry_policy = RetryPolicy(config)
+
+        # Share the per-endpoint-class concurrency and rate limits across all APIs
+        self.request_limiter = RequestLimiter(config.request_limits)
+
+        # Share one hook list across all APIs; metrics are recorded by default
+        self.metrics = MetricsRegistry()
+        self.hooks: List[RequestHook] = [self.metrics, *(hooks or [])]
+
+        # Spread requests over the hosts of a cluster; failed hosts rejoin once they
+        # answer a ping
+        self.host_selector = HostSelector(
+            config, ping=lambda host: self._admin_api.ping(host=host)
+        )
+
+        # Track the generated queries installed on each graph
+        self.query_catalog = QueryCatalog()
+
+        # Install promoted query shapes one at a time, off the calling thread
+        self._install_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tigergraphx-install"
+        )
+
         # Initialize API classes
-        self._admin_api = AdminAPI(config, self.endpoint_registry, self.session)
-        self._gsql_api = GSQLAPI(config, self.endpoint_registry, self.session)
-        self._schema_api = SchemaAPI(config, self.endpoint_registry, self.session)
-        self._query_api = QueryAPI(config, self.endpoint_registry, self.session)
+        self._admin_api = AdminAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
+        self._gsql_api = GSQLAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
+        self._schema_api = SchemaAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
+        self._query_api = QueryAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
+        self._data_api = DataAPI(
+            config,
+            self.endpoint_registry,
+            self.session,
+            self.retry_policy,
+            self.request_limiter,
+            self.hooks,
+            self.host_selector,
+        )
 
     # ------------------------------ Admin ------------------------------
     def ping(self) -> str:
@@ -77,33 +163,497 @@ class TigerGraphAPI:
 
     # ------------------------------ Query ------------------------------
     def run_interpreted_query(
-        self, query: str, params: Optional[Dict[str, Any]] = None
+        self, query: str, params: Optional[Dict[str, Any] | str] = None
     ) -> List:
+        """
+        Run an interpreted query.
+
+        With `query_promotion_threshold` set, the runs of each query shape are counted
+        and a shape that reaches the threshold is installed in the background. Later
+        runs of the shape use the installed query.
+
+        Args:
+            query: The text of an `INTERPRET QUERY`.
+            params: The query parameters, as a dictionary or an encoded query string.
+
+        Returns:
+            The query results.
+        """
+        shape = (
+            self.query_catalog.get_shape(query)
+            if self.config.query_promotion_threshold is not None
+            else None
+        )
+        if shape is None:
+            return self._query_api.run_interpreted_query(query, params)
+
+        state = self.query_catalog.get_state(shape)
+        if state == "installed":
+            try:
+                return self._run_shape(shape, shape.bind(params))
+            except TigerGraphAPIError as e:
+                if not self._is_missing_query_error(e):
+                    raise
+                # The query was dropped on the server since it was installed
+                logger.warning(
+                    f"Installed query {shape.name} is missing, interpreting it instead."
+                )
+                self.query_catalog.set_state(shape, "failed")
+        elif state is None and (
+            self.query_catalog.count_call(shape)
+            == self.config.query_promotion_threshold
+        ):
+            logger.debug(f"Promoting query {shape.name} to an installed query.")
+            self._install_executor.submit(self._install_shape, shape)
         return self._query_api.run_interpreted_query(query, params)
 
-    # def run_installed_query_get(
-    #     self, query_name: str, params: Optional[Dict[str, Any]] = None
-    # ) -> List:
-    #     return self._query_api.run_installed_query_get(query_name, params)
-    #
-    # def run_installed_query_post(
-    #     self, query_name: str, params: Optional[Dict[str, Any]] = None
-    # ) -> List:
-    #     return self._query_api.run_installed_query_post(query_name, params)
+    def run_interpreted_query_stream(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        result_key: str = "Nodes",
+        batch_size: int = 1000,
+        result_index: Optional[int] = None,
+    ) -> Iterator[List]:
+        """
+        Run an interpreted query and stream one printed list of its result in batches.
+
+        The response body is decoded incrementally, so peak memory scales with
+        `batch_size` rather than with the number of returned items.
+
+        Args:
+            query: The interpreted query text.
+            params: The query parameters.
+            result_key: The key of the printed list to stream, e.g. "Nodes".
+            batch_size: The maximum number of items per yielded batch.
+            result_index: Only stream from the result object at this index.
+                All result objects are streamed if None.
+
+        Returns:
+            An iterator over lists of items.
+        """
+        return self._query_api.run_interpreted_query_stream(
+            query, params, result_key, batch_size, result_index
+        )
+
+    def run_installed_query(
+        self,
+        graph_name: str,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        use_post: bool = False,
+    ) -> List:
+        """
+        Run an installed query.
+
+        Args:
+            graph_name: The name of the graph.
+            query_name: The name of the installed query.
+            params: The query parameters. Use `(id, type)` tuples for `VERTEX` and
+                lists of them for `SET<VERTEX>` parameters.
+            use_post: Whether to send the parameters as a JSON body instead of URL
+                parameters, which suits large inputs such as embeddings or vertex sets.
+                Parameters longer than `max_query_string_length` are always sent as a
+                JSON body.
+
+        Returns:
+            The query results.
+        """
+        if use_post or self._query_api.needs_post_body(params):
+            return self._query_api.run_installed_query_post(
+                graph_name, query_name, params
+            )
+        return self._query_api.run_installed_query_get(graph_name, query_name, params)
+
+    def run_generated_query(
+        self, query: str, params: Optional[Dict[str, Any] | str] = None
+    ) -> List:
+        """
+        Run a query generated by TigerGraphX.
+
+        With `auto_install_queries` enabled, each distinct query shape is installed
+        once under a hash-derived name in the background and run as an installed
+        query once the installation finishes. Otherwise, until then, and for shapes
+        that fail to install, the query is interpreted.
+
+        Args:
+            query: The text of an `INTERPRET QUERY`.
+            params: The query parameters, as a dictionary or an encoded query string.
+
+        Returns:
+            The query results.
+        """
+        shape = (
+            self.query_catalog.get_shape(query)
+            if self.config.auto_install_queries
+            else None
+        )
+        if shape is None:
+            return self.run_interpreted_query(query, params)
+
+        state = self.query_catalog.get_state(shape)
+        if state == "installed":
+            try:
+                return self._run_shape(shape, shape.bind(params))
+            except TigerGraphAPIError as e:
+                if not self._is_missing_query_error(e):
+                    raise
+                # The query was dropped on the server since it was installed
+                logger.warning(
+                    f"Installed query {shape.name} is missing, interpreting it instead."
+                )
+                self.query_catalog.set_state(shape, "failed")
+        elif state is None and self.query_catalog.count_call(shape) == 1:
+            # Interpret the query until the installation finishes
+            logger.debug(f"Installing query {shape.name} in the background.")
+            self._install_executor.submit(self._install_shape, shape)
+        return self.run_interpreted_query(query, params)
+
+    def get_installed_queries(self) -> Dict[str, List[str]]:
+        """
+        Retrieve the names of the generated queries installed on each graph.
+
+        Returns:
+            A dictionary from graph name to installed query names.
+        """
+        return self.query_catalog.get_installed_queries()
+
+    def _run_shape(
+        self, shape: QueryShape, params: Optional[Dict[str, Any] | str]
+    ) -> List:
+        """
+        Run the installed query of a query shape.
+        """
+        if isinstance(params, str):
+            return self._query_api.run_installed_query_get(
+                shape.graph_name, shape.name, params
+            )
+        return self.run_installed_query(shape.graph_name, shape.name, params)
+
+    def _install_shape(self, shape: QueryShape) -> bool:
+        """
+        Install the query of a query shape once, even if called concurrently.
+
+        Returns:
+            Whether the query is installed.
+        """
+        with self.query_catalog.get_install_lock(shape):
+            state = self.query_catalog.get_state(shape)
+            if state is not None:
+                return state == "installed"
+            logger.info(f"Installing query {shape.name} on graph {shape.graph_name}.")
+            try:
+                result = self.gsql(shape.get_install_command())
+            except Exception as e:
+                result = f"{type(e).__name__} - {e}"
+            installed = "Query installation finished" in result or (
+                f"{shape.name} is already installed" in result
+            )
+            if not installed:
+                logger.warning(
+                    f"Failed to install query {shape.name}, interpreting it instead: "
+                    f"{result}"
+                )
+            self.query_catalog.set_state(shape, "installed" if installed else "failed")
+            return installed
+
+    @staticmethod
+    def _is_missing_query_error(error: TigerGraphAPIError) -> bool:
+        """
+        Whether running an installed query failed because the query does not exist,
+        as opposed to e.g. a missing vertex or attribute.
+        """
+        if error.status_code == 404:
+            return True
+        try:
+            code = error.response.json().get("code")  # type: ignore[union-attr]
+        except Exception:
+            return False
+        return code == MISSING_ENDPOINT_ERROR_CODE
+
+    def run_many(
+        self,
+        jobs: Sequence[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run independent queries concurrently and return their results in order.
+
+        Each job is a dictionary describing either an interpreted query, with keys
+        `query` and optionally `params`, or an installed query, with keys `graph_name`,
+        `query_name` and optionally `params` and `use_post`. Jobs share the session,
+        request limits and retry policy, so the wall-clock time approaches that of the
+        slowest query. Interpreted queries are run by `run_generated_query`, so they
+        are installed if `auto_install_queries` is enabled.
+
+        Args:
+            jobs: The query jobs.
+            max_workers: The maximum number of concurrent queries. Defaults to
+                `pool_maxsize`, so that no query waits for a pooled connection.
+
+        Returns:
+            The result of each job in the order of `jobs`. A job that failed yields the
+            exception it raised instead, so one failure does not discard the others.
+        """
+        if not jobs:
+            return []
+        max_workers = min(max_workers or self.config.pool_maxsize, len(jobs))
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tigergraphx-run-many"
+        ) as executor:
+            futures = [executor.submit(self._run_job, job) for job in jobs]
+            return [future.exception() or future.result() for future in futures]
+
+    def _run_job(self, job: Dict[str, Any]) -> List:
+        """
+        Run one job of `run_many`.
+        """
+        if "query" in job:
+            return self.run_generated_query(job["query"], job.get("params"))
+        if "query_name" in job and "graph_name" in job:
+            return self.run_installed_query(
+                job["graph_name"],
+                job["query_name"],
+                job.get("params"),
+                use_post=job.get("use_post", False),
+            )
+        raise ValueError(
+            "A query job needs either 'query', or 'graph_name' and 'query_name'; "
+            f"got keys: {', '.join(job)}."
+        )
+
+    # ------------------------------ Data ------------------------------
+    def upsert_graph_data(
+        self,
+        graph_name: str,
+        payload: Dict[str, Any],
+        vertex_must_exist: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Upsert vertices and edges with one REST++ request.
+
+        Args:
+            graph_name: The name of the graph.
+            payload: The REST++ upsert payload with `vertices` and/or `edges`.
+            vertex_must_exist: Whether to skip edges whose endpoints do not exist
+                instead of creating the missing vertices.
+
+        Returns:
+            The accepted and skipped vertex and edge counts.
+        """
+        return self._data_api.upsert_graph_data(
+            graph_name, payload, vertex_must_exist
+        )
+
+    def upsert_vertices(
+        self,
+        graph_name: str,
+        vertex_type: str,
+        vertices: Sequence[Tuple[str | int, Dict[str, Any]]],
+    ) -> Dict[str, int]:
+        """
+        Upsert vertices of one type with one REST++ request.
+
+        Args:
+            graph_name: The name of the graph.
+            vertex_type: The vertex type.
+            vertices: (ID, attributes) pairs. An attribute given as a (value, op)
+                tuple is applied with the REST++ update operator `op`.
+
+        Returns:
+            The accepted and skipped vertex and edge counts.
+        """
+        payload = DataAPI.build_vertices_payload(vertex_type, vertices)
+        return self._data_api.upsert_graph_data(graph_name, payload)
+
+    def upsert_edges(
+        self,
+        graph_name: str,
+        src_vertex_type: str,
+        edge_type: str,
+        tgt_vertex_type: str,
+        edges: Sequence[Tuple[str | int, str | int, Dict[str, Any]]],
+        vertex_must_exist: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Upsert edges of one type with one REST++ request.
+
+        Args:
+            graph_name: The name of the graph.
+            src_vertex_type: The source vertex type.
+            edge_type: The edge type.
+            tgt_vertex_type: The target vertex type.
+            edges: (source ID, target ID, attributes) triples.
+            vertex_must_exist: Whether to skip edges whose endpoints do not exist
+                instead of creating the missing vertices.
+
+        Returns:
+            The accepted and skipped vertex and edge counts.
+        """
+        payload = DataAPI.build_edges_payload(
+            src_vertex_type, edge_type, tgt_vertex_type, edges
+        )
+        return self._data_api.upsert_graph_data(
+            graph_name, payload, vertex_must_exist
+        )
+
+    def delete_vertices(
+        self,
+        graph_name: str,
+        vertex_type: str,
+        vertex_ids: Optional[Sequence[str | int]] = None,
+    ) -> int:
+        """
+        Delete vertices by ID, or all vertices of a type.
+
+        Args:
+            graph_name: The name of the graph.
+            vertex_type: The vertex type.
+            vertex_ids: The IDs of the vertices to delete. All vertices of the type
+                are deleted if None.
+
+        Returns:
+            The number of deleted vertices.
+        """
+        return self._data_api.delete_vertices(graph_name, vertex_type, vertex_ids)
+
+    # ------------------------------ Cluster ------------------------------
+    def check_hosts(self) -> Dict[str, bool]:
+        """
+        Ping every configured host and update which hosts receive requests.
+
+        Returns:
+            Whether each host answered the ping.
+        """
+        return self.host_selector.check_hosts()
+
+    def get_host_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve the health and moving-average latency of every configured host.
+
+        Returns:
+            A dictionary keyed by host URL with whether the host is healthy, its
+            latency in seconds and whether it serves sticky requests such as GSQL.
+        """
+        return self.host_selector.get_host_stats()
+
+    # ------------------------------ Connection Pool ------------------------------
+    def get_pool_stats(self) -> Dict[str, int]:
+        """
+        Retrieve connection pool usage counters of the shared session.
+
+        Returns:
+            A dictionary with the number of pools, requests, pool hits and pool misses.
+        """
+        return self._adapter.get_pool_stats()
+
+    def get_limiter_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve queueing metrics of the client-side request limits.
+
+        Returns:
+            A dictionary keyed by endpoint class with the current in-flight requests,
+            queue depth, maximum queue depth and wait times in seconds.
+        """
+        return self.request_limiter.get_stats()
+
+    # ------------------------------ Observability ------------------------------
+    def add_hook(self, hook: RequestHook) -> None:
+        """
+        Register a hook that is called on the lifecycle events of every request.
+
+        Args:
+            hook: The hook, overriding any of `on_request_start`, `on_response` and
+                `on_error`.
+        """
+        self.hooks.append(hook)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve the request metrics recorded per endpoint.
+
+        Returns:
+            For each endpoint, the request, retry, status code, error and byte counters,
+            and a latency histogram with cumulative bucket counts.
+        """
+        return self.metrics.to_dict()
+
+    def export_metrics(self, prefix: str = "tigergraphx") -> str:
+        """
+        Export the request metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: The prefix of the metric names.
+
+        Returns:
+            The metrics as Prometheus text.
+        """
+        return self.metrics.to_prometheus(prefix)
+
+    def close(self) -> None:
+        """
+        Close the shared session and release all pooled connections. In record mode,
+        the recording is saved to `transport_file`.
+        """
+        self._install_executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        self.save_recording()
+
+    def save_recording(self) -> None:
+        """
+        Save the requests recorded so far to `transport_file`. Does nothing unless
+        `transport_mode` is 'record'.
+        """
+        if self.config.transport_mode == "record" and self.recording is not None:
+            self.recording.save(self.config.transport_file)  # pyright: ignore
 
     def _initialize_session(self) -> Session:
         """
-        Create a shared requests.Session with retries and default headers.
+        Create a shared requests.Session with a pooled keep-alive adapter.
 
         Returns:
             A configured session object.
         """
         session = Session()
 
+        # Mount a pooled adapter so that concurrent callers reuse warm connections
+        self._adapter = PooledHTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+            socket_options=PooledHTTPAdapter.build_socket_options(
+                tcp_keepalive=self.config.tcp_keepalive,
+                extra_options=self.config.socket_options,
+            ),
+        )
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+
+        # Record live traffic, or answer requests from a recording without a server
+        self.recording: Optional[TransportRecording] = None
+        if self.config.transport_mode != "live":
+            adapter = self._create_transport_adapter()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
         # Set authentication
         session.auth = self._get_auth()
         return session
 
+    def _create_transport_adapter(self) -> RecordingAdapter | ReplayAdapter:
+        """
+        Create the adapter of the record or replay transport mode.
+
+        Returns:
+            An adapter that records the traffic of the pooled adapter, or one that
+            replays the recording in `transport_file`.
+        """
+        if self.config.transport_mode == "replay":
+            self.recording = TransportRecording.load(self.config.transport_file)  # pyright: ignore
+            return ReplayAdapter(self.recording, latency=self.config.replay_latency)
+        self.recording = TransportRecording()
+        return RecordingAdapter(self._adapter, self.recording)
+
     def _get_auth(self):
         """
         Generate authentication object for the session.
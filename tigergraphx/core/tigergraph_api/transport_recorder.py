@@ -0,0 +1,314 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+from typing import Any, Deque, Dict, List, Literal, Optional, Tuple
+from collections import defaultdict, deque
+from pathlib import Path
+import asyncio
+import base64
+import gzip
+import hashlib
+import io
+import json
+import threading
+import time
+
+import httpx
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .api.base_api import ReplayMissError
+
+# Headers that describe the wire encoding rather than the decoded body we store
+_DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+
+ReplayLatency = Literal["none", "recorded"] | float
+
+InteractionKey = Tuple[str, str, str]
+
+
+class TransportRecording:
+    """
+    Thread-safe store of recorded request/response pairs.
+
+    Recordings are saved as gzip-compressed JSON lines, one interaction per line.
+    Requests are matched by method, path with query string, and a hash of the body,
+    so a recording made against one host can be replayed against any other. Repeated
+    identical requests are answered in recorded order, and the last recorded response
+    is reused once they are exhausted.
+    """
+
+    def __init__(self, interactions: Optional[List[Dict[str, Any]]] = None):
+        self._lock = threading.Lock()
+        self.interactions: List[Dict[str, Any]] = []
+        self._queues: Dict[InteractionKey, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._last: Dict[InteractionKey, Dict[str, Any]] = {}
+        for interaction in interactions or []:
+            self.add(interaction)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "TransportRecording":
+        """
+        Load a recording saved by `save`.
+
+        Args:
+            path: The path of the recording file.
+
+        Returns:
+            The loaded recording.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls([json.loads(line) for line in f if line.strip()])
+
+    def save(self, path: str | Path) -> None:
+        """
+        Save all interactions, overwriting the file.
+
+        Args:
+            path: The path of the recording file.
+        """
+        with self._lock:
+            interactions = list(self.interactions)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for interaction in interactions:
+                f.write(json.dumps(interaction, separators=(",", ":")))
+                f.write("\n")
+
+    def add(self, interaction: Dict[str, Any]) -> None:
+        key = self._key_of(interaction)
+        with self._lock:
+            self.interactions.append(interaction)
+            self._queues[key].append(interaction)
+            self._last[key] = interaction
+
+    def match(self, method: str, path: str, body: Optional[bytes]) -> Dict[str, Any]:
+        """
+        Find the response recorded for a request.
+
+        Raises:
+            ReplayMissError: If no response was recorded for the request.
+        """
+        key = (method.upper(), path, self.hash_body(body))
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                return queue.popleft()
+            if key in self._last:
+                return self._last[key]
+        raise ReplayMissError(
+            f"No recorded response for {method.upper()} {path} with a body hash of "
+            f"{key[2]}. Record the workload again with transport_mode='record'."
+        )
+
+    @staticmethod
+    def build_interaction(
+        method: str,
+        path: str,
+        request_body: Optional[bytes],
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        latency: float,
+    ) -> Dict[str, Any]:
+        interaction: Dict[str, Any] = {
+            "method": method.upper(),
+            "path": path,
+            "body_hash": TransportRecording.hash_body(request_body),
+            "status_code": status_code,
+            "headers": {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            },
+            "latency": round(latency, 6),
+        }
+        try:
+            interaction["text"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["base64"] = base64.b64encode(content).decode("ascii")
+        return interaction
+
+    @staticmethod
+    def get_content(interaction: Dict[str, Any]) -> bytes:
+        if "base64" in interaction:
+            return base64.b64decode(interaction["base64"])
+        return interaction.get("text", "").encode("utf-8")
+
+    @staticmethod
+    def get_delay(interaction: Dict[str, Any], latency: ReplayLatency) -> float:
+        if latency == "none":
+            return 0.0
+        if latency == "recorded":
+            return float(interaction.get("latency", 0.0))
+        return float(latency)
+
+    @staticmethod
+    def hash_body(body: Optional[bytes | str]) -> str:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return hashlib.sha1(body or b"").hexdigest()
+
+    @staticmethod
+    def _key_of(interaction: Dict[str, Any]) -> InteractionKey:
+        return (interaction["method"], interaction["path"], interaction["body_hash"])
+
+
+def _read_request_body(request: PreparedRequest) -> Optional[bytes]:
+    body = request.body
+    if body is None or isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    # Generator bodies cannot be replayed, so read them into memory once
+    content = b"".join(
+        chunk.encode("utf-8") if isinstance(chunk, str) else chunk for chunk in body
+    )
+    request.body = content
+    return content
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    requests adapter that forwards to a live adapter and records every exchange.
+
+    Response bodies are read in full before they are returned, so streamed responses
+    are buffered while recording.
+    """
+
+    def __init__(self, adapter: HTTPAdapter, recording: TransportRecording):
+        super().__init__()
+        self.adapter = adapter
+        self.recording = recording
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        body = _read_request_body(request)
+        start = time.perf_counter()
+        response = self.adapter.send(request, **kwargs)
+        content = response.content
+        latency = time.perf_counter() - start
+        self.recording.add(
+            TransportRecording.build_interaction(
+                request.method or "GET",
+                request.path_url,
+                body,
+                response.status_code,
+                dict(response.headers),
+                content,
+                latency,
+            )
+        )
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    requests adapter that answers requests from a recording without any network I/O.
+    """
+
+    def __init__(self, recording: TransportRecording, latency: ReplayLatency = "none"):
+        super().__init__()
+        self.recording = recording
+        self.latency = latency
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        interaction = self.recording.match(
+            request.method or "GET", request.path_url, _read_request_body(request)
+        )
+        delay = TransportRecording.get_delay(interaction, self.latency)
+        if delay > 0:
+            time.sleep(delay)
+
+        content = TransportRecording.get_content(interaction)
+        response = Response()
+        response.status_code = interaction["status_code"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response.headers["Content-Length"] = str(len(content))
+        response.raw = io.BytesIO(content)
+        response._content = content
+        response._content_consumed = True
+        response.encoding = None
+        response.url = request.url or ""
+        response.request = request
+        response.reason = ""
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that forwards to a live transport and records every exchange.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, recording: TransportRecording
+    ):
+        self.transport = transport
+        self.recording = recording
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        start = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        # Reading through an httpx.Response decodes any Content-Encoding
+        decoded = httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            request=request,
+        )
+        content = await decoded.aread()
+        latency = time.perf_counter() - start
+        interaction = TransportRecording.build_interaction(
+            request.method,
+            request.url.raw_path.decode("ascii"),
+            body,
+            response.status_code,
+            dict(response.headers),
+            content,
+            latency,
+        )
+        self.recording.add(interaction)
+        return httpx.Response(
+            response.status_code,
+            headers=interaction["headers"],
+            content=content,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class AsyncReplayTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that answers requests from a recording without any network I/O.
+    """
+
+    def __init__(self, recording: TransportRecording, latency: ReplayLatency = "none"):
+        self.recording = recording
+        self.latency = latency
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        interaction = self.recording.match(
+            request.method, request.url.raw_path.decode("ascii"), body
+        )
+        delay = TransportRecording.get_delay(interaction, self.latency)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return httpx.Response(
+            interaction["status_code"],
+            headers=interaction["headers"],
+            content=TransportRecording.get_content(interaction),
+            request=request,
+        )
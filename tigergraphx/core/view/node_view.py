@@ -62,13 +62,14 @@ class NodeView:
         - **Single Node Type**: Each iteration returns a `node_id`.
         - **Multiple Node Types**: Each iteration returns a tuple `(node_type, node_id)`.
         """
-        # Get all nodes
-        nodes = self.graph.get_nodes(all_node_types=True)
-        # If the graph has only one node type, then only return IDs
-        if len(self.graph.node_types) == 1:
-            return iter(node["v_id"] for _, node in nodes.iterrows())
-        # If the graph has multiple one node type, then only return (type, id)
-        return iter((node["v_type"], node["v_id"]) for _, node in nodes.iterrows())
+        # Page through the nodes of each type, so that memory stays bounded
+        homogeneous = len(self.graph.node_types) == 1
+        for node_type in self.graph.node_types:
+            for batch in self.graph.iter_nodes(node_type=node_type):
+                for node_id in batch["v_id"]:
+                    # If the graph has only one node type, then only return IDs;
+                    # otherwise return (type, id)
+                    yield node_id if homogeneous else (node_type, node_id)
 
     def __len__(self):
         """Return the number of nodes."""
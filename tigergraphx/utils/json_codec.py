@@ -0,0 +1,144 @@
+# Copyright 2025 TigerGraph Inc.
+# Licensed under the Apache License, Version 2.0.
+# See the LICENSE file or https://www.apache.org/licenses/LICENSE-2.0
+#
+# Permission is granted to use, copy, modify, and distribute this software
+# under the License. The software is provided "AS IS", without warranty.
+
+import json
+from functools import lru_cache
+from typing import Any, Literal
+
+JSONCodecName = Literal["auto", "orjson", "msgspec", "stdlib"]
+
+
+def _default(obj: Any) -> Any:
+    """
+    Convert values the JSON backends cannot serialize natively, e.g. numpy arrays.
+    """
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """
+    Serializes request bodies and parses response bodies with one JSON backend.
+    """
+
+    name: str = ""
+
+    def encode(self, obj: Any) -> bytes:
+        """
+        Serialize an object into UTF-8 encoded JSON.
+        """
+        raise NotImplementedError
+
+    def decode(self, data: bytes | str) -> Any:
+        """
+        Parse UTF-8 encoded JSON into Python objects.
+        """
+        raise NotImplementedError
+
+    def decode_response(self, response: Any) -> Any:
+        """
+        Parse the body of a `requests` or `httpx` response.
+        """
+        return self.decode(response.content)
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = "stdlib"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, default=_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def decode(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def decode_response(self, response: Any) -> Any:
+        # Let the HTTP client detect the charset, as before
+        return response.json()
+
+
+class OrjsonJSONCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=_default, option=self._options)
+
+    def decode(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecJSONCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+
+_CODECS = {
+    "orjson": OrjsonJSONCodec,
+    "msgspec": MsgspecJSONCodec,
+    "stdlib": StdlibJSONCodec,
+}
+
+
+@lru_cache(maxsize=None)
+def get_json_codec(name: JSONCodecName = "auto") -> JSONCodec:
+    """
+    Get the shared JSON codec for a backend.
+
+    Args:
+        name: "orjson", "msgspec" or "stdlib". "auto" picks the first installed
+            backend in that order, falling back to the standard library.
+
+    Returns:
+        The JSON codec.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If an explicitly requested backend is not installed.
+    """
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return _CODECS[candidate]()
+            except ImportError:
+                continue
+        return StdlibJSONCodec()
+    if name not in _CODECS:
+        raise ValueError(
+            f"Unknown JSON codec: {name}. Expected one of: auto, {', '.join(_CODECS)}."
+        )
+    try:
+        return _CODECS[name]()
+    except ImportError as e:
+        raise ImportError(
+            f"The '{name}' JSON codec requires the '{name}' package. "
+            f"Install it with `pip install {name}`."
+        ) from e